@@ -0,0 +1,23 @@
+-- Range lookup table for the protein length distribution
+-- Run once against an existing biocat database (after create_biocat_db.sql)
+--
+-- Joining against this table replaces the per-row CASE ladder in
+-- protein_length_distribution: the optimizer aggregates on a small
+-- integer sort key instead of a per-row materialized VARCHAR label.
+-- Buckets are half-open [lo, hi); the top bucket's hi is INT max.
+USE biocat;
+
+CREATE TABLE IF NOT EXISTS length_buckets (
+    lo INT NOT NULL,
+    hi INT NOT NULL,
+    label VARCHAR(32) NOT NULL,
+    sort_order INT NOT NULL,
+    PRIMARY KEY (lo, hi)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
+
+REPLACE INTO length_buckets (lo, hi, label, sort_order) VALUES
+    (0,    100,        'Very Short (<100 AA)',  1),
+    (100,  300,        'Short (100-299 AA)',    2),
+    (300,  600,        'Medium (300-599 AA)',   3),
+    (600,  1000,       'Long (600-999 AA)',     4),
+    (1000, 2147483647, 'Very Long (≥1000 AA)',  5);
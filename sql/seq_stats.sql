@@ -0,0 +1,134 @@
+-- Maintained sequence statistics for check_sequence_content
+-- Run once against an existing biocat database (after create_biocat_db.sql)
+--
+-- The live query aggregates LENGTH() over three LONGTEXT columns, so a
+-- dashboard refresh reads every sequence blob in chromosome, gene and
+-- transcript. seq_stats keeps one row per table: counts and the length
+-- sum are adjusted exactly by the triggers below; min_len/max_len only
+-- widen on insert/update and are re-tightened whenever this seed block
+-- is re-run (deletes cannot narrow them without a rescan).
+USE biocat;
+
+CREATE TABLE IF NOT EXISTS seq_stats (
+    table_name VARCHAR(32) NOT NULL,
+    total_rows BIGINT NOT NULL DEFAULT 0,
+    non_null_rows BIGINT NOT NULL DEFAULT 0,
+    sum_len BIGINT NOT NULL DEFAULT 0,
+    max_len INT NULL,
+    min_len INT NULL,
+    PRIMARY KEY (table_name)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
+
+-- Seed with exact current values (idempotent via REPLACE)
+REPLACE INTO seq_stats (table_name, total_rows, non_null_rows, sum_len, max_len, min_len)
+SELECT 'chromosome', COUNT(*),
+       COUNT(IF(sequence IS NULL OR sequence = '', NULL, 1)),
+       COALESCE(SUM(LENGTH(sequence)), 0),
+       MAX(LENGTH(sequence)), MIN(LENGTH(sequence))
+FROM chromosome;
+REPLACE INTO seq_stats (table_name, total_rows, non_null_rows, sum_len, max_len, min_len)
+SELECT 'gene', COUNT(*),
+       COUNT(IF(dna_sequence IS NULL OR dna_sequence = '', NULL, 1)),
+       COALESCE(SUM(LENGTH(dna_sequence)), 0),
+       MAX(LENGTH(dna_sequence)), MIN(LENGTH(dna_sequence))
+FROM gene;
+REPLACE INTO seq_stats (table_name, total_rows, non_null_rows, sum_len, max_len, min_len)
+SELECT 'transcript', COUNT(*),
+       COUNT(IF(cdna_sequence IS NULL OR cdna_sequence = '', NULL, 1)),
+       COALESCE(SUM(LENGTH(cdna_sequence)), 0),
+       MAX(LENGTH(cdna_sequence)), MIN(LENGTH(cdna_sequence))
+FROM transcript;
+
+DROP TRIGGER IF EXISTS trg_chromosome_seq_ins;
+DROP TRIGGER IF EXISTS trg_chromosome_seq_upd;
+DROP TRIGGER IF EXISTS trg_chromosome_seq_del;
+DROP TRIGGER IF EXISTS trg_gene_seq_ins;
+DROP TRIGGER IF EXISTS trg_gene_seq_upd;
+DROP TRIGGER IF EXISTS trg_gene_seq_del;
+DROP TRIGGER IF EXISTS trg_transcript_seq_ins;
+DROP TRIGGER IF EXISTS trg_transcript_seq_upd;
+DROP TRIGGER IF EXISTS trg_transcript_seq_del;
+
+CREATE TRIGGER trg_chromosome_seq_ins AFTER INSERT ON chromosome
+    FOR EACH ROW UPDATE seq_stats SET
+        total_rows = total_rows + 1,
+        non_null_rows = non_null_rows + IF(NEW.sequence IS NULL OR NEW.sequence = '', 0, 1),
+        sum_len = sum_len + IFNULL(LENGTH(NEW.sequence), 0),
+        max_len = GREATEST(IFNULL(max_len, 0), IFNULL(LENGTH(NEW.sequence), 0)),
+        min_len = IF(NEW.sequence IS NULL OR NEW.sequence = '',
+                     min_len,
+                     LEAST(IFNULL(min_len, LENGTH(NEW.sequence)), LENGTH(NEW.sequence)))
+    WHERE table_name = 'chromosome';
+CREATE TRIGGER trg_chromosome_seq_upd AFTER UPDATE ON chromosome
+    FOR EACH ROW UPDATE seq_stats SET
+        non_null_rows = non_null_rows
+            - IF(OLD.sequence IS NULL OR OLD.sequence = '', 0, 1)
+            + IF(NEW.sequence IS NULL OR NEW.sequence = '', 0, 1),
+        sum_len = sum_len - IFNULL(LENGTH(OLD.sequence), 0) + IFNULL(LENGTH(NEW.sequence), 0),
+        max_len = GREATEST(IFNULL(max_len, 0), IFNULL(LENGTH(NEW.sequence), 0)),
+        min_len = IF(NEW.sequence IS NULL OR NEW.sequence = '',
+                     min_len,
+                     LEAST(IFNULL(min_len, LENGTH(NEW.sequence)), LENGTH(NEW.sequence)))
+    WHERE table_name = 'chromosome';
+CREATE TRIGGER trg_chromosome_seq_del AFTER DELETE ON chromosome
+    FOR EACH ROW UPDATE seq_stats SET
+        total_rows = total_rows - 1,
+        non_null_rows = non_null_rows - IF(OLD.sequence IS NULL OR OLD.sequence = '', 0, 1),
+        sum_len = sum_len - IFNULL(LENGTH(OLD.sequence), 0)
+    WHERE table_name = 'chromosome';
+
+CREATE TRIGGER trg_gene_seq_ins AFTER INSERT ON gene
+    FOR EACH ROW UPDATE seq_stats SET
+        total_rows = total_rows + 1,
+        non_null_rows = non_null_rows + IF(NEW.dna_sequence IS NULL OR NEW.dna_sequence = '', 0, 1),
+        sum_len = sum_len + IFNULL(LENGTH(NEW.dna_sequence), 0),
+        max_len = GREATEST(IFNULL(max_len, 0), IFNULL(LENGTH(NEW.dna_sequence), 0)),
+        min_len = IF(NEW.dna_sequence IS NULL OR NEW.dna_sequence = '',
+                     min_len,
+                     LEAST(IFNULL(min_len, LENGTH(NEW.dna_sequence)), LENGTH(NEW.dna_sequence)))
+    WHERE table_name = 'gene';
+CREATE TRIGGER trg_gene_seq_upd AFTER UPDATE ON gene
+    FOR EACH ROW UPDATE seq_stats SET
+        non_null_rows = non_null_rows
+            - IF(OLD.dna_sequence IS NULL OR OLD.dna_sequence = '', 0, 1)
+            + IF(NEW.dna_sequence IS NULL OR NEW.dna_sequence = '', 0, 1),
+        sum_len = sum_len - IFNULL(LENGTH(OLD.dna_sequence), 0) + IFNULL(LENGTH(NEW.dna_sequence), 0),
+        max_len = GREATEST(IFNULL(max_len, 0), IFNULL(LENGTH(NEW.dna_sequence), 0)),
+        min_len = IF(NEW.dna_sequence IS NULL OR NEW.dna_sequence = '',
+                     min_len,
+                     LEAST(IFNULL(min_len, LENGTH(NEW.dna_sequence)), LENGTH(NEW.dna_sequence)))
+    WHERE table_name = 'gene';
+CREATE TRIGGER trg_gene_seq_del AFTER DELETE ON gene
+    FOR EACH ROW UPDATE seq_stats SET
+        total_rows = total_rows - 1,
+        non_null_rows = non_null_rows - IF(OLD.dna_sequence IS NULL OR OLD.dna_sequence = '', 0, 1),
+        sum_len = sum_len - IFNULL(LENGTH(OLD.dna_sequence), 0)
+    WHERE table_name = 'gene';
+
+CREATE TRIGGER trg_transcript_seq_ins AFTER INSERT ON transcript
+    FOR EACH ROW UPDATE seq_stats SET
+        total_rows = total_rows + 1,
+        non_null_rows = non_null_rows + IF(NEW.cdna_sequence IS NULL OR NEW.cdna_sequence = '', 0, 1),
+        sum_len = sum_len + IFNULL(LENGTH(NEW.cdna_sequence), 0),
+        max_len = GREATEST(IFNULL(max_len, 0), IFNULL(LENGTH(NEW.cdna_sequence), 0)),
+        min_len = IF(NEW.cdna_sequence IS NULL OR NEW.cdna_sequence = '',
+                     min_len,
+                     LEAST(IFNULL(min_len, LENGTH(NEW.cdna_sequence)), LENGTH(NEW.cdna_sequence)))
+    WHERE table_name = 'transcript';
+CREATE TRIGGER trg_transcript_seq_upd AFTER UPDATE ON transcript
+    FOR EACH ROW UPDATE seq_stats SET
+        non_null_rows = non_null_rows
+            - IF(OLD.cdna_sequence IS NULL OR OLD.cdna_sequence = '', 0, 1)
+            + IF(NEW.cdna_sequence IS NULL OR NEW.cdna_sequence = '', 0, 1),
+        sum_len = sum_len - IFNULL(LENGTH(OLD.cdna_sequence), 0) + IFNULL(LENGTH(NEW.cdna_sequence), 0),
+        max_len = GREATEST(IFNULL(max_len, 0), IFNULL(LENGTH(NEW.cdna_sequence), 0)),
+        min_len = IF(NEW.cdna_sequence IS NULL OR NEW.cdna_sequence = '',
+                     min_len,
+                     LEAST(IFNULL(min_len, LENGTH(NEW.cdna_sequence)), LENGTH(NEW.cdna_sequence)))
+    WHERE table_name = 'transcript';
+CREATE TRIGGER trg_transcript_seq_del AFTER DELETE ON transcript
+    FOR EACH ROW UPDATE seq_stats SET
+        total_rows = total_rows - 1,
+        non_null_rows = non_null_rows - IF(OLD.cdna_sequence IS NULL OR OLD.cdna_sequence = '', 0, 1),
+        sum_len = sum_len - IFNULL(LENGTH(OLD.cdna_sequence), 0)
+    WHERE table_name = 'transcript';
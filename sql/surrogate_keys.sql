@@ -0,0 +1,28 @@
+-- Integer surrogate key for the GO term join
+-- Run once against an existing biocat database (after create_biocat_db.sql)
+--
+-- gene, transcript and protein already join on INT UNSIGNED surrogate
+-- primary keys; the one remaining character join is gene_go_annotation
+-- -> gene_ontology on go_id VARCHAR(20). This adds a narrow go_num
+-- surrogate on both sides so that join compares 4-byte integers instead
+-- of collated strings, halving the secondary-index key size. The
+-- annotation queries in sql_queries.py join on go_num after this runs.
+USE biocat;
+
+ALTER TABLE gene_ontology
+    ADD COLUMN go_num INT UNSIGNED NOT NULL AUTO_INCREMENT,
+    ADD UNIQUE KEY uk_go_num (go_num);
+
+ALTER TABLE gene_go_annotation
+    ADD COLUMN go_num INT UNSIGNED NULL;
+
+UPDATE gene_go_annotation gga
+JOIN gene_ontology go ON gga.go_id = go.go_id
+SET gga.go_num = go.go_num;
+
+ALTER TABLE gene_go_annotation
+    MODIFY COLUMN go_num INT UNSIGNED NOT NULL,
+    ADD KEY idx_go_num (go_num),
+    ADD CONSTRAINT fk_gene_go_go_num
+        FOREIGN KEY (go_num) REFERENCES gene_ontology (go_num)
+        ON DELETE CASCADE ON UPDATE CASCADE;
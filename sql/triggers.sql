@@ -0,0 +1,82 @@
+-- Maintained record counts for the database_overview dashboard query
+-- Run once against an existing biocat database (after create_biocat_db.sql)
+--
+-- COUNT(*) on InnoDB walks the clustered index, so the seven-table
+-- UNION ALL overview scanned every tracked table per page load. The
+-- db_counts table keeps one row per tracked table, seeded here and kept
+-- current by per-table insert/delete triggers; the overview becomes a
+-- seven-row point lookup.
+USE biocat;
+
+CREATE TABLE IF NOT EXISTS db_counts (
+    table_name VARCHAR(32) NOT NULL,
+    record_count BIGINT NOT NULL DEFAULT 0,
+    PRIMARY KEY (table_name)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
+
+-- Seed with the current counts (idempotent via REPLACE)
+REPLACE INTO db_counts (table_name, record_count)
+SELECT 'Species', COUNT(*) FROM species;
+REPLACE INTO db_counts (table_name, record_count)
+SELECT 'Genes', COUNT(*) FROM gene;
+REPLACE INTO db_counts (table_name, record_count)
+SELECT 'Transcripts', COUNT(*) FROM transcript;
+REPLACE INTO db_counts (table_name, record_count)
+SELECT 'Proteins', COUNT(*) FROM protein;
+REPLACE INTO db_counts (table_name, record_count)
+SELECT 'Chromosomes', COUNT(*) FROM chromosome;
+REPLACE INTO db_counts (table_name, record_count)
+SELECT 'Genetic Variants', COUNT(*) FROM genetic_variant;
+REPLACE INTO db_counts (table_name, record_count)
+SELECT 'GO Annotations', COUNT(*) FROM gene_go_annotation;
+
+-- Keep the counters current on writes
+DROP TRIGGER IF EXISTS trg_species_count_ins;
+DROP TRIGGER IF EXISTS trg_species_count_del;
+DROP TRIGGER IF EXISTS trg_gene_count_ins;
+DROP TRIGGER IF EXISTS trg_gene_count_del;
+DROP TRIGGER IF EXISTS trg_transcript_count_ins;
+DROP TRIGGER IF EXISTS trg_transcript_count_del;
+DROP TRIGGER IF EXISTS trg_protein_count_ins;
+DROP TRIGGER IF EXISTS trg_protein_count_del;
+DROP TRIGGER IF EXISTS trg_chromosome_count_ins;
+DROP TRIGGER IF EXISTS trg_chromosome_count_del;
+DROP TRIGGER IF EXISTS trg_variant_count_ins;
+DROP TRIGGER IF EXISTS trg_variant_count_del;
+DROP TRIGGER IF EXISTS trg_gga_count_ins;
+DROP TRIGGER IF EXISTS trg_gga_count_del;
+
+CREATE TRIGGER trg_species_count_ins AFTER INSERT ON species
+    FOR EACH ROW UPDATE db_counts SET record_count = record_count + 1 WHERE table_name = 'Species';
+CREATE TRIGGER trg_species_count_del AFTER DELETE ON species
+    FOR EACH ROW UPDATE db_counts SET record_count = record_count - 1 WHERE table_name = 'Species';
+
+CREATE TRIGGER trg_gene_count_ins AFTER INSERT ON gene
+    FOR EACH ROW UPDATE db_counts SET record_count = record_count + 1 WHERE table_name = 'Genes';
+CREATE TRIGGER trg_gene_count_del AFTER DELETE ON gene
+    FOR EACH ROW UPDATE db_counts SET record_count = record_count - 1 WHERE table_name = 'Genes';
+
+CREATE TRIGGER trg_transcript_count_ins AFTER INSERT ON transcript
+    FOR EACH ROW UPDATE db_counts SET record_count = record_count + 1 WHERE table_name = 'Transcripts';
+CREATE TRIGGER trg_transcript_count_del AFTER DELETE ON transcript
+    FOR EACH ROW UPDATE db_counts SET record_count = record_count - 1 WHERE table_name = 'Transcripts';
+
+CREATE TRIGGER trg_protein_count_ins AFTER INSERT ON protein
+    FOR EACH ROW UPDATE db_counts SET record_count = record_count + 1 WHERE table_name = 'Proteins';
+CREATE TRIGGER trg_protein_count_del AFTER DELETE ON protein
+    FOR EACH ROW UPDATE db_counts SET record_count = record_count - 1 WHERE table_name = 'Proteins';
+
+CREATE TRIGGER trg_chromosome_count_ins AFTER INSERT ON chromosome
+    FOR EACH ROW UPDATE db_counts SET record_count = record_count + 1 WHERE table_name = 'Chromosomes';
+CREATE TRIGGER trg_chromosome_count_del AFTER DELETE ON chromosome
+    FOR EACH ROW UPDATE db_counts SET record_count = record_count - 1 WHERE table_name = 'Chromosomes';
+
+CREATE TRIGGER trg_variant_count_ins AFTER INSERT ON genetic_variant
+    FOR EACH ROW UPDATE db_counts SET record_count = record_count + 1 WHERE table_name = 'Genetic Variants';
+CREATE TRIGGER trg_variant_count_del AFTER DELETE ON genetic_variant
+    FOR EACH ROW UPDATE db_counts SET record_count = record_count - 1 WHERE table_name = 'Genetic Variants';
+
+CREATE TRIGGER trg_gga_count_ins AFTER INSERT ON gene_go_annotation
+    FOR EACH ROW UPDATE db_counts SET record_count = record_count + 1 WHERE table_name = 'GO Annotations';
+CREATE TRIGGER trg_gga_count_del AFTER DELETE ON gene_go_annotation
+    FOR EACH ROW UPDATE db_counts SET record_count = record_count - 1 WHERE table_name = 'GO Annotations';
@@ -0,0 +1,51 @@
+"""
+Boyer-Moore-Horspool Search for Biocat Interface
+Single-pattern DNA search with expected sublinear scans on long sequences
+"""
+
+from functools import lru_cache
+from typing import List, Tuple
+
+
+@lru_cache(maxsize=64)
+def _skip_table(pattern: bytes) -> Tuple[int, ...]:
+    """Build (and cache) the 256-entry bad-character skip table"""
+    skip = [len(pattern)] * 256
+    for i, byte in enumerate(pattern[:-1]):
+        skip[byte] = len(pattern) - 1 - i
+    return tuple(skip)
+
+
+def bmh_search_all(hay: bytes, pat: bytes) -> List[int]:
+    """
+    Find all (overlapping) occurrences of pat in hay
+
+    Uses the Horspool bad-character rule: mismatches shift by up to
+    len(pat) positions, so long patterns over the 4-letter DNA alphabet
+    skip most of the sequence instead of examining every byte.
+
+    Args:
+        hay: Sequence to scan
+        pat: Pattern to search for
+
+    Returns:
+        List of 0-based match positions
+    """
+    m = len(pat)
+    n = len(hay)
+    if m == 0 or n < m:
+        return []
+
+    skip = _skip_table(pat)
+    last = m - 1
+    pat_last = pat[last]
+    positions = []
+
+    i = 0
+    while i <= n - m:
+        tail = hay[i + last]
+        if tail == pat_last and hay[i : i + m] == pat:
+            positions.append(i)
+        i += skip[tail]
+
+    return positions
@@ -13,10 +13,14 @@ DB_CONFIG = {
     "charset": "utf8mb4",
     "use_unicode": True,
     "autocommit": True,
+    "compress": True,  # Compress wire protocol; big win for sequence columns
     "ssl_disabled": True,  # Set to False if using SSL
     "connect_timeout": 30,
     "read_timeout": 30,
     "write_timeout": 30,
+    "pool_name": "biocat_pool",  # Remove the pool_* keys to disable pooling
+    "pool_size": 10,
+    "pool_reset_session": True,
 }
 
 # Alternative configuration for remote database
@@ -1,692 +1,1634 @@
-"""
-Database Connection Module for Biocat Interface
-Handles MySQL database connections and query execution
-"""
-
-import mysql.connector
-from mysql.connector import Error
-import pandas as pd
-import logging
-from typing import Optional, Dict, Any, List, Tuple
-from contextlib import contextmanager
-
-
-class BiocatDatabase:
-    """Database connection handler for the Biocat biological database"""
-
-    def __init__(self, config: Optional[Dict[str, Any]] = None):
-        """
-        Initialize database connection with configuration
-
-        Args:
-            config: Database configuration dictionary with keys:
-                   host, port, user, password, database
-        """
-        self.config = config or {
-            "host": "localhost",
-            "port": 3306,
-            "user": "root",
-            "password": "",
-            "database": "biocat",
-            "charset": "utf8mb4",
-            "use_unicode": True,
-            "autocommit": True,
-        }
-        self.connection = None
-        self._setup_logging()
-
-    def _setup_logging(self):
-        """Setup logging for database operations"""
-        logging.basicConfig(
-            level=logging.INFO,
-            format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-        )
-        self.logger = logging.getLogger(__name__)
-
-    def connect(self) -> bool:
-        """
-        Establish database connection
-
-        Returns:
-            bool: True if connection successful, False otherwise
-        """
-        try:
-            if self.connection and self.connection.is_connected():
-                return True
-
-            self.connection = mysql.connector.connect(**self.config)
-
-            if self.connection.is_connected():
-                self.logger.info("Successfully connected to Biocat database")
-                return True
-            else:
-                self.logger.error("Failed to connect to database")
-                return False
-
-        except Error as e:
-            self.logger.error(f"Database connection error: {e}")
-            self.connection = None
-            return False
-
-    def disconnect(self):
-        """Close database connection"""
-        if self.connection and self.connection.is_connected():
-            self.connection.close()
-            self.logger.info("Database connection closed")
-
-    def is_connected(self) -> bool:
-        """Check if database connection is active"""
-        return self.connection and self.connection.is_connected()
-
-    @contextmanager
-    def get_cursor(self):
-        """Context manager for database cursor"""
-        cursor = None
-        try:
-            if not self.is_connected():
-                if not self.connect():
-                    raise Error("Could not establish database connection")
-
-            cursor = self.connection.cursor(dictionary=True)
-            yield cursor
-
-        except Error as e:
-            self.logger.error(f"Cursor error: {e}")
-            if cursor:
-                cursor.close()
-            raise
-        finally:
-            if cursor:
-                cursor.close()
-
-    def execute_query(
-        self, query: str, params: Optional[Tuple] = None, fetch_all: bool = True
-    ) -> Optional[List[Dict]]:
-        """
-        Execute a SELECT query and return results
-
-        Args:
-            query: SQL query string
-            params: Query parameters tuple
-            fetch_all: Whether to fetch all results or just one
-
-        Returns:
-            List of dictionaries containing query results, or None if error
-        """
-        try:
-            with self.get_cursor() as cursor:
-                cursor.execute(query, params or ())
-
-                if fetch_all:
-                    results = cursor.fetchall()
-                else:
-                    results = cursor.fetchone()
-                    results = [results] if results else []
-
-                self.logger.info(
-                    f"Query executed successfully, returned {len(results)} rows"
-                )
-                return results
-
-        except Error as e:
-            self.logger.error(f"Query execution error: {e}")
-            self.logger.error(f"Query: {query}")
-            if params:
-                self.logger.error(f"Parameters: {params}")
-            return None
-
-    def execute_query_df(
-        self, query: str, params: Optional[Tuple] = None
-    ) -> Optional[pd.DataFrame]:
-        """
-        Execute query and return results as pandas DataFrame
-
-        Args:
-            query: SQL query string
-            params: Query parameters tuple
-
-        Returns:
-            pandas DataFrame with query results, or None if error
-        """
-        try:
-            results = self.execute_query(query, params)
-            if results is not None:
-                df = pd.DataFrame(results)
-                self.logger.info(f"DataFrame created with shape: {df.shape}")
-                return df
-            return None
-
-        except Exception as e:
-            self.logger.error(f"DataFrame creation error: {e}")
-            return None
-
-    def execute_update(self, query: str, params: Optional[Tuple] = None) -> bool:
-        """
-        Execute an UPDATE, INSERT, or DELETE query
-
-        Args:
-            query: SQL query string
-            params: Query parameters tuple
-
-        Returns:
-            bool: True if successful, False otherwise
-        """
-        try:
-            with self.get_cursor() as cursor:
-                cursor.execute(query, params or ())
-                self.connection.commit()
-
-                affected_rows = cursor.rowcount
-                self.logger.info(
-                    f"Update executed successfully, affected {affected_rows} rows"
-                )
-                return True
-
-        except Error as e:
-            self.logger.error(f"Update execution error: {e}")
-            if self.connection:
-                self.connection.rollback()
-            return False
-
-    def get_table_info(self, table_name: str) -> Optional[pd.DataFrame]:
-        """
-        Get information about a table structure
-
-        Args:
-            table_name: Name of the table
-
-        Returns:
-            DataFrame with table structure information
-        """
-        query = f"DESCRIBE {table_name}"
-        return self.execute_query_df(query)
-
-    def get_table_names(self) -> List[str]:
-        """
-        Get list of all table names in the database
-
-        Returns:
-            List of table names
-        """
-        query = "SHOW TABLES"
-        results = self.execute_query(query)
-
-        if results:
-            # Extract table names from the results
-            table_key = f"Tables_in_{self.config['database']}"
-            return [row[table_key] for row in results]
-        return []
-
-    def get_row_count(self, table_name: str) -> int:
-        """
-        Get number of rows in a table
-
-        Args:
-            table_name: Name of the table
-
-        Returns:
-            Number of rows in the table
-        """
-        query = f"SELECT COUNT(*) as count FROM {table_name}"
-        result = self.execute_query(query, fetch_all=False)
-
-        if result and len(result) > 0:
-            return result[0]["count"]
-        return 0
-
-    def test_connection(self) -> Dict[str, Any]:
-        """
-        Test database connection and return status information
-
-        Returns:
-            Dictionary with connection status and database information
-        """
-        status = {
-            "connected": False,
-            "database_name": None,
-            "server_version": None,
-            "tables": [],
-            "error": None,
-        }
-
-        try:
-            if self.connect():
-                status["connected"] = True
-                status["database_name"] = self.config["database"]
-
-                with self.get_cursor() as cursor:
-                    cursor.execute("SELECT VERSION() as version")
-                    version_result = cursor.fetchone()
-                    if version_result:
-                        status["server_version"] = version_result["version"]
-
-                status["tables"] = self.get_table_names()
-
-        except Exception as e:
-            status["error"] = str(e)
-            self.logger.error(f"Connection test failed: {e}")
-
-        return status
-
-    def get_database_stats(self) -> Optional[pd.DataFrame]:
-        """
-        Get basic statistics about the database
-
-        Returns:
-            DataFrame with database statistics
-        """
-        query = """
-        SELECT
-            'Species' as table_name, COUNT(*) as record_count
-        FROM species
-        UNION ALL
-        SELECT 'Genes', COUNT(*) FROM gene
-        UNION ALL
-        SELECT 'Transcripts', COUNT(*) FROM transcript
-        UNION ALL
-        SELECT 'Proteins', COUNT(*) FROM protein
-        UNION ALL
-        SELECT 'Chromosomes', COUNT(*) FROM chromosome
-        UNION ALL
-        SELECT 'Genetic Variants', COUNT(*) FROM genetic_variant
-        UNION ALL
-        SELECT 'GO Annotations', COUNT(*) FROM gene_go_annotation
-        ORDER BY record_count DESC;
-        """
-
-        return self.execute_query_df(query)
-
-    def search_genes(self, search_term: str, limit: int = 50) -> Optional[pd.DataFrame]:
-        """
-        Search for genes by symbol, name, or description
-
-        Args:
-            search_term: Term to search for
-            limit: Maximum number of results to return
-
-        Returns:
-            DataFrame with matching genes
-        """
-        search_pattern = f"%{search_term}%"
-        query = """
-        SELECT
-            s.species_name,
-            g.gene_symbol,
-            g.gene_name,
-            g.gene_description,
-            g.gene_biotype,
-            c.chromosome_name,
-            g.start_position,
-            g.end_position,
-            (g.end_position - g.start_position + 1) as gene_length
-        FROM gene g
-        JOIN species s ON g.species_id = s.species_id
-        LEFT JOIN chromosome c ON g.chromosome_id = c.chromosome_id
-        WHERE (g.gene_symbol LIKE %s OR g.gene_name LIKE %s OR g.gene_description LIKE %s)
-        ORDER BY s.species_name, g.gene_symbol
-        LIMIT %s
-        """
-
-        return self.execute_query_df(
-            query, (search_pattern, search_pattern, search_pattern, limit)
-        )
-
-    def get_protein_sequence(self, protein_id: str) -> Optional[str]:
-        """
-        Get protein sequence by protein stable ID
-
-        Args:
-            protein_id: Protein stable ID
-
-        Returns:
-            Protein sequence string or None if not found
-        """
-        query = """
-        SELECT protein_sequence
-        FROM protein
-        WHERE protein_stable_id = %s
-        """
-
-        result = self.execute_query(query, (protein_id,), fetch_all=False)
-        if result and len(result) > 0:
-            return result[0]["protein_sequence"]
-        return None
-
-    def check_dna_sequence_availability(self) -> Dict[str, Any]:
-        """
-        Check what DNA sequence data is available in the database
-
-        Returns:
-            Dictionary with information about DNA sequence availability
-        """
-        if not self.is_connected():
-            return {"error": "Not connected to database"}
-
-        try:
-            results = {}
-
-            # Check for sequence columns in various tables
-            sequence_checks = [
-                ("chromosome", "sequence", "Chromosome sequences"),
-                ("gene", "dna_sequence", "Gene DNA sequences"),
-                ("transcript", "cdna_sequence", "cDNA sequences"),
-                ("transcript", "dna_sequence", "Transcript DNA sequences"),
-                ("protein", "protein_sequence", "Protein sequences (amino acids)"),
-                ("exon", "sequence", "Exon sequences"),
-                ("intron", "sequence", "Intron sequences"),
-            ]
-
-            for table, column, description in sequence_checks:
-                query = f"""
-                    SELECT COUNT(*) as total_count,
-                           COUNT({column}) as sequence_count,
-                           ROUND(AVG(LENGTH({column})), 0) as avg_length
-                    FROM {table}
-                    WHERE {column} IS NOT NULL AND {column} != ''
-                """
-
-                try:
-                    result = self.execute_query(query)
-                    if result and len(result) > 0:
-                        row = result[0]
-                        if row["sequence_count"] > 0:
-                            results[f"{table}.{column}"] = {
-                                "description": description,
-                                "table": table,
-                                "column": column,
-                                "sequence_count": row["sequence_count"],
-                                "avg_length": row["avg_length"],
-                            }
-                except Exception as e:
-                    # Column doesn't exist, skip it
-                    continue
-
-            # Check for any other potential sequence columns
-            for table in [
-                "chromosome",
-                "gene",
-                "transcript",
-                "protein",
-                "exon",
-                "intron",
-            ]:
-                try:
-                    info_query = f"DESCRIBE {table}"
-                    columns = self.execute_query(info_query)
-                    if columns:
-                        for col_info in columns:
-                            col_name = col_info["Field"].lower()
-                            if (
-                                "seq" in col_name
-                                or "dna" in col_name
-                                or "rna" in col_name
-                            ) and col_name not in [
-                                item["column"] for item in results.values()
-                            ]:
-                                # Check if this column has data
-                                check_query = f"SELECT COUNT(*) as count FROM {table} WHERE {col_info['Field']} IS NOT NULL AND {col_info['Field']} != ''"
-                                check_result = self.execute_query(check_query)
-                                if check_result and check_result[0]["count"] > 0:
-                                    results[f"{table}.{col_info['Field']}"] = {
-                                        "description": f"{table.title()} {col_info['Field']}",
-                                        "table": table,
-                                        "column": col_info["Field"],
-                                        "sequence_count": check_result[0]["count"],
-                                        "avg_length": None,
-                                    }
-                except Exception:
-                    continue
-
-            return {"available_sequences": results, "total_sources": len(results)}
-
-        except Exception as e:
-            return {"error": f"Failed to check sequence availability: {str(e)}"}
-
-    def get_dna_sequences(
-        self,
-        source_table: str,
-        source_column: str,
-        limit: int = 50,
-        min_length: int = 10,
-    ) -> Optional[pd.DataFrame]:
-        """
-        Fetch DNA sequences from the specified table and column
-
-        Args:
-            source_table: Table name containing sequences
-            source_column: Column name containing sequences
-            limit: Maximum number of sequences to fetch
-            min_length: Minimum sequence length to include
-
-        Returns:
-            DataFrame with sequences and metadata
-        """
-        if not self.is_connected():
-            return None
-
-        try:
-            # Build the query based on the table
-            if source_table == "chromosome":
-                query = f"""
-                    SELECT
-                        c.chromosome_id,
-                        c.chromosome_name,
-                        s.species_name,
-                        c.sequence_length,
-                        LEFT(c.{source_column}, 1000) as sequence_preview,
-                        c.{source_column} as full_sequence
-                    FROM chromosome c
-                    JOIN genome_assembly ga ON c.assembly_id = ga.assembly_id
-                    JOIN species s ON ga.species_id = s.species_id
-                    WHERE c.{source_column} IS NOT NULL
-                    AND LENGTH(c.{source_column}) >= {min_length}
-                    ORDER BY c.sequence_length DESC
-                    LIMIT {limit}
-                """
-            elif source_table == "gene":
-                query = f"""
-                    SELECT
-                        g.gene_id,
-                        g.gene_symbol,
-                        g.gene_name,
-                        s.species_name,
-                        c.chromosome_name,
-                        LENGTH(g.{source_column}) as sequence_length,
-                        LEFT(g.{source_column}, 1000) as sequence_preview,
-                        g.{source_column} as full_sequence
-                    FROM gene g
-                    JOIN species s ON g.species_id = s.species_id
-                    LEFT JOIN chromosome c ON g.chromosome_id = c.chromosome_id
-                    WHERE g.{source_column} IS NOT NULL
-                    AND LENGTH(g.{source_column}) >= {min_length}
-                    ORDER BY LENGTH(g.{source_column}) DESC
-                    LIMIT {limit}
-                """
-            elif source_table == "transcript":
-                query = f"""
-                    SELECT
-                        t.transcript_id,
-                        t.transcript_stable_id,
-                        g.gene_symbol,
-                        g.gene_name,
-                        s.species_name,
-                        LENGTH(t.{source_column}) as sequence_length,
-                        LEFT(t.{source_column}, 1000) as sequence_preview,
-                        t.{source_column} as full_sequence
-                    FROM transcript t
-                    JOIN gene g ON t.gene_id = g.gene_id
-                    JOIN species s ON g.species_id = s.species_id
-                    WHERE t.{source_column} IS NOT NULL
-                    AND LENGTH(t.{source_column}) >= {min_length}
-                    ORDER BY LENGTH(t.{source_column}) DESC
-                    LIMIT {limit}
-                """
-            else:
-                # Generic query for other tables
-                query = f"""
-                    SELECT
-                        *,
-                        LENGTH({source_column}) as sequence_length,
-                        LEFT({source_column}, 1000) as sequence_preview,
-                        {source_column} as full_sequence
-                    FROM {source_table}
-                    WHERE {source_column} IS NOT NULL
-                    AND LENGTH({source_column}) >= {min_length}
-                    ORDER BY LENGTH({source_column}) DESC
-                    LIMIT {limit}
-                """
-
-            return self.execute_query_df(query)
-
-        except Exception as e:
-            self.logger.error(f"Failed to fetch DNA sequences: {str(e)}")
-            return None
-
-    def get_random_dna_sequences(
-        self, source_table: str, source_column: str, count: int = 10
-    ) -> Optional[List[str]]:
-        """
-        Get random DNA sequences from the database for analysis
-
-        Args:
-            source_table: Table containing sequences
-            source_column: Column containing sequences
-            count: Number of sequences to return
-
-        Returns:
-            List of DNA sequence strings
-        """
-        if not self.is_connected():
-            return None
-
-        try:
-            query = f"""
-                SELECT {source_column} as sequence
-                FROM {source_table}
-                WHERE {source_column} IS NOT NULL
-                AND LENGTH({source_column}) >= 20
-                AND LENGTH({source_column}) <= 5000
-                ORDER BY RAND()
-                LIMIT {count}
-            """
-
-            result = self.execute_query(query)
-            if result:
-                return [row["sequence"] for row in result if row["sequence"]]
-            return []
-
-        except Exception as e:
-            self.logger.error(f"Failed to fetch random DNA sequences: {str(e)}")
-            return None
-
-    def search_sequences_by_pattern(
-        self, pattern: str, source_table: str, source_column: str, limit: int = 20
-    ) -> Optional[pd.DataFrame]:
-        """
-        Search for sequences containing a specific pattern
-
-        Args:
-            pattern: DNA pattern to search for (e.g., "ATCG")
-            source_table: Table to search in
-            source_column: Column containing sequences
-            limit: Maximum results to return
-
-        Returns:
-            DataFrame with matching sequences
-        """
-        if not self.is_connected():
-            return None
-
-        try:
-            # Clean the pattern to only include valid DNA bases
-            import re
-
-            clean_pattern = re.sub(r"[^ATCG]", "", pattern.upper())
-
-            if len(clean_pattern) < 3:
-                return None
-
-            if source_table == "gene":
-                query = f"""
-                    SELECT
-                        g.gene_symbol,
-                        g.gene_name,
-                        s.species_name,
-                        LENGTH(g.{source_column}) as sequence_length,
-                        LOCATE('{clean_pattern}', g.{source_column}) as pattern_position,
-                        LEFT(g.{source_column}, 500) as sequence_preview
-                    FROM gene g
-                    JOIN species s ON g.species_id = s.species_id
-                    WHERE g.{source_column} LIKE '%{clean_pattern}%'
-                    ORDER BY sequence_length DESC
-                    LIMIT {limit}
-                """
-            elif source_table == "transcript":
-                query = f"""
-                    SELECT
-                        t.transcript_stable_id,
-                        g.gene_symbol,
-                        s.species_name,
-                        LENGTH(t.{source_column}) as sequence_length,
-                        LOCATE('{clean_pattern}', t.{source_column}) as pattern_position,
-                        LEFT(t.{source_column}, 500) as sequence_preview
-                    FROM transcript t
-                    JOIN gene g ON t.gene_id = g.gene_id
-                    JOIN species s ON g.species_id = s.species_id
-                    WHERE t.{source_column} LIKE '%{clean_pattern}%'
-                    ORDER BY sequence_length DESC
-                    LIMIT {limit}
-                """
-            else:
-                query = f"""
-                    SELECT
-                        *,
-                        LENGTH({source_column}) as sequence_length,
-                        LOCATE('{clean_pattern}', {source_column}) as pattern_position,
-                        LEFT({source_column}, 500) as sequence_preview
-                    FROM {source_table}
-                    WHERE {source_column} LIKE '%{clean_pattern}%'
-                    ORDER BY LENGTH({source_column}) DESC
-                    LIMIT {limit}
-                """
-
-            return self.execute_query_df(query)
-
-        except Exception as e:
-            self.logger.error(f"Failed to search sequences: {str(e)}")
-            return None
-
-    def __enter__(self):
-        """Context manager entry"""
-        self.connect()
-        return self
-
-    def __exit__(self, exc_type, exc_val, exc_tb):
-        """Context manager exit"""
-        self.disconnect()
-
-
-def get_database_connection(config: Optional[Dict[str, Any]] = None) -> BiocatDatabase:
-    """
-    Get a database connection instance
-
-    Args:
-        config: Optional database configuration
-
-    Returns:
-        BiocatDatabase instance
-    """
-    if config:
-        return BiocatDatabase(config)
-    return BiocatDatabase()
-
-
-def test_database_connection() -> Dict[str, Any]:
-    """
-    Test the default database connection
-
-    Returns:
-        Dictionary with connection test results
-    """
-    db = BiocatDatabase()
-    return db.test_connection()
+"""
+Database Connection Module for Biocat Interface
+Handles MySQL database connections and query execution
+"""
+
+import mysql.connector
+from mysql.connector import Error, FieldType, errorcode, pooling
+from mysql.connector.constants import ClientFlag
+import pandas as pd
+import logging
+import random
+import re
+import time
+from typing import Optional, Dict, Any, List, Tuple, Union
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+
+# Arrow-backed DataFrames avoid one Python str object per cell for large
+# sequence result sets; plain pandas construction is the fallback
+try:
+    import pyarrow as pa
+
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+# connectorx parses MySQL's binary protocol in Rust and hands back
+# columnar buffers directly, skipping the connector's per-row Python
+# decode loop; opt in with "use_connectorx": True in the config
+try:
+    import connectorx as cx
+
+    CONNECTORX_AVAILABLE = True
+except ImportError:
+    CONNECTORX_AVAILABLE = False
+
+
+# Upper bound on cached prepared cursors per connection
+_PREPARED_CACHE_SIZE = 64
+
+# Seconds a cached COUNT(*) result stays fresh
+_ROW_COUNT_TTL = 60.0
+
+# Config keys consumed by this module, never passed to the driver
+_NON_CONNECTOR_KEYS = frozenset({"use_connectorx"})
+
+# Session tuning for the read-mostly dashboard workload: bigger join,
+# sort and in-memory temp-table buffers keep the aggregation-heavy
+# catalog queries off disk, and READ UNCOMMITTED skips MVCC snapshot
+# bookkeeping the dashboard does not need (stale reads are fine for
+# charts). One combined statement keeps it to a single round-trip;
+# innodb_buffer_pool_size is a server startup variable and cannot be
+# tuned here.
+_SESSION_TUNING = (
+    "SET SESSION join_buffer_size = 16777216, "
+    "sort_buffer_size = 8388608, "
+    "tmp_table_size = 268435456, "
+    "max_heap_table_size = 268435456, "
+    "transaction_isolation = 'READ-UNCOMMITTED'"
+)
+
+# Identifiers interpolated into SQL must look like plain MySQL names;
+# anything else is rejected before it reaches an f-string. Keeping the
+# accepted set small also keeps the generated SQL text stable per
+# (table, column), which is what lets the prepared-statement cache hit.
+_IDENTIFIER_RE = re.compile(r"[A-Za-z_][A-Za-z0-9_]*\Z")
+
+
+def _valid_identifier(name: str) -> bool:
+    """Return True when name is safe to interpolate as a SQL identifier"""
+    return bool(name) and _IDENTIFIER_RE.match(name) is not None
+
+
+# Boolean-mode fulltext operators stripped from user search terms so a
+# typed '-', '*' or dangling '"' cannot produce a syntax error that
+# looks like a missing index
+_FT_OPERATOR_RE = re.compile(r'[+\-><()~*"@]')
+
+# Tables scanned for sequence data, with friendly names for the columns
+# we know about; anything else discovered falls back to "Table column"
+_SEQUENCE_TABLES = (
+    "chromosome",
+    "gene",
+    "transcript",
+    "protein",
+    "exon",
+    "intron",
+)
+_SEQUENCE_DESCRIPTIONS = {
+    ("chromosome", "sequence"): "Chromosome sequences",
+    ("gene", "dna_sequence"): "Gene DNA sequences",
+    ("transcript", "cdna_sequence"): "cDNA sequences",
+    ("transcript", "dna_sequence"): "Transcript DNA sequences",
+    ("protein", "protein_sequence"): "Protein sequences (amino acids)",
+    ("exon", "sequence"): "Exon sequences",
+    ("intron", "sequence"): "Intron sequences",
+}
+
+
+# MySQL field-type codes mapped to explicit pandas dtypes, so numeric
+# columns skip object-dtype inference on the from_records fallback path;
+# nullable Int64 keeps NULL-bearing integer columns out of float
+_FIELDTYPE_DTYPES = {}
+for _name in ("TINY", "SHORT", "INT24", "LONG", "LONGLONG", "YEAR"):
+    _FIELDTYPE_DTYPES[getattr(FieldType, _name)] = "Int64"
+for _name in ("FLOAT", "DOUBLE", "DECIMAL", "NEWDECIMAL"):
+    _FIELDTYPE_DTYPES[getattr(FieldType, _name)] = "float64"
+del _name
+
+
+def _rows_to_df(rows: List[Dict]) -> pd.DataFrame:
+    """Build a DataFrame from dict rows, Arrow-backed when pyarrow is present"""
+    if PYARROW_AVAILABLE and rows:
+        return pa.Table.from_pylist(rows).to_pandas(types_mapper=pd.ArrowDtype)
+    return pd.DataFrame(rows)
+
+
+def _records_to_df(
+    rows: List[Tuple], columns: List[str], description: Optional[List] = None
+) -> pd.DataFrame:
+    """
+    Build a DataFrame from tuple rows plus column names
+
+    Tuple cursors skip the per-row dict boxing of dictionary cursors, so
+    the DataFrame path never materializes one dict per row. When the
+    cursor description is given, its MySQL field-type codes pin numeric
+    columns to explicit dtypes instead of leaving from_records to infer
+    object columns.
+    """
+    if not rows:
+        return pd.DataFrame(columns=columns)
+    if PYARROW_AVAILABLE:
+        arrays = [pa.array(column) for column in zip(*rows)]
+        return pa.Table.from_arrays(arrays, names=columns).to_pandas(
+            types_mapper=pd.ArrowDtype
+        )
+    df = pd.DataFrame.from_records(rows, columns=columns)
+    if description:
+        dtypes = {
+            desc[0]: _FIELDTYPE_DTYPES[desc[1]]
+            for desc in description
+            if desc[1] in _FIELDTYPE_DTYPES
+        }
+        if dtypes:
+            try:
+                df = df.astype(dtypes)
+            except (TypeError, ValueError):
+                # Driver-reported type didn't match the values (e.g. a
+                # casted expression); keep the inferred dtypes
+                pass
+    return df
+
+
+class BiocatDatabase:
+    """Database connection handler for the Biocat biological database"""
+
+    def __init__(self, config: Optional[Dict[str, Any]] = None):
+        """
+        Initialize database connection with configuration
+
+        Args:
+            config: Database configuration dictionary with keys:
+                   host, port, user, password, database
+        """
+        self.config = config or {
+            "host": "localhost",
+            "port": 3306,
+            "user": "root",
+            "password": "",
+            "database": "biocat",
+            "charset": "utf8mb4",
+            "use_unicode": True,
+            "autocommit": True,
+            # DNA text (~2 bits/base entropy) compresses 3-5x, so the
+            # compressed protocol turns multi-MB sequence fetches from
+            # bandwidth-bound into cheap client-side decompression
+            "compress": True,
+        }
+        self.connection = None
+        self._pool = None
+        # Prepared cursors cached per SQL text (LRU-bounded); statements
+        # stay prepared on the server so repeated calls skip parse/plan
+        self._prepared_cursors: "OrderedDict[str, Any]" = OrderedDict()
+        # Schema metadata is stable and row counts change slowly; both
+        # are served from these caches instead of repeat round trips
+        self._schema_cache: Dict[Any, Any] = {}
+        self._row_count_cache: Dict[str, Tuple[int, float]] = {}
+        # Whether the gene fulltext index is usable: None until probed
+        self._gene_fulltext: Optional[bool] = None
+        self._setup_logging()
+
+    def _setup_logging(self):
+        """Setup logging for database operations"""
+        # basicConfig is a no-op once the root logger has handlers, but
+        # it still takes the module lock; skip it entirely in that case
+        # and leave configuration to the hosting application
+        if not logging.getLogger().handlers:
+            logging.basicConfig(
+                level=logging.INFO,
+                format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+            )
+        self.logger = logging.getLogger(__name__)
+
+    def connect(self) -> bool:
+        """
+        Establish database connection
+
+        Returns:
+            bool: True if connection successful, False otherwise
+        """
+        try:
+            if self.connection and self.connection.is_connected():
+                return True
+
+            # Cursors prepared on a previous connection are dead once we
+            # reconnect
+            self._prepared_cursors.clear()
+
+            # Keys the driver doesn't understand (our own flags) must not
+            # reach the connector
+            conn_config = {
+                key: value
+                for key, value in self.config.items()
+                if key not in _NON_CONNECTOR_KEYS
+            }
+
+            if any(key.startswith("pool_") for key in conn_config):
+                if self._pool is None:
+                    self._pool = pooling.MySQLConnectionPool(**conn_config)
+                self.connection = self._pool.get_connection()
+            else:
+                self.connection = mysql.connector.connect(**conn_config)
+
+            if self.connection.is_connected():
+                self._tune_session(self.connection)
+                self.logger.info("Successfully connected to Biocat database")
+                return True
+            else:
+                self.logger.error("Failed to connect to database")
+                return False
+
+        except Error as e:
+            self.logger.error("Database connection error: %s", e)
+            self.connection = None
+            return False
+
+    def _tune_session(self, connection):
+        """Apply the dashboard session tuning to a fresh connection
+
+        Best-effort: a server that denies SET SESSION (restricted
+        accounts, managed hosting) still serves every query, just with
+        default buffers.
+        """
+        try:
+            cursor = connection.cursor()
+            try:
+                cursor.execute(_SESSION_TUNING)
+            finally:
+                cursor.close()
+        except Error as e:
+            self.logger.warning("Session tuning not applied: %s", e)
+
+    def disconnect(self):
+        """Close database connection"""
+        if self.connection and self.connection.is_connected():
+            for cursor in self._prepared_cursors.values():
+                try:
+                    cursor.close()
+                except Error:
+                    pass
+            self._prepared_cursors.clear()
+            self.connection.close()
+            self.logger.info("Database connection closed")
+
+    def is_connected(self) -> bool:
+        """Check if database connection is active"""
+        return self.connection and self.connection.is_connected()
+
+    @contextmanager
+    def pooled_connection(self):
+        """
+        Context manager that checks a connection out of the pool
+
+        Lets concurrent handlers run queries on their own connection instead
+        of serializing on the shared one; closing returns it to the pool.
+        Falls back to the shared connection when pooling is not configured.
+        """
+        if self._pool is None and not any(
+            key.startswith("pool_") for key in self.config
+        ):
+            if not self.is_connected() and not self.connect():
+                raise Error("Could not establish database connection")
+            yield self.connection
+            return
+
+        if self._pool is None:
+            # Same filtering as connect(): our own flags (use_connectorx)
+            # must not reach the pool constructor
+            self._pool = pooling.MySQLConnectionPool(
+                **{
+                    key: value
+                    for key, value in self.config.items()
+                    if key not in _NON_CONNECTOR_KEYS
+                }
+            )
+
+        connection = self._pool.get_connection()
+        # The pool resets session state on checkout, so the tuning is
+        # re-applied per lease — one round-trip against queries that run
+        # with default buffers otherwise
+        self._tune_session(connection)
+        try:
+            yield connection
+        finally:
+            connection.close()
+
+    @contextmanager
+    def get_cursor(self, dictionary: bool = True):
+        """
+        Context manager for database cursor
+
+        With pooling configured, each cursor leases its own connection
+        for the duration of the block and returns it on exit, so
+        concurrent callers never serialize on one shared connection.
+        Pass dictionary=False for a tuple cursor when rows feed straight
+        into a DataFrame.
+        """
+        if self._pool is not None or any(
+            key.startswith("pool_") for key in self.config
+        ):
+            with self.pooled_connection() as connection:
+                cursor = connection.cursor(dictionary=dictionary)
+                try:
+                    yield cursor
+                except Error as e:
+                    self.logger.error("Cursor error: %s", e)
+                    raise
+                finally:
+                    cursor.close()
+            return
+
+        cursor = None
+        try:
+            if not self.is_connected():
+                if not self.connect():
+                    raise Error("Could not establish database connection")
+
+            cursor = self.connection.cursor(dictionary=dictionary)
+            yield cursor
+
+        except Error as e:
+            self.logger.error("Cursor error: %s", e)
+            if cursor:
+                cursor.close()
+            raise
+        finally:
+            if cursor:
+                cursor.close()
+
+    def execute_query(
+        self, query: str, params: Optional[Tuple] = None, fetch_all: bool = True
+    ) -> Union[List[Dict], Dict, None]:
+        """
+        Execute a SELECT query and return results
+
+        Args:
+            query: SQL query string
+            params: Query parameters tuple
+            fetch_all: Whether to fetch all results or just one
+
+        Returns:
+            List of row dictionaries when fetch_all is True; the single
+            row dictionary (or None) when fetch_all is False; None on
+            error
+        """
+        try:
+            with self.get_cursor() as cursor:
+                cursor.execute(query, params or ())
+
+                if fetch_all:
+                    results = cursor.fetchall()
+                    # isEnabledFor skips the f-string work when INFO
+                    # logging is off; this runs once per query
+                    if self.logger.isEnabledFor(logging.INFO):
+                        self.logger.info(
+                            "Query executed successfully, returned %s rows",
+                            len(results),
+                        )
+                    return results
+
+                # Single-row fetch: hand the row back directly instead of
+                # boxing it in a one-element list the caller unwraps
+                row = cursor.fetchone()
+                # Drain so buffered cursors leave the connection clean
+                cursor.fetchall()
+                return row
+
+        except Error as e:
+            self.logger.error("Query execution error: %s", e)
+            self.logger.error("Query: %s", query)
+            if params:
+                self.logger.error("Parameters: %s", params)
+            return None
+
+    def execute_query_df(
+        self, query: str, params: Optional[Tuple] = None, limit: Optional[int] = None
+    ) -> Optional[pd.DataFrame]:
+        """
+        Execute query and return results as pandas DataFrame
+
+        When a limit is given, rows are streamed from the cursor in chunks
+        with fetchmany so large result sets are never materialized twice
+        (cursor buffer plus DataFrame), and only the first `limit` rows are
+        returned.
+
+        Args:
+            query: SQL query string
+            params: Query parameters tuple
+            limit: Maximum number of rows to return (None for all rows)
+
+        Returns:
+            pandas DataFrame with query results, or None if error
+        """
+        try:
+            # Rust-side decode for parameterless queries when opted in;
+            # connectorx takes a URI plus finished SQL, so parameterized
+            # calls stay on the connector path
+            if (
+                CONNECTORX_AVAILABLE
+                and self.config.get("use_connectorx")
+                and params is None
+                and limit is None
+            ):
+                df = self._read_sql_connectorx(query)
+                if df is not None:
+                    return df
+
+            if limit is None:
+                # Tuple cursor: rows are never boxed into per-row dicts
+                # on their way into the DataFrame
+                with self.get_cursor(dictionary=False) as cursor:
+                    cursor.execute(query, params or ())
+                    rows = cursor.fetchall()
+                    columns = list(cursor.column_names)
+                    description = cursor.description
+
+                df = _records_to_df(rows, columns, description)
+                if self.logger.isEnabledFor(logging.INFO):
+                    self.logger.info("DataFrame created with shape: %s", df.shape)
+                return df
+
+            with self.get_cursor(dictionary=False) as cursor:
+                cursor.execute(query, params or ())
+                columns = list(cursor.column_names)
+                description = cursor.description
+
+                chunk_size = min(limit, 5000)
+                frames = []
+                remaining = limit
+                while remaining > 0:
+                    rows = cursor.fetchmany(min(chunk_size, remaining))
+                    if not rows:
+                        break
+                    frames.append(_records_to_df(rows, columns, description))
+                    remaining -= len(rows)
+
+                # Drain any remaining rows so the connection is left clean
+                while cursor.fetchmany(chunk_size):
+                    pass
+
+                df = (
+                    pd.concat(frames, ignore_index=True)
+                    if frames
+                    else _records_to_df([], columns)
+                )
+                if self.logger.isEnabledFor(logging.INFO):
+                    self.logger.info("DataFrame created with shape: %s", df.shape)
+                return df
+
+        except Exception as e:
+            self.logger.error("DataFrame creation error: %s", e)
+            return None
+
+    def _read_sql_connectorx(self, query: str) -> Optional[pd.DataFrame]:
+        """
+        Fetch a query result through connectorx
+
+        The binary protocol is parsed in Rust straight into columnar
+        buffers, so no per-cell Python object is created during decode —
+        the hotspot on large sequence fetches. Returns None on any
+        failure so the caller can fall back to the connector path.
+        """
+        try:
+            uri = (
+                f"mysql://{self.config.get('user', '')}:"
+                f"{self.config.get('password', '')}@"
+                f"{self.config.get('host', 'localhost')}:"
+                f"{self.config.get('port', 3306)}/"
+                f"{self.config.get('database', '')}"
+            )
+            return cx.read_sql(
+                uri, query, return_type="pandas", protocol="binary"
+            )
+        except Exception as e:
+            self.logger.error("connectorx fetch failed: %s", e)
+            return None
+
+    def execute_multi_df(self, query: str) -> Optional[List[pd.DataFrame]]:
+        """
+        Execute a semicolon-separated batch and return one DataFrame per
+        statement
+
+        Batching turns N network round-trips into one, which is the
+        dominant cost for small dashboard queries on a remote server. The
+        batch runs on its own short-lived connection with the
+        MULTI_STATEMENTS flag so the shared and pooled connections used
+        for user-typed SQL stay single-statement. Returns None on error.
+        """
+        try:
+            conn_config = {
+                key: value
+                for key, value in self.config.items()
+                if key not in _NON_CONNECTOR_KEYS
+                and not key.startswith("pool_")
+            }
+            conn_config["client_flags"] = [ClientFlag.MULTI_STATEMENTS]
+
+            connection = mysql.connector.connect(**conn_config)
+            try:
+                cursor = connection.cursor(dictionary=False)
+                try:
+                    cursor.execute(query)
+                    frames = []
+                    while True:
+                        if cursor.description is not None:
+                            rows = cursor.fetchall()
+                            frames.append(
+                                _records_to_df(
+                                    rows,
+                                    list(cursor.column_names),
+                                    cursor.description,
+                                )
+                            )
+                        if not cursor.nextset():
+                            break
+                    return frames
+                finally:
+                    cursor.close()
+            finally:
+                connection.close()
+
+        except Exception as e:
+            self.logger.error("Multi-statement batch error: %s", e)
+            return None
+
+    def get_prepared(self, query: str):
+        """
+        Return a cached prepared cursor for the given SQL text
+
+        The cursor (and with it the server-side prepared statement) is
+        kept alive across calls, so only the first execution of each
+        distinct query pays the parse/plan cost. The cache is LRU-bounded
+        and dropped on reconnect since prepared statements are
+        per-connection.
+        """
+        cursor = self._prepared_cursors.get(query)
+        if cursor is not None:
+            self._prepared_cursors.move_to_end(query)
+            return cursor
+
+        cursor = self.connection.cursor(prepared=True)
+        self._prepared_cursors[query] = cursor
+        if len(self._prepared_cursors) > _PREPARED_CACHE_SIZE:
+            _, evicted = self._prepared_cursors.popitem(last=False)
+            try:
+                evicted.close()
+            except Error:
+                pass
+        return cursor
+
+    def execute_query_chunks(
+        self, query: str, params: Optional[Tuple] = None, chunksize: int = 1000
+    ):
+        """
+        Stream query results as a sequence of DataFrames
+
+        Backed by an unbuffered cursor, so result sets whose rows run to
+        megabytes (full_sequence columns) are held at most `chunksize`
+        rows at a time; callers can stream chunks onward without ever
+        materializing the full result set.
+
+        Args:
+            query: SQL query string
+            params: Query parameters tuple
+            chunksize: Maximum rows per yielded DataFrame
+
+        Yields:
+            DataFrames with up to chunksize rows each
+        """
+        with self.get_cursor(dictionary=False) as cursor:
+            cursor.execute(query, params or ())
+            columns = list(cursor.column_names)
+            description = cursor.description
+
+            while True:
+                rows = cursor.fetchmany(chunksize)
+                if not rows:
+                    break
+                yield _records_to_df(rows, columns, description)
+
+    def execute_prepared_df(
+        self, query: str, params: Tuple, raise_errors: bool = False
+    ) -> Optional[pd.DataFrame]:
+        """
+        Execute a parameterized query via a prepared statement and return
+        results as a DataFrame
+
+        Prepared statements let the server reuse the parsed execution plan
+        across repeated calls and bind values without string interpolation.
+
+        Args:
+            query: SQL query string with %s placeholders
+            params: Query parameters tuple
+            raise_errors: Re-raise driver errors instead of returning
+                          None, for callers that branch on the errno
+
+        Returns:
+            pandas DataFrame with query results, or None if error
+        """
+        try:
+            if not self.is_connected():
+                if not self.connect():
+                    raise Error("Could not establish database connection")
+
+            cursor = self.get_prepared(query)
+            cursor.execute(query, params)
+            rows = cursor.fetchall()
+            description = cursor.description
+            columns = (
+                [desc[0] for desc in description] if description else []
+            )
+
+            # Same Arrow-backed construction as the plain DataFrame path:
+            # sequence columns land in one contiguous buffer plus offsets
+            # instead of one PyUnicode per row
+            df = _records_to_df(rows, columns, description)
+            if self.logger.isEnabledFor(logging.INFO):
+                self.logger.info(
+                    "Prepared query executed, returned %s rows", len(df)
+                )
+            return df
+
+        except Error as e:
+            if raise_errors:
+                raise
+            self.logger.error("Prepared query execution error: %s", e)
+            self.logger.error("Query: %s", query)
+            return None
+
+    def execute_update(self, query: str, params: Optional[Tuple] = None) -> bool:
+        """
+        Execute an UPDATE, INSERT, or DELETE query
+
+        Args:
+            query: SQL query string
+            params: Query parameters tuple
+
+        Returns:
+            bool: True if successful, False otherwise
+        """
+        try:
+            # Commit must happen on the same connection the cursor ran
+            # on: in pooled mode get_cursor leases its own connection,
+            # and committing the shared one would silently lose the
+            # write when the lease is reset on release
+            with self.pooled_connection() as connection:
+                cursor = connection.cursor()
+                try:
+                    cursor.execute(query, params or ())
+                    connection.commit()
+                    affected_rows = cursor.rowcount
+                except Error:
+                    connection.rollback()
+                    raise
+                finally:
+                    cursor.close()
+
+            self.logger.info(
+                "Update executed successfully, affected %s rows",
+                affected_rows,
+            )
+            return True
+
+        except Error as e:
+            self.logger.error("Update execution error: %s", e)
+            return False
+
+    def execute_many(
+        self,
+        query: str,
+        seq_of_params: List[Tuple],
+        batch_size: int = 1000,
+    ) -> bool:
+        """
+        Execute an INSERT/UPDATE/DELETE for many parameter tuples
+
+        Rows are sent in executemany batches with a single commit at the
+        end, so N inserts cost ~N/batch_size round trips instead of N.
+        For plain INSERT ... VALUES statements the connector additionally
+        rewrites each batch into one multi-row VALUES (...),(...) list,
+        which the server parses as a single statement.
+
+        Args:
+            query: Parameterized SQL statement
+            seq_of_params: One parameter tuple per row
+            batch_size: Rows per executemany batch
+
+        Returns:
+            bool: True if all batches succeeded, False otherwise
+        """
+        if not seq_of_params:
+            return True
+
+        try:
+            # Same rule as execute_update: commit on the connection the
+            # batches ran on, not the shared one
+            with self.pooled_connection() as connection:
+                cursor = connection.cursor()
+                try:
+                    total = 0
+                    for start in range(0, len(seq_of_params), batch_size):
+                        batch = seq_of_params[start : start + batch_size]
+                        cursor.executemany(query, batch)
+                        total += cursor.rowcount
+                    connection.commit()
+                except Error:
+                    connection.rollback()
+                    raise
+                finally:
+                    cursor.close()
+
+            self.logger.info(
+                "Batch executed successfully, affected %s rows", total
+            )
+            return True
+
+        except Error as e:
+            self.logger.error("Batch execution error: %s", e)
+            return False
+
+    def get_table_info(self, table_name: str) -> Optional[pd.DataFrame]:
+        """
+        Get information about a table structure
+
+        The result is schema-stable, so it is cached per table after the
+        first call; see invalidate_schema_cache.
+
+        Args:
+            table_name: Name of the table
+
+        Returns:
+            DataFrame with table structure information
+        """
+        cached = self._schema_cache.get(("info", table_name))
+        if cached is not None:
+            return cached
+
+        query = f"DESCRIBE {table_name}"
+        result = self.execute_query_df(query)
+        if result is not None:
+            self._schema_cache[("info", table_name)] = result
+        return result
+
+    def get_table_names(self) -> List[str]:
+        """
+        Get list of all table names in the database
+
+        Cached after the first call; see invalidate_schema_cache.
+
+        Returns:
+            List of table names
+        """
+        cached = self._schema_cache.get("tables")
+        if cached is not None:
+            return cached
+
+        query = "SHOW TABLES"
+        results = self.execute_query(query)
+
+        if results:
+            # Extract table names from the results
+            table_key = f"Tables_in_{self.config['database']}"
+            names = [row[table_key] for row in results]
+            self._schema_cache["tables"] = names
+            return names
+        return []
+
+    def get_row_count(self, table_name: str) -> int:
+        """
+        Get number of rows in a table
+
+        Counts change slowly, so results are reused for up to
+        _ROW_COUNT_TTL seconds before the COUNT(*) is re-issued.
+
+        Args:
+            table_name: Name of the table
+
+        Returns:
+            Number of rows in the table
+        """
+        cached = self._row_count_cache.get(table_name)
+        if cached is not None and time.monotonic() - cached[1] < _ROW_COUNT_TTL:
+            return cached[0]
+
+        query = f"SELECT COUNT(*) FROM {table_name}"
+        count = self._fetch_scalar(query)
+
+        if count is not None:
+            self._row_count_cache[table_name] = (count, time.monotonic())
+            return count
+        return 0
+
+    def invalidate_schema_cache(self):
+        """Drop cached table names, structures and row counts"""
+        self._schema_cache.clear()
+        self._row_count_cache.clear()
+
+    def _fetch_scalar(self, query: str, params: Optional[Tuple] = None):
+        """
+        Fetch the first column of the first row via a tuple cursor
+
+        Single-value lookups have no use for the per-row dict a
+        dictionary cursor builds; positional access is strictly cheaper.
+        """
+        with self.get_cursor(dictionary=False) as cursor:
+            cursor.execute(query, params or ())
+            row = cursor.fetchone()
+            cursor.fetchall()
+            return row[0] if row else None
+
+    def _fetch_server_version(self) -> Optional[str]:
+        """Return the MySQL server version string"""
+        return self._fetch_scalar("SELECT VERSION()")
+
+    def test_connection(self) -> Dict[str, Any]:
+        """
+        Test database connection and return status information
+
+        Returns:
+            Dictionary with connection status and database information
+        """
+        status = {
+            "connected": False,
+            "database_name": None,
+            "server_version": None,
+            "tables": [],
+            "error": None,
+        }
+
+        try:
+            if self.connect():
+                status["connected"] = True
+                status["database_name"] = self.config["database"]
+
+                if self._pool is not None:
+                    # The two probes are independent; with a pool each can
+                    # run on its own connection, so the pair costs one
+                    # round-trip time instead of two
+                    with ThreadPoolExecutor(max_workers=2) as executor:
+                        version_future = executor.submit(
+                            self._fetch_server_version
+                        )
+                        tables_future = executor.submit(self.get_table_names)
+                        status["server_version"] = version_future.result()
+                        status["tables"] = tables_future.result()
+                else:
+                    status["server_version"] = self._fetch_server_version()
+                    status["tables"] = self.get_table_names()
+
+        except Exception as e:
+            status["error"] = str(e)
+            self.logger.error("Connection test failed: %s", e)
+
+        return status
+
+    def get_database_stats(self) -> Optional[pd.DataFrame]:
+        """
+        Get basic statistics about the database
+
+        Returns:
+            DataFrame with database statistics
+        """
+        query = """
+        SELECT
+            'Species' as table_name, COUNT(*) as record_count
+        FROM species
+        UNION ALL
+        SELECT 'Genes', COUNT(*) FROM gene
+        UNION ALL
+        SELECT 'Transcripts', COUNT(*) FROM transcript
+        UNION ALL
+        SELECT 'Proteins', COUNT(*) FROM protein
+        UNION ALL
+        SELECT 'Chromosomes', COUNT(*) FROM chromosome
+        UNION ALL
+        SELECT 'Genetic Variants', COUNT(*) FROM genetic_variant
+        UNION ALL
+        SELECT 'GO Annotations', COUNT(*) FROM gene_go_annotation
+        ORDER BY record_count DESC;
+        """
+
+        return self.execute_query_df(query)
+
+    def search_genes(self, search_term: str, limit: int = 50) -> Optional[pd.DataFrame]:
+        """
+        Search for genes by symbol, name, or description
+
+        Args:
+            search_term: Term to search for
+            limit: Maximum number of results to return
+
+        Returns:
+            DataFrame with matching genes
+        """
+        select_clause = """
+        SELECT
+            s.species_name,
+            g.gene_symbol,
+            g.gene_name,
+            g.gene_description,
+            g.gene_biotype,
+            c.chromosome_name,
+            g.start_position,
+            g.end_position,
+            (g.end_position - g.start_position + 1) as gene_length
+        FROM gene g
+        JOIN species s ON g.species_id = s.species_id
+        LEFT JOIN chromosome c ON g.chromosome_id = c.chromosome_id
+        """
+
+        # Fulltext first: an inverted-index lookup instead of a full
+        # table scan running three LIKE '%...%' predicates per row.
+        # Needs the index from create_gene_fulltext_index; only the
+        # server saying the index is missing (errno 1191) disables the
+        # path for this connection — any other failure falls back to
+        # LIKE for this call and tries fulltext again next time.
+        ft_term = _FT_OPERATOR_RE.sub(" ", search_term).strip()
+        if self._gene_fulltext is not False and ft_term:
+            ft_query = (
+                select_clause
+                + """
+        WHERE MATCH(g.gene_symbol, g.gene_name, g.gene_description)
+              AGAINST (%s IN BOOLEAN MODE)
+        ORDER BY s.species_name, g.gene_symbol
+        LIMIT %s
+        """
+            )
+            try:
+                result = self.execute_prepared_df(
+                    ft_query, (f"{ft_term}*", limit), raise_errors=True
+                )
+            except Error as e:
+                result = None
+                if e.errno == errorcode.ER_FT_MATCHING_KEY_NOT_FOUND:
+                    self._gene_fulltext = False
+                    self.logger.warning(
+                        "Fulltext gene search unavailable, falling back to "
+                        "LIKE; run create_gene_fulltext_index() to enable it"
+                    )
+                else:
+                    self.logger.error("Fulltext gene search failed: %s", e)
+            if result is not None:
+                self._gene_fulltext = True
+                return result
+
+        search_pattern = f"%{search_term}%"
+        query = (
+            select_clause
+            + """
+        WHERE (g.gene_symbol LIKE %s OR g.gene_name LIKE %s OR g.gene_description LIKE %s)
+        ORDER BY s.species_name, g.gene_symbol
+        LIMIT %s
+        """
+        )
+
+        # Prepared path: repeated searches reuse the server-side plan
+        return self.execute_prepared_df(
+            query, (search_pattern, search_pattern, search_pattern, limit)
+        )
+
+    def create_gene_fulltext_index(self) -> bool:
+        """
+        Create the FULLTEXT index backing fast gene search (one-time DDL)
+
+        Returns:
+            bool: True if the index was created
+        """
+        created = self.execute_update(
+            "ALTER TABLE gene ADD FULLTEXT KEY ft_gene "
+            "(gene_symbol, gene_name, gene_description)"
+        )
+        if created:
+            # Let the next search retry the fulltext path
+            self._gene_fulltext = None
+        return created
+
+    # Covering composites for the dashboard join/group-by queries; kept in
+    # sync with sql/indexes.sql for installs bootstrapped via mysql client
+    _PERFORMANCE_INDEXES = (
+        "ALTER TABLE gene ADD INDEX idx_gene_species_chrom_biotype "
+        "(species_id, chromosome_id, gene_biotype)",
+        "ALTER TABLE transcript ADD INDEX idx_transcript_gene_biotype "
+        "(gene_id, transcript_biotype)",
+        "ALTER TABLE protein ADD INDEX idx_protein_transcript_length "
+        "(transcript_id, protein_length)",
+        "ALTER TABLE chromosome ADD INDEX idx_chromosome_assembly_length "
+        "(assembly_id, sequence_length)",
+        "ALTER TABLE genetic_variant ADD INDEX idx_variant_chrom_type_clinical "
+        "(chromosome_id, variant_type, clinical_significance)",
+        "ALTER TABLE ortholog ADD INDEX idx_ortholog_pair_identity "
+        "(gene_a_id, gene_b_id, percentage_identity)",
+    )
+
+    def create_performance_indexes(self) -> int:
+        """
+        Create the covering indexes behind the dashboard queries (one-time DDL)
+
+        The predefined statistics queries join species, gene, transcript,
+        protein, chromosome, variant and ortholog on their foreign keys and
+        aggregate over a couple of extra columns; these composites let the
+        optimizer serve them with index-only scans. Statements for indexes
+        that already exist fail individually and are skipped.
+
+        Returns:
+            int: Number of indexes created
+        """
+        created = 0
+        for ddl in self._PERFORMANCE_INDEXES:
+            if self.execute_update(ddl):
+                created += 1
+        return created
+
+    def get_protein_sequence(self, protein_id: str) -> Optional[str]:
+        """
+        Get protein sequence by protein stable ID
+
+        Args:
+            protein_id: Protein stable ID
+
+        Returns:
+            Protein sequence string or None if not found
+        """
+        query = """
+        SELECT protein_sequence
+        FROM protein
+        WHERE protein_stable_id = %s
+        """
+
+        result = self.execute_prepared_df(query, (protein_id,))
+        if result is not None and not result.empty:
+            return result.iloc[0]["protein_sequence"]
+        return None
+
+    def check_dna_sequence_availability(self) -> Dict[str, Any]:
+        """
+        Check what DNA sequence data is available in the database
+
+        Returns:
+            Dictionary with information about DNA sequence availability
+        """
+        if not self.is_connected():
+            return {"error": "Not connected to database"}
+
+        try:
+            results = {}
+
+            # Round-trip 1: discover every sequence-bearing column from
+            # information_schema instead of probing table by table. The
+            # view walks all table metadata and is notoriously slow, so
+            # the discovered pairs are kept in the schema cache — only
+            # the first call after connect (or invalidate_schema_cache)
+            # pays for the scan
+            pairs = self._schema_cache.get("sequence_columns")
+            if pairs is None:
+                placeholders = ", ".join(["%s"] * len(_SEQUENCE_TABLES))
+                discovery = self.execute_query(
+                    f"""
+                    SELECT table_name, column_name
+                    FROM information_schema.columns
+                    WHERE table_schema = DATABASE()
+                    AND table_name IN ({placeholders})
+                    AND (
+                        column_name LIKE '%seq%'
+                        OR column_name LIKE '%dna%'
+                        OR column_name LIKE '%rna%'
+                    )
+                    """,
+                    tuple(_SEQUENCE_TABLES),
+                )
+
+                pairs = []
+                for row in discovery or []:
+                    # information_schema key case varies across server versions
+                    table = row.get("table_name") or row.get("TABLE_NAME")
+                    column = row.get("column_name") or row.get("COLUMN_NAME")
+                    if table and column:
+                        pairs.append((table, column))
+
+                if discovery is not None:
+                    self._schema_cache["sequence_columns"] = pairs
+
+            if not pairs:
+                return {"available_sequences": {}, "total_sources": 0}
+
+            # Round-trip 2: one UNION ALL aggregates counts and average
+            # lengths for all discovered columns at once (identifiers come
+            # from information_schema, so inlining them is safe)
+            union_query = "\nUNION ALL\n".join(
+                f"SELECT '{table}.{column}' as source_key, "
+                f"COUNT({column}) as sequence_count, "
+                f"ROUND(AVG(LENGTH({column})), 0) as avg_length "
+                f"FROM {table} "
+                f"WHERE {column} IS NOT NULL AND {column} != ''"
+                for table, column in pairs
+            )
+            stats = self.execute_query(union_query)
+
+            for row in stats or []:
+                if not row["sequence_count"]:
+                    continue
+                table, column = row["source_key"].split(".", 1)
+                results[row["source_key"]] = {
+                    "description": _SEQUENCE_DESCRIPTIONS.get(
+                        (table, column), f"{table.title()} {column}"
+                    ),
+                    "table": table,
+                    "column": column,
+                    "sequence_count": row["sequence_count"],
+                    "avg_length": row["avg_length"],
+                }
+
+            return {"available_sequences": results, "total_sources": len(results)}
+
+        except Exception as e:
+            return {"error": f"Failed to check sequence availability: {str(e)}"}
+
+    def get_dna_sequences(
+        self,
+        source_table: str,
+        source_column: str,
+        limit: int = 50,
+        min_length: int = 10,
+        preview_len: int = 1000,
+    ) -> Optional[pd.DataFrame]:
+        """
+        Fetch DNA sequence previews from the specified table and column
+
+        Returns only LEFT(column, preview_len) plus metadata; the list
+        view never drags full sequences (potentially hundreds of MB for
+        chromosomes) across the wire. Use get_full_sequence or
+        stream_full_sequences for the deep fetch once a row is chosen.
+
+        Args:
+            source_table: Table name containing sequences
+            source_column: Column name containing sequences
+            limit: Maximum number of sequences to fetch
+            min_length: Minimum sequence length to include
+            preview_len: Characters of sequence to include per row
+
+        Returns:
+            DataFrame with sequence previews and metadata
+        """
+        if not _valid_identifier(source_table) or not _valid_identifier(
+            source_column
+        ):
+            self.logger.error(
+                "Rejected sequence source: %s.%s", source_table, source_column
+            )
+            return None
+
+        if not self.is_connected():
+            return None
+
+        try:
+            # Build the query based on the table
+            if source_table == "chromosome":
+                query = f"""
+                    SELECT
+                        c.chromosome_id,
+                        c.chromosome_name,
+                        s.species_name,
+                        c.sequence_length,
+                        LEFT(c.{source_column}, {preview_len}) as sequence_preview
+                    FROM chromosome c
+                    JOIN genome_assembly ga ON c.assembly_id = ga.assembly_id
+                    JOIN species s ON ga.species_id = s.species_id
+                    WHERE c.{source_column} IS NOT NULL
+                    AND LENGTH(c.{source_column}) >= {min_length}
+                    ORDER BY c.sequence_length DESC
+                    LIMIT {limit}
+                """
+            elif source_table == "gene":
+                query = f"""
+                    SELECT
+                        g.gene_id,
+                        g.gene_symbol,
+                        g.gene_name,
+                        s.species_name,
+                        c.chromosome_name,
+                        LENGTH(g.{source_column}) as sequence_length,
+                        LEFT(g.{source_column}, {preview_len}) as sequence_preview
+                    FROM gene g
+                    JOIN species s ON g.species_id = s.species_id
+                    LEFT JOIN chromosome c ON g.chromosome_id = c.chromosome_id
+                    WHERE g.{source_column} IS NOT NULL
+                    AND LENGTH(g.{source_column}) >= {min_length}
+                    ORDER BY LENGTH(g.{source_column}) DESC
+                    LIMIT {limit}
+                """
+            elif source_table == "transcript":
+                query = f"""
+                    SELECT
+                        t.transcript_id,
+                        t.transcript_stable_id,
+                        g.gene_symbol,
+                        g.gene_name,
+                        s.species_name,
+                        LENGTH(t.{source_column}) as sequence_length,
+                        LEFT(t.{source_column}, {preview_len}) as sequence_preview
+                    FROM transcript t
+                    JOIN gene g ON t.gene_id = g.gene_id
+                    JOIN species s ON g.species_id = s.species_id
+                    WHERE t.{source_column} IS NOT NULL
+                    AND LENGTH(t.{source_column}) >= {min_length}
+                    ORDER BY LENGTH(t.{source_column}) DESC
+                    LIMIT {limit}
+                """
+            else:
+                # Generic query for other tables
+                query = f"""
+                    SELECT
+                        *,
+                        LENGTH({source_column}) as sequence_length,
+                        LEFT({source_column}, {preview_len}) as sequence_preview
+                    FROM {source_table}
+                    WHERE {source_column} IS NOT NULL
+                    AND LENGTH({source_column}) >= {min_length}
+                    ORDER BY LENGTH({source_column}) DESC
+                    LIMIT {limit}
+                """
+
+            frames = list(self.execute_query_chunks(query, chunksize=200))
+            if not frames:
+                return pd.DataFrame()
+            return (
+                pd.concat(frames, ignore_index=True)
+                if len(frames) > 1
+                else frames[0]
+            )
+
+        except Exception as e:
+            self.logger.error("Failed to fetch DNA sequences: %s", e)
+            return None
+
+    def get_full_sequence(
+        self, source_table: str, source_column: str, row_id: int
+    ) -> Optional[str]:
+        """
+        Fetch one full sequence by primary key
+
+        The on-demand counterpart to get_dna_sequences: the single deep
+        fetch only happens for a row the user actually drilled into.
+
+        Args:
+            source_table: Table containing the sequence
+            source_column: Column containing the sequence
+            row_id: Value of the table's `<table>_id` primary key
+
+        Returns:
+            The full sequence string, or None if not found
+        """
+        if not _valid_identifier(source_table) or not _valid_identifier(
+            source_column
+        ):
+            self.logger.error(
+                "Rejected sequence source: %s.%s", source_table, source_column
+            )
+            return None
+
+        if not self.is_connected():
+            return None
+
+        try:
+            query = (
+                f"SELECT {source_column} as sequence FROM {source_table} "
+                f"WHERE {source_table}_id = %s"
+            )
+            row = self.execute_query(query, (row_id,), fetch_all=False)
+            return row["sequence"] if row else None
+
+        except Exception as e:
+            self.logger.error("Failed to fetch full sequence: %s", e)
+            return None
+
+    def stream_full_sequences(
+        self, source_table: str, source_column: str, row_ids: List[int]
+    ):
+        """
+        Stream full sequences for a batch of primary keys
+
+        One IN (...) query, yielded row by row off an unbuffered cursor,
+        so batch analysis over large sequences never holds more than one
+        full sequence in memory at a time.
+
+        Args:
+            source_table: Table containing the sequences
+            source_column: Column containing the sequences
+            row_ids: Values of the table's `<table>_id` primary key
+
+        Yields:
+            (row_id, sequence) tuples
+        """
+        if not row_ids or not self.is_connected():
+            return
+        if not _valid_identifier(source_table) or not _valid_identifier(
+            source_column
+        ):
+            self.logger.error(
+                "Rejected sequence source: %s.%s", source_table, source_column
+            )
+            return
+
+        placeholders = ", ".join(["%s"] * len(row_ids))
+        query = (
+            f"SELECT {source_table}_id, {source_column} FROM {source_table} "
+            f"WHERE {source_table}_id IN ({placeholders}) "
+            f"AND {source_column} IS NOT NULL"
+        )
+        with self.get_cursor(dictionary=False) as cursor:
+            cursor.execute(query, tuple(row_ids))
+            while True:
+                rows = cursor.fetchmany(1)
+                if not rows:
+                    break
+                yield rows[0]
+
+    def get_random_dna_sequences(
+        self, source_table: str, source_column: str, count: int = 10
+    ) -> Optional[List[str]]:
+        """
+        Get random DNA sequences from the database for analysis
+
+        Args:
+            source_table: Table containing sequences
+            source_column: Column containing sequences
+            count: Number of sequences to return
+
+        Returns:
+            List of DNA sequence strings
+        """
+        if not _valid_identifier(source_table) or not _valid_identifier(
+            source_column
+        ):
+            self.logger.error(
+                "Rejected sequence source: %s.%s", source_table, source_column
+            )
+            return None
+
+        if not self.is_connected():
+            return None
+
+        try:
+            # Random primary-key probes touch only the sampled rows via
+            # the PK index; ORDER BY RAND() would read and filesort every
+            # qualifying row, sequence column included
+            sequences = self._sample_sequences_by_id(
+                source_table, source_column, count
+            )
+            if sequences:
+                return sequences[:count]
+
+            # Fallback (no usable id column, or the probes all missed):
+            # the original full-scan sampling
+            query = f"""
+                SELECT {source_column} as sequence
+                FROM {source_table}
+                WHERE {source_column} IS NOT NULL
+                AND LENGTH({source_column}) BETWEEN 20 AND 5000
+                ORDER BY RAND()
+                LIMIT {count}
+            """
+
+            sequences = []
+            for chunk in self.execute_query_chunks(
+                query, chunksize=min(count, 100)
+            ):
+                # dropna first: Arrow-backed columns yield pd.NA, whose
+                # truth value raises
+                sequences.extend(
+                    seq for seq in chunk["sequence"].dropna().tolist() if seq
+                )
+            return sequences
+
+        except Exception as e:
+            self.logger.error("Failed to fetch random DNA sequences: %s", e)
+            return None
+
+    def _sample_sequences_by_id(
+        self, source_table: str, source_column: str, count: int
+    ) -> List[str]:
+        """
+        Sample sequences by probing random primary-key values
+
+        Oversamples 4x to absorb id gaps and length-filter misses, then
+        fetches all probes in one IN (...) query. Returns an empty list
+        when the table has no conventional `<table>_id` column, letting
+        the caller fall back to a full-scan sample.
+        """
+        id_column = f"{source_table}_id"
+        try:
+            with self.get_cursor(dictionary=False) as cursor:
+                cursor.execute(
+                    f"SELECT MIN({id_column}), MAX({id_column}) "
+                    f"FROM {source_table}"
+                )
+                bounds = cursor.fetchone()
+                cursor.fetchall()
+        except Exception:
+            return []
+
+        if not bounds or bounds[0] is None:
+            return []
+
+        min_id = int(bounds[0])
+        max_id = int(bounds[1])
+        span = max_id - min_id + 1
+        probes = random.sample(range(min_id, max_id + 1), min(count * 4, span))
+
+        placeholders = ", ".join(["%s"] * len(probes))
+        query = f"""
+            SELECT {source_column} as sequence
+            FROM {source_table}
+            WHERE {id_column} IN ({placeholders})
+            AND {source_column} IS NOT NULL
+            AND LENGTH({source_column}) BETWEEN 20 AND 5000
+            LIMIT {count}
+        """
+
+        sequences: List[str] = []
+        for chunk in self.execute_query_chunks(
+            query, tuple(probes), chunksize=min(count, 100)
+        ):
+            sequences.extend(
+                seq for seq in chunk["sequence"].dropna().tolist() if seq
+            )
+        return sequences
+
+    def search_sequences_by_pattern(
+        self,
+        pattern: str,
+        source_table: str,
+        source_column: str,
+        limit: int = 20,
+        use_fulltext: bool = False,
+    ) -> Optional[pd.DataFrame]:
+        """
+        Search for sequences containing a specific pattern
+
+        Args:
+            pattern: DNA pattern to search for (e.g., "ATCG")
+            source_table: Table to search in
+            source_column: Column containing sequences
+            limit: Maximum results to return
+            use_fulltext: Try a FULLTEXT index probe (MATCH ... AGAINST in
+                          BOOLEAN mode) before the INSTR scan. Requires a
+                          FULLTEXT index on the column (no repo migration
+                          creates one on a sequence column), and InnoDB
+                          tokenizes on word boundaries, so against one long
+                          DNA string the probe only matches the pattern as a
+                          whole token — of little use for substring search.
+                          If the probe fails the INSTR path still runs.
+
+        Returns:
+            DataFrame with matching sequences
+        """
+        if not _valid_identifier(source_table) or not _valid_identifier(
+            source_column
+        ):
+            self.logger.error(
+                "Rejected sequence source: %s.%s", source_table, source_column
+            )
+            return None
+
+        if not self.is_connected():
+            return None
+
+        try:
+            # Clean the pattern to only include valid DNA bases
+            clean_pattern = re.sub(r"[^ATCG]", "", pattern.upper())
+
+            if len(clean_pattern) < 3:
+                return None
+
+            # The pattern rides in bind parameters, so the query text is
+            # constant per (table, column, mode) and hits the prepared-
+            # statement cache; {predicate} is filled per mode below
+            if source_table == "gene":
+                pattern_column = f"g.{source_column}"
+                query_template = f"""
+                    SELECT
+                        g.gene_symbol,
+                        g.gene_name,
+                        s.species_name,
+                        LENGTH(g.{source_column}) as sequence_length,
+                        LOCATE(%s, g.{source_column}) as pattern_position,
+                        LEFT(g.{source_column}, 500) as sequence_preview
+                    FROM gene g
+                    JOIN species s ON g.species_id = s.species_id
+                    WHERE {{predicate}}
+                    ORDER BY sequence_length DESC
+                    LIMIT %s
+                """
+            elif source_table == "transcript":
+                pattern_column = f"t.{source_column}"
+                query_template = f"""
+                    SELECT
+                        t.transcript_stable_id,
+                        g.gene_symbol,
+                        s.species_name,
+                        LENGTH(t.{source_column}) as sequence_length,
+                        LOCATE(%s, t.{source_column}) as pattern_position,
+                        LEFT(t.{source_column}, 500) as sequence_preview
+                    FROM transcript t
+                    JOIN gene g ON t.gene_id = g.gene_id
+                    JOIN species s ON g.species_id = s.species_id
+                    WHERE {{predicate}}
+                    ORDER BY sequence_length DESC
+                    LIMIT %s
+                """
+            else:
+                pattern_column = source_column
+                query_template = f"""
+                    SELECT
+                        *,
+                        LENGTH({source_column}) as sequence_length,
+                        LOCATE(%s, {source_column}) as pattern_position,
+                        LEFT({source_column}, 500) as sequence_preview
+                    FROM {source_table}
+                    WHERE {{predicate}}
+                    ORDER BY LENGTH({source_column}) DESC
+                    LIMIT %s
+                """
+
+            # Fulltext probe first when requested, same idiom as
+            # search_genes: only the server saying the index is missing
+            # (errno 1191) disables the probe for this (table, column);
+            # any other failure still falls through to the INSTR scan
+            cache_key = ("seq_fulltext", source_table, source_column)
+            if use_fulltext and self._schema_cache.get(cache_key) is not False:
+                ft_query = query_template.format(
+                    predicate=(
+                        f"MATCH({pattern_column}) AGAINST(%s IN BOOLEAN MODE)"
+                    )
+                )
+                try:
+                    result = self.execute_prepared_df(
+                        ft_query,
+                        (clean_pattern, f"+{clean_pattern}", limit),
+                        raise_errors=True,
+                    )
+                except Error as e:
+                    result = None
+                    if e.errno == errorcode.ER_FT_MATCHING_KEY_NOT_FOUND:
+                        self._schema_cache[cache_key] = False
+                        self.logger.warning(
+                            "No FULLTEXT index on %s.%s, using INSTR scan",
+                            source_table,
+                            source_column,
+                        )
+                    else:
+                        self.logger.error(
+                            "Fulltext sequence search failed: %s", e
+                        )
+                if result is not None and not result.empty:
+                    return result
+
+            # INSTR avoids building a %...% wildcard string and cannot
+            # be confused by LIKE metacharacters
+            return self.execute_prepared_df(
+                query_template.format(
+                    predicate=f"INSTR({pattern_column}, %s) > 0"
+                ),
+                (clean_pattern, clean_pattern, limit),
+            )
+
+        except Exception as e:
+            self.logger.error("Failed to search sequences: %s", e)
+            return None
+
+    def __enter__(self):
+        """Context manager entry"""
+        self.connect()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Context manager exit"""
+        self.disconnect()
+
+
+def get_database_connection(config: Optional[Dict[str, Any]] = None) -> BiocatDatabase:
+    """
+    Get a database connection instance
+
+    Args:
+        config: Optional database configuration
+
+    Returns:
+        BiocatDatabase instance
+    """
+    if config:
+        return BiocatDatabase(config)
+    return BiocatDatabase()
+
+
+def test_database_connection() -> Dict[str, Any]:
+    """
+    Test the default database connection
+
+    Returns:
+        Dictionary with connection test results
+    """
+    db = BiocatDatabase()
+    return db.test_connection()
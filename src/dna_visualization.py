@@ -1,999 +1,1227 @@
-"""
-DNA Visualization Module for Biocat Interface
-Provides visualization functions for DNA sequences, protein sequences, and genomic data
-"""
-
-import matplotlib.pyplot as plt
-import seaborn as sns
-import plotly.graph_objects as go
-
-from plotly.subplots import make_subplots
-import pandas as pd
-import numpy as np
-from typing import Dict, List, Any
-import re
-from collections import Counter
-
-# Removed unused imports: GC and molecular_weight are not used in this code
-from Bio.SeqUtils.ProtParam import ProteinAnalysis
-
-import warnings
-
-warnings.filterwarnings("ignore")
-
-# Set style for matplotlib
-plt.style.use("seaborn-v0_8")
-sns.set_palette("husl")
-
-
-class DNAVisualizer:
-    """Class for visualizing DNA and protein sequences"""
-
-    def __init__(self):
-        self.colors = {
-            "A": "#FF6B6B",  # Red
-            "T": "#4ECDC4",  # Teal
-            "G": "#45B7D1",  # Blue
-            "C": "#FFA726",  # Orange
-            "U": "#9C27B0",  # Purple (for RNA)
-            "N": "#757575",  # Gray (for unknown)
-        }
-        self.amino_acid_colors = {
-            "A": "#FF9999",
-            "R": "#FF6666",
-            "N": "#FF3333",
-            "D": "#FF0000",
-            "C": "#FFCC99",
-            "Q": "#FF9966",
-            "E": "#FF6633",
-            "G": "#FF3300",
-            "H": "#99FF99",
-            "I": "#66FF66",
-            "L": "#33FF33",
-            "K": "#00FF00",
-            "M": "#99FFFF",
-            "F": "#66FFFF",
-            "P": "#33FFFF",
-            "S": "#00FFFF",
-            "T": "#9999FF",
-            "W": "#6666FF",
-            "Y": "#3333FF",
-            "V": "#0000FF",
-            "*": "#000000",  # Stop codon
-        }
-
-    def analyze_nucleotide_composition(self, sequence: str) -> Dict[str, float]:
-        """
-        Analyze nucleotide composition of a DNA sequence
-
-        Args:
-            sequence: DNA sequence string
-
-        Returns:
-            Dictionary with nucleotide frequencies
-        """
-        if not sequence:
-            return {}
-
-        sequence = sequence.upper().replace(" ", "")
-        total_length = len(sequence)
-
-        composition = {}
-        for nucleotide in ["A", "T", "G", "C", "N"]:
-            count = sequence.count(nucleotide)
-            composition[nucleotide] = (
-                (count / total_length) * 100 if total_length > 0 else 0
-            )
-
-        # Calculate GC content
-        gc_count = sequence.count("G") + sequence.count("C")
-        composition["GC_content"] = (
-            (gc_count / total_length) * 100 if total_length > 0 else 0
-        )
-
-        return composition
-
-    def plot_nucleotide_composition(
-        self, sequence: str, title: str = "Nucleotide Composition"
-    ) -> go.Figure:
-        """
-        Create a pie chart showing nucleotide composition
-
-        Args:
-            sequence: DNA sequence string
-            title: Plot title
-
-        Returns:
-            Plotly figure object
-        """
-        composition = self.analyze_nucleotide_composition(sequence)
-
-        # Filter out zero values and N
-        filtered_comp = {
-            k: v
-            for k, v in composition.items()
-            if v > 0 and k not in ["GC_content", "N"]
-        }
-
-        if not filtered_comp:
-            # Create empty figure if no valid data
-            fig = go.Figure()
-            fig.add_annotation(
-                text="No valid nucleotide data",
-                xref="paper",
-                yref="paper",
-                x=0.5,
-                y=0.5,
-                showarrow=False,
-            )
-            return fig
-
-        nucleotides = list(filtered_comp.keys())
-        percentages = list(filtered_comp.values())
-        colors = [self.colors.get(n, "#757575") for n in nucleotides]
-
-        fig = go.Figure(
-            data=[
-                go.Pie(
-                    labels=nucleotides,
-                    values=percentages,
-                    hole=0.4,
-                    marker_colors=colors,
-                    textinfo="label+percent",
-                    textfont_size=12,
-                )
-            ]
-        )
-
-        fig.update_layout(
-            title=f"{title}<br><sub>GC Content: {composition.get('GC_content', 0):.1f}%</sub>",
-            font=dict(size=14),
-            showlegend=True,
-            width=500,
-            height=400,
-        )
-
-        return fig
-
-    def plot_sequence_logo(
-        self, sequences: List[str], title: str = "Sequence Logo"
-    ) -> go.Figure:
-        """
-        Create a sequence logo visualization for multiple aligned sequences
-
-        Args:
-            sequences: List of aligned DNA sequences
-            title: Plot title
-
-        Returns:
-            Plotly figure object
-        """
-        if not sequences or not sequences[0]:
-            fig = go.Figure()
-            fig.add_annotation(
-                text="No sequence data available",
-                xref="paper",
-                yref="paper",
-                x=0.5,
-                y=0.5,
-                showarrow=False,
-            )
-            return fig
-
-        # Calculate position weight matrix
-        seq_length = len(sequences[0])
-        position_counts = []
-
-        for pos in range(seq_length):
-            pos_nucleotides = [seq[pos].upper() for seq in sequences if pos < len(seq)]
-            counter = Counter(pos_nucleotides)
-            position_counts.append(counter)
-
-        # Create heatmap data
-        nucleotides = ["A", "T", "G", "C"]
-        heatmap_data = []
-
-        for nucleotide in nucleotides:
-            row = []
-            for pos_count in position_counts:
-                total = sum(pos_count.values())
-                freq = pos_count.get(nucleotide, 0) / total if total > 0 else 0
-                row.append(freq)
-            heatmap_data.append(row)
-
-        fig = go.Figure(
-            data=go.Heatmap(
-                z=heatmap_data,
-                x=list(range(1, seq_length + 1)),
-                y=nucleotides,
-                colorscale="RdYlBu_r",
-                showscale=True,
-                colorbar=dict(title="Frequency"),
-            )
-        )
-
-        fig.update_layout(
-            title=title,
-            xaxis_title="Position",
-            yaxis_title="Nucleotide",
-            font=dict(size=12),
-            width=800,
-            height=300,
-        )
-
-        return fig
-
-    def plot_gc_content_window(
-        self, sequence: str, window_size: int = 100, title: str = "GC Content"
-    ) -> go.Figure:
-        """
-        Plot GC content across a sequence using a sliding window
-
-        Args:
-            sequence: DNA sequence string
-            window_size: Size of sliding window
-            title: Plot title
-
-        Returns:
-            Plotly figure object
-        """
-        if not sequence or len(sequence) < window_size:
-            fig = go.Figure()
-            fig.add_annotation(
-                text="Sequence too short for analysis",
-                xref="paper",
-                yref="paper",
-                x=0.5,
-                y=0.5,
-                showarrow=False,
-            )
-            return fig
-
-        sequence = sequence.upper().replace(" ", "")
-        positions = []
-        gc_contents = []
-
-        for i in range(0, len(sequence) - window_size + 1, window_size // 4):
-            window = sequence[i : i + window_size]
-            gc_count = window.count("G") + window.count("C")
-            gc_content = (gc_count / len(window)) * 100
-
-            positions.append(i + window_size // 2)
-            gc_contents.append(gc_content)
-
-        fig = go.Figure(
-            data=go.Scatter(
-                x=positions,
-                y=gc_contents,
-                mode="lines+markers",
-                line=dict(color="#2E86AB", width=2),
-                marker=dict(size=4, color="#F24236"),
-                name="GC Content",
-            )
-        )
-
-        # Add average line
-        avg_gc = np.mean(gc_contents)
-        fig.add_hline(
-            y=avg_gc,
-            line_dash="dash",
-            line_color="red",
-            annotation_text=f"Average: {avg_gc:.1f}%",
-        )
-
-        fig.update_layout(
-            title=f"{title} (Window size: {window_size}bp)",
-            xaxis_title="Position (bp)",
-            yaxis_title="GC Content (%)",
-            font=dict(size=12),
-            width=800,
-            height=400,
-            showlegend=True,
-        )
-
-        return fig
-
-    def analyze_protein_properties(self, sequence: str) -> Dict[str, Any]:
-        """
-        Analyze protein sequence properties
-
-        Args:
-            sequence: Protein sequence string
-
-        Returns:
-            Dictionary with protein properties
-        """
-        if not sequence:
-            return {}
-
-        # Clean sequence
-        sequence = re.sub(r"[^ACDEFGHIKLMNPQRSTVWY*]", "", sequence.upper())
-
-        if not sequence:
-            return {}
-
-        try:
-            protein_analysis = ProteinAnalysis(sequence.replace("*", ""))
-
-            properties = {
-                "length": len(sequence),
-                "molecular_weight": protein_analysis.molecular_weight(),
-                "isoelectric_point": protein_analysis.isoelectric_point(),
-                "instability_index": protein_analysis.instability_index(),
-                "flexibility": np.mean(protein_analysis.flexibility())
-                if protein_analysis.flexibility()
-                else 0,
-            }
-
-            # Calculate hydrophobicity manually to avoid BioPython issue
-            if len(sequence) >= 9:
-                try:
-                    hydro_values = []
-                    kyte_doolittle = {
-                        "A": 1.8,
-                        "R": -4.5,
-                        "N": -3.5,
-                        "D": -3.5,
-                        "C": 2.5,
-                        "Q": -3.5,
-                        "E": -3.5,
-                        "G": -0.4,
-                        "H": -3.2,
-                        "I": 4.5,
-                        "L": 3.8,
-                        "K": -3.9,
-                        "M": 1.9,
-                        "F": 2.8,
-                        "P": -1.6,
-                        "S": -0.8,
-                        "T": -0.7,
-                        "W": -0.9,
-                        "Y": -1.3,
-                        "V": 4.2,
-                    }
-                    window = 9
-                    for i in range(len(sequence) - window + 1):
-                        window_seq = sequence[i : i + window]
-                        hydro_sum = sum(kyte_doolittle.get(aa, 0) for aa in window_seq)
-                        hydro_values.append(hydro_sum / window)
-                    properties["hydrophobicity"] = (
-                        np.mean(hydro_values) if hydro_values else 0
-                    )
-                except Exception:
-                    properties["hydrophobicity"] = 0
-            else:
-                properties["hydrophobicity"] = 0
-
-            # Amino acid composition
-            aa_percent = protein_analysis.get_amino_acids_percent()
-            properties.update(
-                {f"aa_{aa}": percent * 100 for aa, percent in aa_percent.items()}
-            )
-
-            return properties
-
-        except Exception as e:
-            return {"length": len(sequence), "error": str(e)}
-
-    def plot_amino_acid_composition(
-        self, sequence: str, title: str = "Amino Acid Composition"
-    ) -> go.Figure:
-        """
-        Create a bar plot showing amino acid composition
-
-        Args:
-            sequence: Protein sequence string
-            title: Plot title
-
-        Returns:
-            Plotly figure object
-        """
-        properties = self.analyze_protein_properties(sequence)
-
-        # Check if there was an error in analysis
-        if "error" in properties:
-            fig = go.Figure()
-            fig.add_annotation(
-                text=f"Analysis error: {properties['error']}",
-                xref="paper",
-                yref="paper",
-                x=0.5,
-                y=0.5,
-                showarrow=False,
-            )
-            return fig
-
-        # Extract amino acid percentages
-        aa_data = {
-            k.replace("aa_", ""): v
-            for k, v in properties.items()
-            if k.startswith("aa_")
-        }
-
-        if not aa_data:
-            # Try direct amino acid counting if BioPython analysis failed
-            from collections import Counter
-
-            clean_seq = re.sub(r"[^ACDEFGHIKLMNPQRSTVWY]", "", sequence.upper())
-            if clean_seq:
-                aa_counts = Counter(clean_seq)
-                total = len(clean_seq)
-                aa_data = {aa: (count / total) * 100 for aa, count in aa_counts.items()}
-
-            if not aa_data:
-                fig = go.Figure()
-                fig.add_annotation(
-                    text="No valid amino acid data found",
-                    xref="paper",
-                    yref="paper",
-                    x=0.5,
-                    y=0.5,
-                    showarrow=False,
-                )
-                return fig
-
-        amino_acids = list(aa_data.keys())
-        percentages = list(aa_data.values())
-        colors = [self.amino_acid_colors.get(aa, "#757575") for aa in amino_acids]
-
-        fig = go.Figure(
-            data=[
-                go.Bar(
-                    x=amino_acids,
-                    y=percentages,
-                    marker_color=colors,
-                    text=[f"{p:.1f}%" for p in percentages],
-                    textposition="auto",
-                )
-            ]
-        )
-
-        fig.update_layout(
-            title=title,
-            xaxis_title="Amino Acid",
-            yaxis_title="Percentage (%)",
-            font=dict(size=12),
-            width=800,
-            height=400,
-        )
-
-        return fig
-
-    def plot_hydrophobicity_profile(
-        self, sequence: str, window_size: int = 9, title: str = "Hydrophobicity Profile"
-    ) -> go.Figure:
-        """
-        Plot hydrophobicity profile along protein sequence
-
-        Args:
-            sequence: Protein sequence string
-            window_size: Window size for calculation
-            title: Plot title
-
-        Returns:
-            Plotly figure object
-        """
-        if not sequence or len(sequence) < window_size:
-            fig = go.Figure()
-            fig.add_annotation(
-                text="Sequence too short for analysis",
-                xref="paper",
-                yref="paper",
-                x=0.5,
-                y=0.5,
-                showarrow=False,
-            )
-            return fig
-
-        # Clean sequence
-        sequence = re.sub(r"[^ACDEFGHIKLMNPQRSTVWY]", "", sequence.upper())
-
-        if len(sequence) < window_size:
-            fig = go.Figure()
-            fig.add_annotation(
-                text="Cleaned sequence too short",
-                xref="paper",
-                yref="paper",
-                x=0.5,
-                y=0.5,
-                showarrow=False,
-            )
-            return fig
-
-        try:
-            # Calculate hydrophobicity manually to avoid BioPython issue
-            kyte_doolittle = {
-                "A": 1.8,
-                "R": -4.5,
-                "N": -3.5,
-                "D": -3.5,
-                "C": 2.5,
-                "Q": -3.5,
-                "E": -3.5,
-                "G": -0.4,
-                "H": -3.2,
-                "I": 4.5,
-                "L": 3.8,
-                "K": -3.9,
-                "M": 1.9,
-                "F": 2.8,
-                "P": -1.6,
-                "S": -0.8,
-                "T": -0.7,
-                "W": -0.9,
-                "Y": -1.3,
-                "V": 4.2,
-            }
-
-            hydrophobicity = []
-            positions = []
-
-            for i in range(len(sequence) - window_size + 1):
-                window_seq = sequence[i : i + window_size]
-                hydro_sum = sum(kyte_doolittle.get(aa, 0) for aa in window_seq)
-                hydrophobicity.append(hydro_sum / window_size)
-                positions.append(i + window_size // 2 + 1)
-
-            fig = go.Figure()
-            fig.add_trace(
-                go.Scatter(
-                    x=positions,
-                    y=hydrophobicity,
-                    mode="lines",
-                    line=dict(color="#FF6B6B", width=2),
-                    fill="tozeroy",
-                    name="Hydrophobicity",
-                )
-            )
-
-            # Add zero line
-            fig.add_hline(
-                y=0, line_dash="dash", line_color="black", annotation_text="Neutral"
-            )
-
-            fig.update_layout(
-                title=title,
-                xaxis_title="Position",
-                yaxis_title="Hydrophobicity Index",
-                font=dict(size=12),
-                width=800,
-                height=400,
-            )
-
-            return fig
-
-        except Exception as e:
-            fig = go.Figure()
-            fig.add_annotation(
-                text=f"Error calculating hydrophobicity: {str(e)}",
-                xref="paper",
-                yref="paper",
-                x=0.5,
-                y=0.5,
-                showarrow=False,
-            )
-            return fig
-
-    def create_sequence_comparison_plot(
-        self, sequences: Dict[str, str], title: str = "Sequence Comparison"
-    ) -> go.Figure:
-        """
-        Create a visual comparison of multiple sequences
-
-        Args:
-            sequences: Dictionary with sequence names as keys and sequences as values
-            title: Plot title
-
-        Returns:
-            Plotly figure object
-        """
-        if not sequences:
-            fig = go.Figure()
-            fig.add_annotation(
-                text="No sequences to compare",
-                xref="paper",
-                yref="paper",
-                x=0.5,
-                y=0.5,
-                showarrow=False,
-            )
-            return fig
-
-        # Create subplots for each sequence
-        seq_names = list(sequences.keys())
-        n_sequences = len(seq_names)
-
-        fig = make_subplots(
-            rows=n_sequences, cols=1, subplot_titles=seq_names, vertical_spacing=0.1
-        )
-
-        for i, (name, sequence) in enumerate(sequences.items(), 1):
-            if sequence:
-                composition = self.analyze_nucleotide_composition(sequence)
-                nucleotides = ["A", "T", "G", "C"]
-                values = [composition.get(n, 0) for n in nucleotides]
-                colors = [self.colors[n] for n in nucleotides]
-
-                fig.add_trace(
-                    go.Bar(
-                        x=nucleotides,
-                        y=values,
-                        marker_color=colors,
-                        name=name,
-                        showlegend=i == 1,
-                    ),
-                    row=i,
-                    col=1,
-                )
-
-        fig.update_layout(title=title, height=200 * n_sequences, font=dict(size=10))
-
-        return fig
-
-    def plot_gene_structure(
-        self, gene_data: Dict, title: str = "Gene Structure"
-    ) -> go.Figure:
-        """
-        Visualize gene structure with exons, introns, and features
-
-        Args:
-            gene_data: Dictionary containing gene information
-            title: Plot title
-
-        Returns:
-            Plotly figure object
-        """
-        fig = go.Figure()
-
-        if not gene_data:
-            fig.add_annotation(
-                text="No gene data available",
-                xref="paper",
-                yref="paper",
-                x=0.5,
-                y=0.5,
-                showarrow=False,
-            )
-            return fig
-
-        # Basic gene structure
-        start = gene_data.get("start_position", 0)
-        end = gene_data.get("end_position", 1000)
-
-        # Gene body
-        fig.add_shape(
-            type="rect",
-            x0=start,
-            y0=0.4,
-            x1=end,
-            y1=0.6,
-            fillcolor="lightblue",
-            line=dict(color="blue", width=2),
-        )
-
-        # Add gene information
-        fig.add_annotation(
-            x=(start + end) / 2,
-            y=0.7,
-            text=f"Gene: {gene_data.get('gene_symbol', 'Unknown')}<br>"
-            f"Length: {end - start:,} bp<br>"
-            f"Type: {gene_data.get('gene_biotype', 'Unknown')}",
-            showarrow=False,
-            font=dict(size=12),
-        )
-
-        fig.update_layout(
-            title=title,
-            xaxis_title="Genomic Position (bp)",
-            yaxis=dict(visible=False),
-            showlegend=False,
-            height=200,
-            width=800,
-        )
-
-        return fig
-
-    def plot_dna_double_helix(
-        self,
-        sequence: str,
-        title: str = "DNA Double Helix Visualization",
-        max_length: int = 50,
-    ) -> go.Figure:
-        """
-        Create a 3D double helix visualization of DNA sequence
-
-        Args:
-            sequence: DNA sequence string
-            title: Plot title
-            max_length: Maximum sequence length to visualize
-
-        Returns:
-            Plotly figure object
-        """
-        if not sequence:
-            fig = go.Figure()
-            fig.add_annotation(
-                text="No sequence provided",
-                xref="paper",
-                yref="paper",
-                x=0.5,
-                y=0.5,
-                showarrow=False,
-            )
-            return fig
-
-        # Clean and limit sequence
-        sequence = sequence.upper().replace(" ", "").replace("\n", "")
-        sequence = re.sub(r"[^ATGC]", "", sequence)
-
-        if len(sequence) > max_length:
-            sequence = sequence[:max_length]
-
-        if not sequence:
-            fig = go.Figure()
-            fig.add_annotation(
-                text="No valid DNA bases found",
-                xref="paper",
-                yref="paper",
-                x=0.5,
-                y=0.5,
-                showarrow=False,
-            )
-            return fig
-
-        # Generate helix coordinates
-        n_bases = len(sequence)
-        t = np.linspace(0, 4 * np.pi * n_bases / 10, n_bases)
-
-        # Strand 1 (forward)
-        x1 = np.cos(t)
-        y1 = np.sin(t)
-        z1 = np.linspace(0, n_bases * 0.34, n_bases)  # 0.34 nm per base pair
-
-        # Strand 2 (reverse complement)
-        x2 = -np.cos(t)
-        y2 = -np.sin(t)
-        z2 = z1
-
-        # Base colors
-        base_colors = {"A": "#FF6B6B", "T": "#4ECDC4", "G": "#45B7D1", "C": "#FFA726"}
-        complement = {"A": "T", "T": "A", "G": "C", "C": "G"}
-
-        fig = go.Figure()
-
-        # Add backbone traces
-        fig.add_trace(
-            go.Scatter3d(
-                x=x1,
-                y=y1,
-                z=z1,
-                mode="lines+markers",
-                line=dict(color="gray", width=4),
-                marker=dict(size=3, color="gray"),
-                name="Strand 1 Backbone",
-                showlegend=True,
-            )
-        )
-
-        fig.add_trace(
-            go.Scatter3d(
-                x=x2,
-                y=y2,
-                z=z2,
-                mode="lines+markers",
-                line=dict(color="gray", width=4),
-                marker=dict(size=3, color="gray"),
-                name="Strand 2 Backbone",
-                showlegend=True,
-            )
-        )
-
-        # Add base pairs and connections
-        for i, base in enumerate(sequence):
-            comp_base = complement[base]
-            color = base_colors[base]
-            comp_color = base_colors[comp_base]
-
-            # Base markers
-            fig.add_trace(
-                go.Scatter3d(
-                    x=[x1[i]],
-                    y=[y1[i]],
-                    z=[z1[i]],
-                    mode="markers+text",
-                    marker=dict(size=8, color=color),
-                    text=base,
-                    textposition="middle center",
-                    name=f"Base {base}",
-                    showlegend=False,
-                )
-            )
-
-            fig.add_trace(
-                go.Scatter3d(
-                    x=[x2[i]],
-                    y=[y2[i]],
-                    z=[z2[i]],
-                    mode="markers+text",
-                    marker=dict(size=8, color=comp_color),
-                    text=comp_base,
-                    textposition="middle center",
-                    name=f"Base {comp_base}",
-                    showlegend=False,
-                )
-            )
-
-            # Hydrogen bonds between base pairs
-            fig.add_trace(
-                go.Scatter3d(
-                    x=[x1[i], x2[i]],
-                    y=[y1[i], y2[i]],
-                    z=[z1[i], z2[i]],
-                    mode="lines",
-                    line=dict(color="lightblue", width=2, dash="dash"),
-                    name="H-bonds",
-                    showlegend=False,
-                )
-            )
-
-        fig.update_layout(
-            title=f"{title}<br><sub>Sequence: {sequence[:20]}{'...' if len(sequence) > 20 else ''}</sub>",
-            scene=dict(
-                xaxis_title="X",
-                yaxis_title="Y",
-                zaxis_title="Z (Length)",
-                camera=dict(eye=dict(x=1.5, y=1.5, z=1.5)),
-            ),
-            width=800,
-            height=600,
-            showlegend=True,
-        )
-
-        return fig
-
-
-def create_genomic_overview_plot(df: pd.DataFrame) -> go.Figure:
-    """
-    Create an overview plot of genomic data distribution
-
-    Args:
-        df: DataFrame with genomic data
-
-    Returns:
-        Plotly figure object
-    """
-    if df.empty:
-        fig = go.Figure()
-        fig.add_annotation(
-            text="No data available",
-            xref="paper",
-            yref="paper",
-            x=0.5,
-            y=0.5,
-            showarrow=False,
-        )
-        return fig
-
-    # Create subplot based on available columns
-    if "species_name" in df.columns:
-        species_counts = df["species_name"].value_counts()
-
-        fig = go.Figure(
-            data=[
-                go.Bar(
-                    x=species_counts.index,
-                    y=species_counts.values,
-                    marker_color="lightblue",
-                )
-            ]
-        )
-
-        fig.update_layout(
-            title="Data Distribution by Species",
-            xaxis_title="Species",
-            yaxis_title="Count",
-            font=dict(size=12),
-        )
-    else:
-        fig = go.Figure()
-        fig.add_annotation(
-            text="Insufficient data for visualization",
-            xref="paper",
-            yref="paper",
-            x=0.5,
-            y=0.5,
-            showarrow=False,
-        )
-
-    return fig
-
-
-def create_protein_length_distribution(df: pd.DataFrame) -> go.Figure:
-    """
-    Create histogram of protein length distribution
-
-    Args:
-        df: DataFrame with protein data
-
-    Returns:
-        Plotly figure object
-    """
-    if df.empty or "protein_length" not in df.columns:
-        fig = go.Figure()
-        fig.add_annotation(
-            text="No protein length data available",
-            xref="paper",
-            yref="paper",
-            x=0.5,
-            y=0.5,
-            showarrow=False,
-        )
-        return fig
-
-    lengths = df["protein_length"].dropna()
-
-    if lengths.empty:
-        fig = go.Figure()
-        fig.add_annotation(
-            text="No valid protein length data",
-            xref="paper",
-            yref="paper",
-            x=0.5,
-            y=0.5,
-            showarrow=False,
-        )
-        return fig
-
-    fig = go.Figure(
-        data=[
-            go.Histogram(x=lengths, nbinsx=30, marker_color="lightgreen", opacity=0.7)
-        ]
-    )
-
-    fig.update_layout(
-        title="Protein Length Distribution",
-        xaxis_title="Protein Length (amino acids)",
-        yaxis_title="Frequency",
-        font=dict(size=12),
-    )
-
-    return fig
-
-
-def create_chromosome_gene_density_plot(df: pd.DataFrame) -> go.Figure:
-    """
-    Create a plot showing gene density across chromosomes
-
-    Args:
-        df: DataFrame with chromosome and gene data
-
-    Returns:
-        Plotly figure object
-    """
-    if df.empty or "chromosome_name" not in df.columns:
-        fig = go.Figure()
-        fig.add_annotation(
-            text="No chromosome data available",
-            xref="paper",
-            yref="paper",
-            x=0.5,
-            y=0.5,
-            showarrow=False,
-        )
-        return fig
-
-    chr_counts = df["chromosome_name"].value_counts().sort_index()
-
-    fig = go.Figure(
-        data=[go.Bar(x=chr_counts.index, y=chr_counts.values, marker_color="coral")]
-    )
-
-    fig.update_layout(
-        title="Gene Distribution Across Chromosomes",
-        xaxis_title="Chromosome",
-        yaxis_title="Number of Genes",
-        font=dict(size=12),
-        xaxis={"categoryorder": "category ascending"},
-    )
-
-    return fig
+"""
+DNA Visualization Module for Biocat Interface
+Provides visualization functions for DNA sequences, protein sequences, and genomic data
+"""
+
+import plotly.graph_objects as go
+
+import pandas as pd
+import numpy as np
+from typing import Dict, List, Any
+import hashlib
+import re
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+
+import warnings
+
+warnings.filterwarnings("ignore")
+
+# Numba turns the residue filter into compiled machine code; the
+# precompiled regex below is the fallback when it is not installed
+try:
+    import numba
+
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+@lru_cache(maxsize=1)
+def _protein_analysis_cls():
+    """Import Biopython on first protein analysis; it is off the hot
+    startup path and costs noticeable import time and memory"""
+    from Bio.SeqUtils.ProtParam import ProteinAnalysis
+
+    return ProteinAnalysis
+
+# Cached GC mask over byte codes (G/C upper and lower case) so composition
+# analysis can count bases with a single vectorized bincount pass
+_GC_MASK = np.zeros(256, dtype=np.uint8)
+_GC_MASK[[ord("G"), ord("C"), ord("g"), ord("c")]] = 1
+
+# Watson-Crick complement as a translate table (C-level, no per-base dict)
+_COMPLEMENT_TRANS = str.maketrans("ATGC", "TACG")
+
+# Uppercase-and-strip-whitespace in one bytes.translate pass; replaces the
+# upper().replace(" ", "") chain that allocated two strings per call
+_DNA_CLEAN_TABLE = bytes.maketrans(b"acgtun", b"ACGTUN")
+_DNA_DROP = b" \t\r\n"
+
+
+def _clean_dna_uncached(sequence: str) -> bytes:
+    return sequence.encode("ascii", "ignore").translate(
+        _DNA_CLEAN_TABLE, delete=_DNA_DROP
+    )
+
+
+_clean_dna_cached = lru_cache(maxsize=128)(_clean_dna_uncached)
+
+
+def _clean_dna(sequence: str) -> bytes:
+    """
+    Normalize a DNA string to uppercase bytes with whitespace removed
+
+    One allocation and one C-level translate pass; the result feeds
+    NumPy paths directly. Small inputs (the common interactive case) are
+    memoized; large sequences bypass the cache so it never pins them.
+    """
+    if len(sequence) <= 4096:
+        return _clean_dna_cached(sequence)
+    return _clean_dna_uncached(sequence)
+
+
+def _byte_counts(buf: bytes) -> np.ndarray:
+    """Count occurrences of every byte value in a buffer in one C pass"""
+    arr = np.frombuffer(buf, dtype=np.uint8)
+    return np.bincount(arr, minlength=256)
+
+
+# Below this length NumPy's per-call setup outweighs the vectorized scan;
+# bytes.count covers the same bases in a tight zero-allocation C loop.
+# Up to ~2 kbp the count path still wins, which covers most interactive
+# inputs
+_SHORT_SEQ_THRESHOLD = 2048
+
+# Compositions kept per sequence digest so the analysis handler and the
+# plots it renders afterwards count each sequence only once
+_COMPOSITION_CACHE_SIZE = 32
+
+# The 20 standard amino acids, plus their byte ordinals for indexing
+# bincount histograms of encoded sequences
+_AA_ALPHABET = "ACDEFGHIKLMNPQRSTVWY"
+_AA_ORDS = np.frombuffer(_AA_ALPHABET.encode("ascii"), dtype=np.uint8)
+
+# Residue-cleaning patterns compiled once at import; per-call re.sub with
+# a literal pattern re-hits the regex cache dict on every invocation
+_AA_CLEAN_RE = re.compile(rf"[^{_AA_ALPHABET}]")
+_AA_CLEAN_STOP_RE = re.compile(rf"[^{_AA_ALPHABET}*]")
+
+# 256-entry validity masks for the Numba filter, one per pattern above
+_AA_VALID = np.zeros(256, dtype=np.uint8)
+_AA_VALID[_AA_ORDS] = 1
+_AA_VALID_STOP = _AA_VALID.copy()
+_AA_VALID_STOP[ord("*")] = 1
+
+if NUMBA_AVAILABLE:
+
+    @numba.njit(cache=True)
+    def _filter_aa(arr: np.ndarray, valid: np.ndarray) -> np.ndarray:
+        """Copy the bytes of arr whose validity-mask entry is set"""
+        out = np.empty(len(arr), dtype=np.uint8)
+        cursor = 0
+        for byte in arr:
+            if valid[byte]:
+                out[cursor] = byte
+                cursor += 1
+        return out[:cursor]
+
+
+def _clean_protein(sequence: str, keep_stop: bool = False) -> str:
+    """
+    Strip everything but valid amino-acid codes from a sequence
+
+    Single compiled pass either way: a Numba byte scan against a 256-
+    entry validity mask when available, otherwise the precompiled regex.
+    """
+    sequence = sequence.upper()
+    if NUMBA_AVAILABLE:
+        arr = np.frombuffer(sequence.encode("ascii", "ignore"), dtype=np.uint8)
+        valid = _AA_VALID_STOP if keep_stop else _AA_VALID
+        return _filter_aa(arr, valid).tobytes().decode("ascii")
+    pattern = _AA_CLEAN_STOP_RE if keep_stop else _AA_CLEAN_RE
+    return pattern.sub("", sequence)
+
+
+# 2-bit base codes for the combined scan; non-ACGT bytes map to 4 so
+# they drop out of dinucleotide counting instead of aliasing a base
+_SCAN_LUT = np.full(256, 4, dtype=np.uint8)
+for _i, _base in enumerate("ACGT"):
+    _SCAN_LUT[ord(_base)] = _i
+    _SCAN_LUT[ord(_base.lower())] = _i
+
+if NUMBA_AVAILABLE:
+
+    @numba.njit(cache=True)
+    def _scan_counts(arr: np.ndarray, lut: np.ndarray):
+        """One sweep updating 4 mono and 16 dinucleotide counters"""
+        mono = np.zeros(4, dtype=np.int64)
+        di = np.zeros(16, dtype=np.int64)
+        if arr.size == 0:
+            return mono, di
+        prev = lut[arr[0]]
+        if prev < 4:
+            mono[prev] += 1
+        for i in range(1, arr.size):
+            cur = lut[arr[i]]
+            if cur < 4:
+                mono[cur] += 1
+                if prev < 4:
+                    di[prev * 4 + cur] += 1
+            prev = cur
+        return mono, di
+
+    # Warm-up so the first interactive call doesn't pay JIT compilation
+    _scan_counts(np.zeros(1, dtype=np.uint8), _SCAN_LUT)
+
+else:
+
+    def _scan_counts(arr: np.ndarray, lut: np.ndarray):
+        """Vectorized fallback for the combined mono/di counter"""
+        codes = lut[arr]
+        mono = np.bincount(codes, minlength=5)[:4].astype(np.int64)
+        di = np.zeros(16, dtype=np.int64)
+        if codes.size > 1:
+            left, right = codes[:-1], codes[1:]
+            valid = (left < 4) & (right < 4)
+            pair_ids = left[valid].astype(np.int64) * 4 + right[valid]
+            di = np.bincount(pair_ids, minlength=16).astype(np.int64)
+        return mono, di
+
+
+# Kyte-Doolittle hydropathy values, plus a 256-entry lookup table indexed
+# by ASCII code so a whole residue array can be scored with one fancy
+# index instead of a dict.get per residue
+_KYTE_DOOLITTLE = {
+    "A": 1.8,
+    "R": -4.5,
+    "N": -3.5,
+    "D": -3.5,
+    "C": 2.5,
+    "Q": -3.5,
+    "E": -3.5,
+    "G": -0.4,
+    "H": -3.2,
+    "I": 4.5,
+    "L": 3.8,
+    "K": -3.9,
+    "M": 1.9,
+    "F": 2.8,
+    "P": -1.6,
+    "S": -0.8,
+    "T": -0.7,
+    "W": -0.9,
+    "Y": -1.3,
+    "V": 4.2,
+}
+_KD_TABLE = np.zeros(256, dtype=np.float32)
+for _aa, _value in _KYTE_DOOLITTLE.items():
+    _KD_TABLE[ord(_aa)] = _value
+del _aa, _value
+
+
+def _hydropathy_profile(sequence: str, window_size: int) -> np.ndarray:
+    """
+    Mean Kyte-Doolittle hydropathy for every window of the sequence
+
+    One table gather scores all residues, and np.convolve with a uniform
+    kernel produces every window mean in a single pass — no per-window
+    Python loop or dict lookups.
+    """
+    residues = np.frombuffer(
+        sequence.encode("ascii", "ignore"), dtype=np.uint8
+    )
+    values = _KD_TABLE[residues]
+    kernel = np.full(window_size, 1.0 / window_size, dtype=np.float32)
+    return np.convolve(values, kernel, mode="valid")
+
+
+
+# Past this many points SVG scatter rendering dominates interaction
+# latency; traces switch to WebGL and get decimated to roughly canvas
+# resolution first
+_MAX_POINTS = 4000
+
+
+def _decimate(*arrays: np.ndarray):
+    """
+    Uniformly downsample parallel arrays to at most _MAX_POINTS points
+
+    A plot a few hundred pixels wide cannot show more distinct points
+    than that anyway; bounding the count keeps the JSON payload and the
+    client render proportional to the canvas, not the sequence.
+    """
+    length = len(arrays[0])
+    if length <= _MAX_POINTS:
+        return arrays
+    step = -(-length // _MAX_POINTS)
+    return tuple(arr[::step] for arr in arrays)
+
+
+def _decimate_minmax(x: np.ndarray, y: np.ndarray):
+    """
+    Downsample an (x, y) profile keeping per-bucket extremes
+
+    Uniform striding can drop narrow peaks and troughs, which for a
+    hydropathy profile are exactly the features being read. Splitting y
+    into buckets and keeping each bucket's min and max bounds the point
+    count like _decimate while preserving every local extreme at canvas
+    resolution.
+    """
+    length = len(y)
+    if length <= _MAX_POINTS:
+        return x, y
+
+    n_buckets = _MAX_POINTS // 2
+    bucket = -(-length // n_buckets)
+    usable = (length // bucket) * bucket
+    blocks = y[:usable].reshape(-1, bucket)
+    offsets = np.arange(0, usable, bucket)[:, None]
+    idx = np.concatenate(
+        [
+            (offsets + blocks.argmin(axis=1)[:, None]).ravel(),
+            (offsets + blocks.argmax(axis=1)[:, None]).ravel(),
+            np.arange(usable, length),
+        ]
+    )
+    idx = np.unique(idx)
+    return x[idx], y[idx]
+
+
+@lru_cache(maxsize=256)
+def _analyze_protein(sequence: str) -> Dict[str, Any]:
+    """
+    Run the full BioPython protein analysis for a cleaned sequence
+
+    Cached per sequence: interactive handlers re-trigger this with the
+    same input on every rerender, and flexibility() in particular is
+    expensive. Callers get the shared dict — copy before mutating.
+    """
+    try:
+        protein_analysis = _protein_analysis_cls()(sequence.replace("*", ""))
+
+        properties = {
+            "length": len(sequence),
+            "molecular_weight": protein_analysis.molecular_weight(),
+            "isoelectric_point": protein_analysis.isoelectric_point(),
+            "instability_index": protein_analysis.instability_index(),
+            "flexibility": np.mean(protein_analysis.flexibility())
+            if protein_analysis.flexibility()
+            else 0,
+        }
+
+        # Calculate hydrophobicity manually to avoid BioPython issue
+        if len(sequence) >= 9:
+            try:
+                properties["hydrophobicity"] = float(
+                    np.mean(_hydropathy_profile(sequence, 9))
+                )
+            except Exception:
+                properties["hydrophobicity"] = 0
+        else:
+            properties["hydrophobicity"] = 0
+
+        # Amino acid composition
+        aa_percent = protein_analysis.get_amino_acids_percent()
+        properties.update(
+            {f"aa_{aa}": percent * 100 for aa, percent in aa_percent.items()}
+        )
+
+        return properties
+
+    except Exception as e:
+        return {"length": len(sequence), "error": str(e)}
+
+
+# Prebuilt no-data placeholder layout; _empty_figure clones it per call so
+# the frequent empty-input early returns skip full figure construction
+_EMPTY_ANNOTATION = {
+    "xref": "paper",
+    "yref": "paper",
+    "x": 0.5,
+    "y": 0.5,
+    "showarrow": False,
+    "text": "",
+}
+
+
+def _empty_figure(message: str) -> go.Figure:
+    """
+    Build a placeholder figure showing a centered message
+
+    Args:
+        message: Text to display in the empty figure
+
+    Returns:
+        Plotly figure object with a single annotation
+    """
+    return go.Figure(
+        {
+            "data": [],
+            "layout": {"annotations": [{**_EMPTY_ANNOTATION, "text": message}]},
+        },
+        skip_invalid=True,
+    )
+
+
+# Shared color maps, built once at import instead of per instance
+_DEFAULT_COLOR = "#757575"  # Gray (for unknown)
+
+_NUC_COLORS = {
+    "A": "#FF6B6B",  # Red
+    "T": "#4ECDC4",  # Teal
+    "G": "#45B7D1",  # Blue
+    "C": "#FFA726",  # Orange
+    "U": "#9C27B0",  # Purple (for RNA)
+    "N": _DEFAULT_COLOR,
+}
+
+_AA_COLORS = {
+    "A": "#FF9999",
+    "R": "#FF6666",
+    "N": "#FF3333",
+    "D": "#FF0000",
+    "C": "#FFCC99",
+    "Q": "#FF9966",
+    "E": "#FF6633",
+    "G": "#FF3300",
+    "H": "#99FF99",
+    "I": "#66FF66",
+    "L": "#33FF33",
+    "K": "#00FF00",
+    "M": "#99FFFF",
+    "F": "#66FFFF",
+    "P": "#33FFFF",
+    "S": "#00FFFF",
+    "T": "#9999FF",
+    "W": "#6666FF",
+    "Y": "#3333FF",
+    "V": "#0000FF",
+    "*": "#000000",  # Stop codon
+}
+
+
+def _color_lut(color_map: Dict[str, str]) -> np.ndarray:
+    """Build a 256-slot byte-ordinal color LUT from a letter color map"""
+    lut = np.full(256, _DEFAULT_COLOR, dtype=object)
+    for letter, color in color_map.items():
+        lut[ord(letter)] = color
+    return lut
+
+
+# Ordinal-indexed LUTs: per-base colors come from one fancy-index gather
+# instead of a dict hash per base
+_NUC_COLOR_LUT = _color_lut(_NUC_COLORS)
+_AA_COLOR_LUT = _color_lut(_AA_COLORS)
+
+
+class DNAVisualizer:
+    """Class for visualizing DNA and protein sequences"""
+
+    def __init__(self):
+        self._composition_cache: "OrderedDict[bytes, Dict[str, float]]" = (
+            OrderedDict()
+        )
+        # Back-compat attributes; both reference the module-level maps
+        self.colors = _NUC_COLORS
+        self.amino_acid_colors = _AA_COLORS
+        # Canonical trace order and colors, precomputed once so plot
+        # methods index tuples instead of rebuilding per-call lists
+        self._nuc_order = ("A", "T", "G", "C")
+        self._nuc_colors = tuple(self.colors[n] for n in self._nuc_order)
+        # Shared layout template; update_layout merges it once instead of
+        # each plot re-stating the common font settings
+        self._template = go.layout.Template(layout=dict(font=dict(size=12)))
+
+    def analyze_nucleotide_composition(self, sequence: str) -> Dict[str, float]:
+        """
+        Analyze nucleotide composition of a DNA sequence
+
+        Results are memoized per sequence digest, so the composition and
+        GC plots rendered from the same sequence share one counting pass.
+
+        Args:
+            sequence: DNA sequence string
+
+        Returns:
+            Dictionary with nucleotide frequencies
+        """
+        if not sequence:
+            return {}
+
+        buf = _clean_dna(sequence)
+        total_length = len(buf)
+
+        cache_key = hashlib.blake2b(buf, digest_size=16).digest()
+        cached = self._composition_cache.get(cache_key)
+        if cached is not None:
+            self._composition_cache.move_to_end(cache_key)
+            return dict(cached)
+
+        composition = {}
+        if total_length < _SHORT_SEQ_THRESHOLD:
+            # Short-sequence fast path: a handful of bytes.count scans
+            # beat the fixed cost of setting up the NumPy kernels
+            for nucleotide in ["A", "T", "G", "C", "N"]:
+                count = buf.count(ord(nucleotide))
+                composition[nucleotide] = (
+                    (count / total_length) * 100 if total_length > 0 else 0
+                )
+            gc_count = buf.count(b"G") + buf.count(b"C")
+        else:
+            # One vectorized bincount replaces a per-nucleotide scan of
+            # the string
+            counts = _byte_counts(buf)
+            for nucleotide in ["A", "T", "G", "C", "N"]:
+                count = int(counts[ord(nucleotide)])
+                composition[nucleotide] = (
+                    (count / total_length) * 100 if total_length > 0 else 0
+                )
+            # Calculate GC content via the cached byte mask
+            gc_count = int(np.dot(counts, _GC_MASK))
+
+        composition["GC_content"] = (
+            (gc_count / total_length) * 100 if total_length > 0 else 0
+        )
+
+        self._composition_cache[cache_key] = composition
+        if len(self._composition_cache) > _COMPOSITION_CACHE_SIZE:
+            self._composition_cache.popitem(last=False)
+
+        return dict(composition)
+
+    def analyze_dinucleotide_composition(self, sequence: str) -> Dict[str, float]:
+        """
+        Analyze dinucleotide composition of a DNA sequence
+
+        Mono and dinucleotide counters are updated in a single sweep over
+        the byte array (a JIT-compiled loop when Numba is available, a
+        vectorized pair-id bincount otherwise); ambiguous bases break
+        pairs instead of aliasing a standard base.
+
+        Args:
+            sequence: DNA sequence string
+
+        Returns:
+            Dictionary mapping each of the 16 dinucleotides to its
+            frequency in percent of counted pairs
+        """
+        if not sequence:
+            return {}
+
+        arr = np.frombuffer(_clean_dna(sequence), dtype=np.uint8)
+        _, di = _scan_counts(arr, _SCAN_LUT)
+        total_pairs = int(di.sum())
+        if total_pairs == 0:
+            return {}
+
+        bases = "ACGT"
+        return {
+            bases[i] + bases[j]: int(di[i * 4 + j]) * 100.0 / total_pairs
+            for i in range(4)
+            for j in range(4)
+        }
+
+    def plot_nucleotide_composition(
+        self, sequence: str, title: str = "Nucleotide Composition"
+    ) -> go.Figure:
+        """
+        Create a pie chart showing nucleotide composition
+
+        Args:
+            sequence: DNA sequence string
+            title: Plot title
+
+        Returns:
+            Plotly figure object
+        """
+        composition = self.analyze_nucleotide_composition(sequence)
+
+        # Filter out zero values and N
+        filtered_comp = {
+            k: v
+            for k, v in composition.items()
+            if v > 0 and k not in ["GC_content", "N"]
+        }
+
+        if not filtered_comp:
+            return _empty_figure("No valid nucleotide data")
+
+        nucleotides = list(filtered_comp.keys())
+        percentages = list(filtered_comp.values())
+        colors = list(_NUC_COLOR_LUT[[ord(n) for n in nucleotides]])
+
+        fig = go.Figure(
+            data=[
+                go.Pie(
+                    labels=nucleotides,
+                    values=percentages,
+                    hole=0.4,
+                    marker_colors=colors,
+                    textinfo="label+percent",
+                    textfont_size=12,
+                )
+            ]
+        )
+
+        fig.update_layout(
+            title=f"{title}<br><sub>GC Content: {composition.get('GC_content', 0):.1f}%</sub>",
+            template=self._template,
+            font=dict(size=14),
+            showlegend=True,
+            width=500,
+            height=400,
+        )
+
+        return fig
+
+    def plot_sequence_logo(
+        self, sequences: List[str], title: str = "Sequence Logo"
+    ) -> go.Figure:
+        """
+        Create a sequence logo visualization for multiple aligned sequences
+
+        Args:
+            sequences: List of aligned DNA sequences
+            title: Plot title
+
+        Returns:
+            Plotly figure object
+        """
+        if not sequences or not sequences[0]:
+            return _empty_figure("No sequence data available")
+
+        # Position weight matrix over a byte matrix: one row per sequence,
+        # NUL-padded to equal length, so each base frequency is a single
+        # broadcast equality plus a column reduction instead of a Python
+        # Counter per position
+        seq_length = len(sequences[0])
+        mat = np.frombuffer(
+            b"".join(
+                seq.upper().encode("ascii", "ignore")[:seq_length].ljust(
+                    seq_length, b"\x00"
+                )
+                for seq in sequences
+            ),
+            dtype=np.uint8,
+        ).reshape(len(sequences), seq_length)
+
+        # Padding bytes mark positions a shorter sequence doesn't cover;
+        # frequencies are relative to per-position coverage, as before
+        coverage = np.maximum((mat != 0).sum(axis=0), 1)
+
+        nucleotides = self._nuc_order
+        heatmap_data = [
+            (mat == ord(nucleotide)).sum(axis=0) / coverage
+            for nucleotide in nucleotides
+        ]
+
+        fig = go.Figure(
+            data=go.Heatmap(
+                z=heatmap_data,
+                x=list(range(1, seq_length + 1)),
+                y=list(nucleotides),
+                colorscale="RdYlBu_r",
+                showscale=True,
+                colorbar=dict(title="Frequency"),
+            )
+        )
+
+        fig.update_layout(
+            title=title,
+            xaxis_title="Position",
+            yaxis_title="Nucleotide",
+            template=self._template,
+            width=800,
+            height=300,
+        )
+
+        return fig
+
+    def plot_gc_content_window(
+        self, sequence: str, window_size: int = 100, title: str = "GC Content"
+    ) -> go.Figure:
+        """
+        Plot GC content across a sequence using a sliding window
+
+        Args:
+            sequence: DNA sequence string
+            window_size: Size of sliding window
+            title: Plot title
+
+        Returns:
+            Plotly figure object
+        """
+        if not sequence or len(sequence) < window_size:
+            return _empty_figure("Sequence too short for analysis")
+
+        clean = _clean_dna(sequence)
+
+        # Prefix-sum over a GC flag array: each window's count is a single
+        # subtraction instead of an O(window) recount (O(N*W) -> O(N))
+        buf = np.frombuffer(clean, dtype=np.uint8)
+        cs = np.concatenate(([0], np.cumsum(_GC_MASK[buf], dtype=np.int64)))
+        window_gc = (cs[window_size:] - cs[:-window_size]) / window_size * 100
+
+        step = max(window_size // 4, 1)
+        gc_contents = window_gc[::step]
+        positions = (
+            np.arange(0, len(clean) - window_size + 1, step) + window_size // 2
+        )
+        positions, gc_contents = _decimate(positions, gc_contents)
+
+        fig = go.Figure(
+            data=go.Scattergl(
+                x=positions,
+                y=gc_contents,
+                mode="lines+markers",
+                line=dict(color="#2E86AB", width=2),
+                marker=dict(size=4, color="#F24236"),
+                name="GC Content",
+            )
+        )
+
+        # Add average line
+        avg_gc = np.mean(gc_contents)
+        fig.add_hline(
+            y=avg_gc,
+            line_dash="dash",
+            line_color="red",
+            annotation_text=f"Average: {avg_gc:.1f}%",
+        )
+
+        fig.update_layout(
+            title=f"{title} (Window size: {window_size}bp)",
+            xaxis_title="Position (bp)",
+            yaxis_title="GC Content (%)",
+            template=self._template,
+            width=800,
+            height=400,
+            showlegend=True,
+        )
+
+        return fig
+
+    def analyze_protein_properties(self, sequence: str) -> Dict[str, Any]:
+        """
+        Analyze protein sequence properties
+
+        The heavy BioPython analysis (molecular weight, pI, instability,
+        flexibility, full AA composition) is memoized per cleaned
+        sequence, so the composition and hydrophobicity plots rendered
+        from the same protein don't recompute it.
+
+        Args:
+            sequence: Protein sequence string
+
+        Returns:
+            Dictionary with protein properties
+        """
+        if not sequence:
+            return {}
+
+        # Clean sequence
+        sequence = _clean_protein(sequence, keep_stop=True)
+
+        if not sequence:
+            return {}
+
+        return dict(_analyze_protein(sequence))
+
+    def plot_amino_acid_composition(
+        self, sequence: str, title: str = "Amino Acid Composition"
+    ) -> go.Figure:
+        """
+        Create a bar plot showing amino acid composition
+
+        Args:
+            sequence: Protein sequence string
+            title: Plot title
+
+        Returns:
+            Plotly figure object
+        """
+        # One bincount over the cleaned byte array replaces both the
+        # BioPython percentage loop and the Counter fallback
+        clean_seq = _clean_protein(sequence) if sequence else ""
+        if not clean_seq:
+            return _empty_figure("No valid amino acid data found")
+
+        arr = np.frombuffer(clean_seq.encode("ascii"), dtype=np.uint8)
+        counts = np.bincount(arr, minlength=256)
+        total = int(counts[_AA_ORDS].sum())
+        aa_data = {
+            aa: int(counts[ord(aa)]) * 100.0 / total
+            for aa in _AA_ALPHABET
+            if counts[ord(aa)]
+        }
+
+        amino_acids = list(aa_data.keys())
+        percentages = list(aa_data.values())
+        colors = list(_AA_COLOR_LUT[[ord(aa) for aa in amino_acids]])
+
+        fig = go.Figure(
+            data=[
+                go.Bar(
+                    x=amino_acids,
+                    y=percentages,
+                    marker_color=colors,
+                    text=[f"{p:.1f}%" for p in percentages],
+                    textposition="auto",
+                )
+            ]
+        )
+
+        fig.update_layout(
+            title=title,
+            xaxis_title="Amino Acid",
+            yaxis_title="Percentage (%)",
+            template=self._template,
+            width=800,
+            height=400,
+        )
+
+        return fig
+
+    def plot_hydrophobicity_profile(
+        self, sequence: str, window_size: int = 9, title: str = "Hydrophobicity Profile"
+    ) -> go.Figure:
+        """
+        Plot hydrophobicity profile along protein sequence
+
+        Args:
+            sequence: Protein sequence string
+            window_size: Window size for calculation
+            title: Plot title
+
+        Returns:
+            Plotly figure object
+        """
+        if not sequence or len(sequence) < window_size:
+            return _empty_figure("Sequence too short for analysis")
+
+        # Clean sequence
+        sequence = _clean_protein(sequence)
+
+        if len(sequence) < window_size:
+            return _empty_figure("Cleaned sequence too short")
+
+        try:
+            # Calculate hydrophobicity manually to avoid BioPython issue
+            hydrophobicity = _hydropathy_profile(sequence, window_size)
+            positions = np.arange(
+                window_size // 2 + 1,
+                window_size // 2 + 1 + len(hydrophobicity),
+            )
+            positions, hydrophobicity = _decimate_minmax(positions, hydrophobicity)
+
+            fig = go.Figure()
+            fig.add_trace(
+                go.Scattergl(
+                    x=positions,
+                    y=hydrophobicity,
+                    mode="lines",
+                    line=dict(color="#FF6B6B", width=2),
+                    fill="tozeroy",
+                    name="Hydrophobicity",
+                )
+            )
+
+            # Add zero line
+            fig.add_hline(
+                y=0, line_dash="dash", line_color="black", annotation_text="Neutral"
+            )
+
+            fig.update_layout(
+                title=title,
+                xaxis_title="Position",
+                yaxis_title="Hydrophobicity Index",
+                template=self._template,
+                width=800,
+                height=400,
+            )
+
+            return fig
+
+        except Exception as e:
+            return _empty_figure(f"Error calculating hydrophobicity: {str(e)}")
+
+    def create_sequence_comparison_plot(
+        self, sequences: Dict[str, str], title: str = "Sequence Comparison"
+    ) -> go.Figure:
+        """
+        Create a visual comparison of multiple sequences
+
+        Args:
+            sequences: Dictionary with sequence names as keys and sequences as values
+            title: Plot title
+
+        Returns:
+            Plotly figure object
+        """
+        if not sequences:
+            return _empty_figure("No sequences to compare")
+
+        # One grouped Bar trace per nucleotide (four total, regardless of
+        # how many sequences are compared) instead of a subplot row and
+        # trace per sequence; trace count is what drives Plotly's
+        # serialization and render cost
+        seq_names = list(sequences.keys())
+        if len(seq_names) > 1:
+            # Compositions are independent and the counting kernels
+            # release the GIL, so N sequences count in parallel
+            with ThreadPoolExecutor(
+                max_workers=min(8, len(seq_names))
+            ) as executor:
+                compositions = list(
+                    executor.map(
+                        self.analyze_nucleotide_composition,
+                        (sequences[name] for name in seq_names),
+                    )
+                )
+        else:
+            compositions = [
+                self.analyze_nucleotide_composition(sequences[seq_names[0]])
+            ]
+
+        fig = go.Figure()
+        for nucleotide, color in zip(self._nuc_order, self._nuc_colors):
+            fig.add_trace(
+                go.Bar(
+                    x=seq_names,
+                    y=[comp.get(nucleotide, 0) for comp in compositions],
+                    marker_color=color,
+                    name=nucleotide,
+                )
+            )
+
+        fig.update_layout(
+            title=title,
+            barmode="group",
+            xaxis_title="Sequence",
+            yaxis_title="Composition (%)",
+            height=400,
+            template=self._template,
+            font=dict(size=10),
+        )
+
+        return fig
+
+    def plot_gene_structure(
+        self, gene_data: Dict, title: str = "Gene Structure"
+    ) -> go.Figure:
+        """
+        Visualize gene structure with exons, introns, and features
+
+        Args:
+            gene_data: Dictionary containing gene information
+            title: Plot title
+
+        Returns:
+            Plotly figure object
+        """
+        if not gene_data:
+            return _empty_figure("No gene data available")
+
+        fig = go.Figure()
+
+        # Basic gene structure
+        start = gene_data.get("start_position", 0)
+        end = gene_data.get("end_position", 1000)
+
+        # Gene body
+        fig.add_shape(
+            type="rect",
+            x0=start,
+            y0=0.4,
+            x1=end,
+            y1=0.6,
+            fillcolor="lightblue",
+            line=dict(color="blue", width=2),
+        )
+
+        # Add gene information
+        fig.add_annotation(
+            x=(start + end) / 2,
+            y=0.7,
+            text=f"Gene: {gene_data.get('gene_symbol', 'Unknown')}<br>"
+            f"Length: {end - start:,} bp<br>"
+            f"Type: {gene_data.get('gene_biotype', 'Unknown')}",
+            showarrow=False,
+            font=dict(size=12),
+        )
+
+        fig.update_layout(
+            title=title,
+            xaxis_title="Genomic Position (bp)",
+            yaxis=dict(visible=False),
+            template=self._template,
+            showlegend=False,
+            height=200,
+            width=800,
+        )
+
+        return fig
+
+    def plot_dna_double_helix(
+        self,
+        sequence: str,
+        title: str = "DNA Double Helix Visualization",
+        max_length: int = 50,
+    ) -> go.Figure:
+        """
+        Create a 3D double helix visualization of DNA sequence
+
+        Args:
+            sequence: DNA sequence string
+            title: Plot title
+            max_length: Maximum sequence length to visualize
+
+        Returns:
+            Plotly figure object
+        """
+        if not sequence:
+            return _empty_figure("No sequence provided")
+
+        # Clean and limit sequence
+        sequence = re.sub(r"[^ATGC]", "", _clean_dna(sequence).decode("ascii"))
+
+        if len(sequence) > max_length:
+            sequence = sequence[:max_length]
+
+        if not sequence:
+            return _empty_figure("No valid DNA bases found")
+
+        # Generate helix coordinates
+        n_bases = len(sequence)
+        t = np.linspace(0, 4 * np.pi * n_bases / 10, n_bases)
+
+        # Strand 1 (forward)
+        x1 = np.cos(t)
+        y1 = np.sin(t)
+        z1 = np.linspace(0, n_bases * 0.34, n_bases)  # 0.34 nm per base pair
+
+        # Strand 2 (reverse complement)
+        x2 = -np.cos(t)
+        y2 = -np.sin(t)
+        z2 = z1
+
+        # Per-base colors via one LUT gather over the encoded bytes
+        comp_sequence = sequence.translate(_COMPLEMENT_TRANS)
+        seq_colors = _NUC_COLOR_LUT[
+            np.frombuffer(sequence.encode("ascii"), dtype=np.uint8)
+        ]
+        comp_colors = _NUC_COLOR_LUT[
+            np.frombuffer(comp_sequence.encode("ascii"), dtype=np.uint8)
+        ]
+
+        fig = go.Figure()
+
+        # Add backbone traces
+        fig.add_trace(
+            go.Scatter3d(
+                x=x1,
+                y=y1,
+                z=z1,
+                mode="lines+markers",
+                line=dict(color="gray", width=4),
+                marker=dict(size=3, color="gray"),
+                name="Strand 1 Backbone",
+                showlegend=True,
+            )
+        )
+
+        fig.add_trace(
+            go.Scatter3d(
+                x=x2,
+                y=y2,
+                z=z2,
+                mode="lines+markers",
+                line=dict(color="gray", width=4),
+                marker=dict(size=3, color="gray"),
+                name="Strand 2 Backbone",
+                showlegend=True,
+            )
+        )
+
+        # Add base pairs and connections as three batched traces instead
+        # of three traces per base; NaN gaps break the H-bond line between
+        # pairs so plotly draws disjoint segments from a single trace
+        fig.add_trace(
+            go.Scatter3d(
+                x=x1,
+                y=y1,
+                z=z1,
+                mode="markers+text",
+                marker=dict(size=8, color=seq_colors),
+                text=list(sequence),
+                textposition="middle center",
+                name="Strand 1 Bases",
+                showlegend=False,
+            )
+        )
+
+        fig.add_trace(
+            go.Scatter3d(
+                x=x2,
+                y=y2,
+                z=z2,
+                mode="markers+text",
+                marker=dict(size=8, color=comp_colors),
+                text=list(comp_sequence),
+                textposition="middle center",
+                name="Strand 2 Bases",
+                showlegend=False,
+            )
+        )
+
+        gap = np.full(n_bases, np.nan)
+        fig.add_trace(
+            go.Scatter3d(
+                x=np.column_stack((x1, x2, gap)).ravel(),
+                y=np.column_stack((y1, y2, gap)).ravel(),
+                z=np.column_stack((z1, z2, gap)).ravel(),
+                mode="lines",
+                line=dict(color="lightblue", width=2, dash="dash"),
+                name="H-bonds",
+                showlegend=False,
+            )
+        )
+
+        fig.update_layout(
+            title=f"{title}<br><sub>Sequence: {sequence[:20]}{'...' if len(sequence) > 20 else ''}</sub>",
+            scene=dict(
+                xaxis_title="X",
+                yaxis_title="Y",
+                zaxis_title="Z (Length)",
+                camera=dict(eye=dict(x=1.5, y=1.5, z=1.5)),
+            ),
+            width=800,
+            height=600,
+            showlegend=True,
+        )
+
+        return fig
+
+
+def create_genomic_overview_plot(df: pd.DataFrame) -> go.Figure:
+    """
+    Create an overview plot of genomic data distribution
+
+    Args:
+        df: DataFrame with genomic data
+
+    Returns:
+        Plotly figure object
+    """
+    if df.empty:
+        return _empty_figure("No data available")
+
+    # Create subplot based on available columns
+    if "species_name" in df.columns:
+        # groupby with observed=True / sort=False counts without
+        # materializing unobserved categories or a final sort pass;
+        # the single sort_values orders the bars
+        species_counts = (
+            df.groupby("species_name", observed=True, sort=False)
+            .size()
+            .sort_values(ascending=False)
+        )
+
+        fig = go.Figure(
+            data=[
+                go.Bar(
+                    x=species_counts.index.to_numpy(),
+                    y=species_counts.to_numpy(),
+                    marker_color="lightblue",
+                )
+            ]
+        )
+
+        fig.update_layout(
+            title="Data Distribution by Species",
+            xaxis_title="Species",
+            yaxis_title="Count",
+            font=dict(size=12),
+        )
+    else:
+        fig = _empty_figure("Insufficient data for visualization")
+
+    return fig
+
+
+def create_protein_length_distribution(df: pd.DataFrame) -> go.Figure:
+    """
+    Create histogram of protein length distribution
+
+    Args:
+        df: DataFrame with protein data
+
+    Returns:
+        Plotly figure object
+    """
+    if df.empty or "protein_length" not in df.columns:
+        return _empty_figure("No protein length data available")
+
+    lengths = df["protein_length"].dropna().to_numpy()
+
+    if len(lengths) == 0:
+        return _empty_figure("No valid protein length data")
+
+    if len(lengths) < 1000:
+        # Small payloads: let Plotly bin client-side as before
+        trace = go.Histogram(
+            x=lengths, nbinsx=30, marker_color="lightgreen", opacity=0.7
+        )
+    else:
+        # Bin in NumPy and ship 30 bars instead of N raw values; the
+        # front-end renders precomputed bars without re-binning
+        counts, edges = np.histogram(lengths, bins=30)
+        centers = 0.5 * (edges[:-1] + edges[1:])
+        trace = go.Bar(
+            x=centers,
+            y=counts,
+            width=np.diff(edges),
+            marker_color="lightgreen",
+            opacity=0.7,
+        )
+
+    fig = go.Figure(data=[trace])
+
+    fig.update_layout(
+        title="Protein Length Distribution",
+        xaxis_title="Protein Length (amino acids)",
+        yaxis_title="Frequency",
+        font=dict(size=12),
+    )
+
+    return fig
+
+
+def create_chromosome_gene_density_plot(df: pd.DataFrame) -> go.Figure:
+    """
+    Create a plot showing gene density across chromosomes
+
+    Args:
+        df: DataFrame with chromosome and gene data
+
+    Returns:
+        Plotly figure object
+    """
+    if df.empty or "chromosome_name" not in df.columns:
+        return _empty_figure("No chromosome data available")
+
+    chr_counts = (
+        df.groupby("chromosome_name", observed=True, sort=False).size().sort_index()
+    )
+
+    fig = go.Figure(
+        data=[
+            go.Bar(
+                x=chr_counts.index.to_numpy(),
+                y=chr_counts.to_numpy(),
+                marker_color="coral",
+            )
+        ]
+    )
+
+    fig.update_layout(
+        title="Gene Distribution Across Chromosomes",
+        xaxis_title="Chromosome",
+        yaxis_title="Number of Genes",
+        font=dict(size=12),
+        xaxis={"categoryorder": "category ascending"},
+    )
+
+    return fig
@@ -0,0 +1,70 @@
+"""
+Fast FASTA Parsing for Biocat Interface
+Slices records out of an mmap with NumPy instead of per-record Python
+object parsing; sequence bytes feed straight into the analysis kernels
+"""
+
+import mmap
+from typing import Iterator, Tuple
+
+import numpy as np
+
+_GT = ord(">")
+_LF = ord("\n")
+_CR = ord("\r")
+
+
+def iter_records(path: str) -> Iterator[Tuple[bytes, np.ndarray]]:
+    """
+    Iterate over the records of a FASTA file
+
+    The whole file is memory-mapped and record boundaries are located
+    with one vectorized pass over the raw bytes, so no Python-level
+    line loop or per-record object graph is built.
+
+    Args:
+        path: Path to the FASTA file
+
+    Yields:
+        Tuples of (header bytes without the leading '>', sequence as a
+        uint8 array with newlines stripped); decode the sequence with
+        .tobytes().decode() or hand it to the 2-bit packer directly
+    """
+    with open(path, "rb") as handle:
+        if handle.seek(0, 2) == 0:
+            return
+        handle.seek(0)
+
+        mapped = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+        buf = starts = bounds = block = body = None
+        try:
+            buf = np.frombuffer(mapped, dtype=np.uint8)
+
+            # '>' bytes that start a line begin a record
+            starts = np.flatnonzero(buf == _GT)
+            starts = starts[(starts == 0) | (buf[starts - 1] == _LF)]
+            bounds = np.append(starts, len(buf))
+
+            for begin, end in zip(bounds[:-1], bounds[1:]):
+                block = buf[begin:end]
+
+                newlines = np.flatnonzero(block == _LF)
+                if len(newlines) == 0:
+                    # Header with no sequence lines
+                    yield block[1:].tobytes().rstrip(b"\r"), np.empty(
+                        0, dtype=np.uint8
+                    )
+                    continue
+
+                header_end = int(newlines[0])
+                header = block[1:header_end].tobytes().rstrip(b"\r")
+
+                body = block[header_end + 1 :]
+                # Fancy indexing copies, so the yielded array outlives
+                # the mapping
+                yield header, body[(body != _LF) & (body != _CR)]
+        finally:
+            # Drop every view into the map before closing it, otherwise
+            # mmap.close() raises BufferError on exported pointers
+            buf = starts = bounds = block = body = None
+            mapped.close()
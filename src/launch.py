@@ -19,17 +19,27 @@ def main():
     try:
         from app import create_interface
 
+        # Same config fallback as app.py; max_threads sizes Gradio's
+        # worker pool so concurrent users run their DB-bound handlers in
+        # parallel against the connection pool instead of queueing behind
+        # one blocking call
+        try:
+            from config import INTERFACE_CONFIG
+        except ImportError:
+            INTERFACE_CONFIG = {}
+
         print("Launching web interface...")
         print("Opening in your default web browser at: http://localhost:7860")
         print("Press Ctrl+C to stop the server")
 
         app = create_interface()
         app.launch(
-            server_name="0.0.0.0",
-            server_port=7860,
-            share=False,
+            server_name=INTERFACE_CONFIG.get("server_name", "0.0.0.0"),
+            server_port=INTERFACE_CONFIG.get("server_port", 7860),
+            share=INTERFACE_CONFIG.get("share", False),
             inbrowser=True,
             quiet=False,
+            max_threads=INTERFACE_CONFIG.get("max_threads", 40),
         )
 
     except ImportError as e:
@@ -0,0 +1,75 @@
+"""
+Client-side DNA Pattern Matching for Biocat Interface
+Finds all occurrences of one or more patterns in fetched sequences
+"""
+
+from functools import lru_cache
+from typing import Dict, List, Tuple
+
+from bm_search import bmh_search_all
+
+# Aho-Corasick gives a single O(N) pass for any number of patterns; fall
+# back to repeated C-level str.find when the extension is not installed
+try:
+    import ahocorasick
+
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+
+@lru_cache(maxsize=32)
+def _build_automaton(patterns: Tuple[str, ...]):
+    """Build (and cache) an Aho-Corasick automaton for a pattern tuple"""
+    automaton = ahocorasick.Automaton()
+    for pattern in patterns:
+        automaton.add_word(pattern, pattern)
+    automaton.make_automaton()
+    return automaton
+
+
+def _find_with_str_find(sequence: str, pattern: str) -> List[int]:
+    """Find all (overlapping) occurrences of one pattern via str.find"""
+    positions = []
+    start = sequence.find(pattern)
+    while start != -1:
+        positions.append(start)
+        start = sequence.find(pattern, start + 1)
+    return positions
+
+
+def find_pattern_positions(
+    sequence: str, patterns: Tuple[str, ...]
+) -> Dict[str, List[int]]:
+    """
+    Find all occurrences of the given patterns in a sequence
+
+    Args:
+        sequence: DNA sequence string to scan
+        patterns: Tuple of patterns to search for
+
+    Returns:
+        Dictionary mapping each pattern to its list of 0-based positions
+    """
+    if not sequence or not patterns:
+        return {pattern: [] for pattern in patterns}
+
+    # Single pattern is the common case: Boyer-Moore-Horspool skips up to
+    # len(pattern) bytes per mismatch, beating the O(N) automaton walk
+    if len(patterns) == 1:
+        pattern = patterns[0]
+        positions = bmh_search_all(
+            sequence.encode("ascii", "ignore"), pattern.encode("ascii", "ignore")
+        )
+        return {pattern: positions}
+
+    if AHOCORASICK_AVAILABLE:
+        automaton = _build_automaton(tuple(patterns))
+        positions = {pattern: [] for pattern in patterns}
+        for end_index, pattern in automaton.iter(sequence):
+            positions[pattern].append(end_index - len(pattern) + 1)
+        return positions
+
+    return {
+        pattern: _find_with_str_find(sequence, pattern) for pattern in patterns
+    }
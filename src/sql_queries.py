@@ -1,516 +1,876 @@
-"""
-SQL Queries for Biocat Database Interface
-Contains predefined useful queries for exploring biological data
-"""
-
-# Basic Statistics and Overview Queries
-BASIC_STATS_QUERIES = {
-    "database_overview": """
-        SELECT
-            'Species' as table_name, COUNT(*) as record_count
-        FROM species
-        UNION ALL
-        SELECT 'Genes', COUNT(*) FROM gene
-        UNION ALL
-        SELECT 'Transcripts', COUNT(*) FROM transcript
-        UNION ALL
-        SELECT 'Proteins', COUNT(*) FROM protein
-        UNION ALL
-        SELECT 'Chromosomes', COUNT(*) FROM chromosome
-        UNION ALL
-        SELECT 'Genetic Variants', COUNT(*) FROM genetic_variant
-        UNION ALL
-        SELECT 'GO Annotations', COUNT(*) FROM gene_go_annotation
-        ORDER BY record_count DESC;
-    """,
-    "species_summary": """
-        SELECT
-            s.species_name,
-            s.common_name,
-            COUNT(DISTINCT g.gene_id) as gene_count,
-            COUNT(DISTINCT t.transcript_id) as transcript_count,
-            COUNT(DISTINCT p.protein_id) as protein_count
-        FROM species s
-        LEFT JOIN gene g ON s.species_id = g.species_id
-        LEFT JOIN transcript t ON g.gene_id = t.gene_id
-        LEFT JOIN protein p ON t.transcript_id = p.transcript_id
-        GROUP BY s.species_id, s.species_name, s.common_name
-        ORDER BY gene_count DESC;
-    """,
-    "chromosome_stats": """
-        SELECT
-            s.species_name,
-            c.chromosome_name,
-            c.sequence_length,
-            COUNT(g.gene_id) as gene_count,
-            ROUND(COUNT(g.gene_id) / (c.sequence_length / 1000000), 2) as genes_per_mb
-        FROM species s
-        JOIN genome_assembly ga ON s.species_id = ga.species_id
-        JOIN chromosome c ON ga.assembly_id = c.assembly_id
-        LEFT JOIN gene g ON c.chromosome_id = g.chromosome_id
-        WHERE c.sequence_length IS NOT NULL
-        GROUP BY s.species_name, c.chromosome_name, c.sequence_length
-        ORDER BY s.species_name, c.chromosome_name;
-    """,
-}
-
-# Gene and Transcript Analysis Queries
-GENE_QUERIES = {
-    "genes_by_biotype": """
-        SELECT
-            s.species_name,
-            g.gene_biotype,
-            COUNT(*) as gene_count,
-            ROUND(AVG(g.end_position - g.start_position + 1), 0) as avg_length
-        FROM gene g
-        JOIN species s ON g.species_id = s.species_id
-        WHERE g.gene_biotype IS NOT NULL
-        GROUP BY s.species_name, g.gene_biotype
-        ORDER BY s.species_name, gene_count DESC;
-    """,
-    "longest_genes": """
-        SELECT
-            s.species_name,
-            g.gene_symbol,
-            g.gene_name,
-            g.gene_biotype,
-            c.chromosome_name,
-            (g.end_position - g.start_position + 1) as gene_length,
-            g.start_position,
-            g.end_position
-        FROM gene g
-        JOIN species s ON g.species_id = s.species_id
-        LEFT JOIN chromosome c ON g.chromosome_id = c.chromosome_id
-        WHERE g.start_position IS NOT NULL AND g.end_position IS NOT NULL
-        ORDER BY gene_length DESC
-        LIMIT 50;
-    """,
-    "genes_with_multiple_transcripts": """
-        SELECT
-            s.species_name,
-            g.gene_symbol,
-            g.gene_name,
-            COUNT(t.transcript_id) as transcript_count,
-            GROUP_CONCAT(t.transcript_biotype) as transcript_types
-        FROM gene g
-        JOIN species s ON g.species_id = s.species_id
-        JOIN transcript t ON g.gene_id = t.gene_id
-        GROUP BY g.gene_id, s.species_name, g.gene_symbol, g.gene_name
-        HAVING transcript_count > 1
-        ORDER BY transcript_count DESC;
-    """,
-    "gene_search": """
-        SELECT
-            s.species_name,
-            g.gene_symbol,
-            g.gene_name,
-            g.gene_description,
-            g.gene_biotype,
-            c.chromosome_name,
-            g.start_position,
-            g.end_position,
-            (g.end_position - g.start_position + 1) as gene_length
-        FROM gene g
-        JOIN species s ON g.species_id = s.species_id
-        LEFT JOIN chromosome c ON g.chromosome_id = c.chromosome_id
-        WHERE (g.gene_symbol LIKE %s OR g.gene_name LIKE %s OR g.gene_description LIKE %s)
-        ORDER BY s.species_name, g.gene_symbol;
-    """,
-}
-
-# Protein Analysis Queries
-PROTEIN_QUERIES = {
-    "protein_length_distribution": """
-        SELECT
-            s.species_name,
-            CASE
-                WHEN p.protein_length < 100 THEN 'Very Short (<100 AA)'
-                WHEN p.protein_length < 300 THEN 'Short (100-299 AA)'
-                WHEN p.protein_length < 600 THEN 'Medium (300-599 AA)'
-                WHEN p.protein_length < 1000 THEN 'Long (600-999 AA)'
-                ELSE 'Very Long (≥1000 AA)'
-            END as length_category,
-            COUNT(*) as protein_count,
-            ROUND(AVG(p.protein_length), 0) as avg_length
-        FROM protein p
-        JOIN transcript t ON p.transcript_id = t.transcript_id
-        JOIN gene g ON t.gene_id = g.gene_id
-        JOIN species s ON g.species_id = s.species_id
-        WHERE p.protein_length IS NOT NULL
-        GROUP BY s.species_name, length_category
-        ORDER BY s.species_name, avg_length;
-    """,
-    "largest_proteins": """
-        SELECT
-            s.species_name,
-            g.gene_symbol,
-            g.gene_name,
-            p.protein_stable_id,
-            p.protein_length,
-            p.molecular_weight,
-            p.isoelectric_point
-        FROM protein p
-        JOIN transcript t ON p.transcript_id = t.transcript_id
-        JOIN gene g ON t.gene_id = g.gene_id
-        JOIN species s ON g.species_id = s.species_id
-        WHERE p.protein_length IS NOT NULL
-        ORDER BY p.protein_length DESC
-        LIMIT 30;
-    """,
-    "protein_properties": """
-        SELECT
-            s.species_name,
-            COUNT(*) as total_proteins,
-            ROUND(AVG(p.protein_length), 0) as avg_length,
-            ROUND(AVG(p.molecular_weight), 2) as avg_molecular_weight,
-            ROUND(AVG(p.isoelectric_point), 2) as avg_isoelectric_point,
-            MIN(p.protein_length) as min_length,
-            MAX(p.protein_length) as max_length
-        FROM protein p
-        JOIN transcript t ON p.transcript_id = t.transcript_id
-        JOIN gene g ON t.gene_id = g.gene_id
-        JOIN species s ON g.species_id = s.species_id
-        WHERE p.protein_length IS NOT NULL
-        GROUP BY s.species_name
-        ORDER BY total_proteins DESC;
-    """,
-}
-
-# Sequence Analysis Queries
-SEQUENCE_QUERIES = {
-    "analyze_sequences": """
-        SELECT
-            g.gene_symbol,
-            g.gene_name,
-            LEFT(p.protein_sequence, 50) as sequence_start,
-            p.protein_length,
-            classify_sequence(p.protein_sequence) as classification
-        FROM protein p
-        JOIN transcript t ON p.transcript_id = t.transcript_id
-        JOIN gene g ON t.gene_id = g.gene_id
-        WHERE p.protein_sequence IS NOT NULL
-        LIMIT 20;
-    """,
-    "nucleotide_composition": """
-        SELECT
-            g.gene_symbol,
-            g.gene_name,
-            LEFT(p.protein_sequence, 100) as sequence_sample,
-            count_nucleotides(p.protein_sequence) as nucleotide_counts
-        FROM protein p
-        JOIN transcript t ON p.transcript_id = t.transcript_id
-        JOIN gene g ON t.gene_id = g.gene_id
-        WHERE p.protein_sequence IS NOT NULL
-        LIMIT 10;
-    """,
-    "dna_sequence_analysis": """
-        SELECT
-            g.gene_symbol,
-            g.gene_name,
-            s.species_name,
-            LEFT(g.dna_sequence, 60) as sequence_preview,
-            LENGTH(g.dna_sequence) as sequence_length,
-            classify_sequence(g.dna_sequence) as sequence_type,
-            count_nucleotides(g.dna_sequence) as nucleotide_composition
-        FROM gene g
-        JOIN species s ON g.species_id = s.species_id
-        WHERE g.dna_sequence IS NOT NULL
-        AND LENGTH(g.dna_sequence) > 30
-        ORDER BY sequence_length DESC
-        LIMIT 15;
-    """,
-    "compare_transcript_sequences": """
-        SELECT
-            g.gene_symbol,
-            t1.transcript_id as transcript1_id,
-            t2.transcript_id as transcript2_id,
-            LEFT(t1.cdna_sequence, 50) as seq1_preview,
-            LEFT(t2.cdna_sequence, 50) as seq2_preview,
-            LENGTH(t1.cdna_sequence) as seq1_length,
-            LENGTH(t2.cdna_sequence) as seq2_length,
-            detect_mutations(t1.cdna_sequence, t2.cdna_sequence) as sequence_differences
-        FROM gene g
-        JOIN transcript t1 ON g.gene_id = t1.gene_id
-        JOIN transcript t2 ON g.gene_id = t2.gene_id
-        WHERE t1.transcript_id < t2.transcript_id
-        AND t1.cdna_sequence IS NOT NULL
-        AND t2.cdna_sequence IS NOT NULL
-        AND LENGTH(t1.cdna_sequence) > 50
-        AND LENGTH(t2.cdna_sequence) > 50
-        LIMIT 10;
-    """,
-    "gene_classification_summary": """
-        SELECT
-            s.species_name,
-            classify_sequence(g.dna_sequence) as sequence_classification,
-            COUNT(*) as gene_count,
-            AVG(LENGTH(g.dna_sequence)) as avg_sequence_length,
-            MIN(LENGTH(g.dna_sequence)) as min_length,
-            MAX(LENGTH(g.dna_sequence)) as max_length
-        FROM gene g
-        JOIN species s ON g.species_id = s.species_id
-        WHERE g.dna_sequence IS NOT NULL
-        GROUP BY s.species_name, classify_sequence(g.dna_sequence)
-        ORDER BY s.species_name, gene_count DESC;
-    """,
-    "dna_sequence_detection": """
-        SELECT
-            TABLE_NAME,
-            COLUMN_NAME,
-            DATA_TYPE,
-            CHARACTER_MAXIMUM_LENGTH
-        FROM INFORMATION_SCHEMA.COLUMNS
-        WHERE TABLE_SCHEMA = DATABASE()
-        AND (COLUMN_NAME LIKE '%seq%' OR COLUMN_NAME LIKE '%dna%' OR COLUMN_NAME LIKE '%rna%')
-        AND DATA_TYPE IN ('text', 'longtext', 'mediumtext', 'varchar')
-        ORDER BY TABLE_NAME, COLUMN_NAME;
-    """,
-    "check_sequence_content": """
-        SELECT
-            'chromosome' as table_name,
-            'sequence' as column_name,
-            COUNT(*) as total_rows,
-            COUNT(sequence) as non_null_rows,
-            AVG(LENGTH(sequence)) as avg_length,
-            MAX(LENGTH(sequence)) as max_length,
-            MIN(LENGTH(sequence)) as min_length
-        FROM chromosome
-        WHERE sequence IS NOT NULL AND sequence != ''
-        UNION ALL
-        SELECT
-            'gene' as table_name,
-            'dna_sequence' as column_name,
-            COUNT(*) as total_rows,
-            COUNT(dna_sequence) as non_null_rows,
-            AVG(LENGTH(dna_sequence)) as avg_length,
-            MAX(LENGTH(dna_sequence)) as max_length,
-            MIN(LENGTH(dna_sequence)) as min_length
-        FROM gene
-        WHERE dna_sequence IS NOT NULL AND dna_sequence != ''
-        UNION ALL
-        SELECT
-            'transcript' as table_name,
-            'cdna_sequence' as column_name,
-            COUNT(*) as total_rows,
-            COUNT(cdna_sequence) as non_null_rows,
-            AVG(LENGTH(cdna_sequence)) as avg_length,
-            MAX(LENGTH(cdna_sequence)) as max_length,
-            MIN(LENGTH(cdna_sequence)) as min_length
-        FROM transcript
-        WHERE cdna_sequence IS NOT NULL AND cdna_sequence != '';
-    """,
-    "sample_dna_sequences": """
-        SELECT
-            g.gene_symbol,
-            g.gene_name,
-            s.species_name,
-            LEFT(g.dna_sequence, 100) as sequence_preview,
-            LENGTH(g.dna_sequence) as sequence_length
-        FROM gene g
-        JOIN species s ON g.species_id = s.species_id
-        WHERE g.dna_sequence IS NOT NULL
-        AND LENGTH(g.dna_sequence) > 50
-        ORDER BY RAND()
-        LIMIT 10;
-    """,
-    "validate_dna_bases": """
-        SELECT
-            g.gene_symbol,
-            LENGTH(g.dna_sequence) as length,
-            LENGTH(g.dna_sequence) - LENGTH(REPLACE(REPLACE(REPLACE(REPLACE(UPPER(g.dna_sequence), 'A', ''), 'T', ''), 'C', ''), 'G', '')) as valid_bases,
-            ROUND((LENGTH(g.dna_sequence) - LENGTH(REPLACE(REPLACE(REPLACE(REPLACE(UPPER(g.dna_sequence), 'A', ''), 'T', ''), 'C', ''), 'G', ''))) / LENGTH(g.dna_sequence) * 100, 2) as percent_valid
-        FROM gene g
-        WHERE g.dna_sequence IS NOT NULL
-        AND LENGTH(g.dna_sequence) > 20
-        HAVING percent_valid > 80
-        ORDER BY percent_valid DESC
-        LIMIT 20;
-    """,
-}
-
-# Comparative Analysis Queries
-COMPARATIVE_QUERIES = {
-    "species_comparison": """
-        SELECT
-            s1.species_name as species_1,
-            s2.species_name as species_2,
-            o.orthology_type,
-            COUNT(*) as ortholog_count,
-            ROUND(AVG(o.percentage_identity), 2) as avg_identity,
-            ROUND(AVG(o.dn_ds_ratio), 4) as avg_dn_ds
-        FROM ortholog o
-        JOIN gene g1 ON o.gene_a_id = g1.gene_id
-        JOIN gene g2 ON o.gene_b_id = g2.gene_id
-        JOIN species s1 ON g1.species_id = s1.species_id
-        JOIN species s2 ON g2.species_id = s2.species_id
-        WHERE s1.species_id != s2.species_id
-        GROUP BY s1.species_name, s2.species_name, o.orthology_type
-        ORDER BY ortholog_count DESC;
-    """,
-    "cross_species_genes": """
-        SELECT
-            g1.gene_symbol,
-            s1.species_name as species_1,
-            s2.species_name as species_2,
-            o.orthology_type,
-            o.percentage_identity,
-            o.dn_ds_ratio
-        FROM ortholog o
-        JOIN gene g1 ON o.gene_a_id = g1.gene_id
-        JOIN gene g2 ON o.gene_b_id = g2.gene_id
-        JOIN species s1 ON g1.species_id = s1.species_id
-        JOIN species s2 ON g2.species_id = s2.species_id
-        WHERE g1.gene_symbol IS NOT NULL
-        AND o.percentage_identity IS NOT NULL
-        ORDER BY o.percentage_identity DESC
-        LIMIT 30;
-    """,
-}
-
-# Functional Annotation Queries
-ANNOTATION_QUERIES = {
-    "go_term_distribution": """
-        SELECT
-            go.go_namespace,
-            COUNT(DISTINCT gga.gene_id) as annotated_genes,
-            COUNT(*) as total_annotations
-        FROM gene_go_annotation gga
-        JOIN gene_ontology go ON gga.go_id = go.go_id
-        GROUP BY go.go_namespace
-        ORDER BY annotated_genes DESC;
-    """,
-    "top_go_terms": """
-        SELECT
-            go.go_id,
-            go.go_name,
-            go.go_namespace,
-            COUNT(gga.gene_id) as gene_count
-        FROM gene_go_annotation gga
-        JOIN gene_ontology go ON gga.go_id = go.go_id
-        GROUP BY go.go_id, go.go_name, go.go_namespace
-        ORDER BY gene_count DESC
-        LIMIT 20;
-    """,
-    "genes_by_go_term": """
-        SELECT
-            s.species_name,
-            g.gene_symbol,
-            g.gene_name,
-            go.go_name,
-            go.go_namespace,
-            gga.evidence_code
-        FROM gene_go_annotation gga
-        JOIN gene g ON gga.gene_id = g.gene_id
-        JOIN species s ON g.species_id = s.species_id
-        JOIN gene_ontology go ON gga.go_id = go.go_id
-        WHERE go.go_id = %s OR go.go_name LIKE %s
-        ORDER BY s.species_name, g.gene_symbol;
-    """,
-}
-
-# Genomic Variation Queries
-VARIATION_QUERIES = {
-    "variant_types": """
-        SELECT
-            s.species_name,
-            gv.variant_type,
-            COUNT(*) as variant_count,
-            ROUND(AVG(gv.minor_allele_frequency), 4) as avg_maf
-        FROM genetic_variant gv
-        JOIN chromosome c ON gv.chromosome_id = c.chromosome_id
-        JOIN genome_assembly ga ON c.assembly_id = ga.assembly_id
-        JOIN species s ON ga.species_id = s.species_id
-        GROUP BY s.species_name, gv.variant_type
-        ORDER BY s.species_name, variant_count DESC;
-    """,
-    "clinical_variants": """
-        SELECT
-            s.species_name,
-            c.chromosome_name,
-            gv.variant_name,
-            gv.variant_type,
-            gv.clinical_significance,
-            gv.start_position,
-            gv.minor_allele_frequency
-        FROM genetic_variant gv
-        JOIN chromosome c ON gv.chromosome_id = c.chromosome_id
-        JOIN genome_assembly ga ON c.assembly_id = ga.assembly_id
-        JOIN species s ON ga.species_id = s.species_id
-        WHERE gv.clinical_significance IS NOT NULL
-        AND gv.clinical_significance != ''
-        ORDER BY s.species_name, c.chromosome_name, gv.start_position;
-    """,
-}
-
-# Custom Query Templates
-QUERY_TEMPLATES = {
-    "gene_region_search": """
-        SELECT
-            s.species_name,
-            g.gene_symbol,
-            g.gene_name,
-            c.chromosome_name,
-            g.start_position,
-            g.end_position,
-            (g.end_position - g.start_position + 1) as gene_length
-        FROM gene g
-        JOIN species s ON g.species_id = s.species_id
-        LEFT JOIN chromosome c ON g.chromosome_id = c.chromosome_id
-        WHERE c.chromosome_name = %s
-        AND g.start_position >= %s
-        AND g.end_position <= %s
-        ORDER BY g.start_position;
-    """,
-    "protein_length_range": """
-        SELECT
-            s.species_name,
-            g.gene_symbol,
-            g.gene_name,
-            p.protein_stable_id,
-            p.protein_length,
-            p.molecular_weight
-        FROM protein p
-        JOIN transcript t ON p.transcript_id = t.transcript_id
-        JOIN gene g ON t.gene_id = g.gene_id
-        JOIN species s ON g.species_id = s.species_id
-        WHERE p.protein_length BETWEEN %s AND %s
-        ORDER BY p.protein_length DESC;
-    """,
-}
-
-# All query categories grouped together
-ALL_QUERIES = {
-    "Basic Statistics": BASIC_STATS_QUERIES,
-    "Gene Analysis": GENE_QUERIES,
-    "Protein Analysis": PROTEIN_QUERIES,
-    "Sequence Analysis": SEQUENCE_QUERIES,
-    "Comparative Analysis": COMPARATIVE_QUERIES,
-    "Functional Annotation": ANNOTATION_QUERIES,
-    "Genomic Variation": VARIATION_QUERIES,
-    "Custom Templates": QUERY_TEMPLATES,
-}
-
-
-def get_query_categories():
-    """Return list of available query categories"""
-    return list(ALL_QUERIES.keys())
-
-
-def get_queries_in_category(category):
-    """Return all queries in a specific category"""
-    return ALL_QUERIES.get(category, {})
-
-
-def get_query(category, query_name):
-    """Get a specific query by category and name"""
-    category_queries = ALL_QUERIES.get(category, {})
-    return category_queries.get(query_name, "")
-
-
-def get_all_query_names():
-    """Return all query names across all categories"""
-    all_names = []
-    for category, queries in ALL_QUERIES.items():
-        for query_name in queries.keys():
-            all_names.append(f"{category}: {query_name}")
-    return all_names
+"""
+SQL Queries for Biocat Database Interface
+Contains predefined useful queries for exploring biological data
+"""
+
+import time
+from collections import OrderedDict
+
+# Basic Statistics and Overview Queries
+BASIC_STATS_QUERIES = {
+    "database_overview": """
+        SELECT table_name, record_count
+        FROM db_counts
+        ORDER BY record_count DESC;
+    """,
+    "database_overview_full": """
+        SELECT
+            'Species' as table_name, COUNT(*) as record_count
+        FROM species
+        UNION ALL
+        SELECT 'Genes', COUNT(*) FROM gene
+        UNION ALL
+        SELECT 'Transcripts', COUNT(*) FROM transcript
+        UNION ALL
+        SELECT 'Proteins', COUNT(*) FROM protein
+        UNION ALL
+        SELECT 'Chromosomes', COUNT(*) FROM chromosome
+        UNION ALL
+        SELECT 'Genetic Variants', COUNT(*) FROM genetic_variant
+        UNION ALL
+        SELECT 'GO Annotations', COUNT(*) FROM gene_go_annotation
+        ORDER BY record_count DESC;
+    """,
+    "species_summary": """
+        SELECT
+            s.species_name,
+            s.common_name,
+            scc.gene_count,
+            scc.transcript_count,
+            scc.protein_count
+        FROM species s
+        JOIN species_counts_cache scc ON s.species_id = scc.species_id
+        ORDER BY scc.gene_count DESC;
+    """,
+    "species_summary_live": """
+        SELECT
+            s.species_name,
+            s.common_name,
+            COALESCE(gc.gene_count, 0) as gene_count,
+            COALESCE(tc.transcript_count, 0) as transcript_count,
+            COALESCE(pc.protein_count, 0) as protein_count
+        FROM species s
+        LEFT JOIN (
+            SELECT species_id, COUNT(*) as gene_count
+            FROM gene
+            GROUP BY species_id
+        ) gc ON s.species_id = gc.species_id
+        LEFT JOIN (
+            SELECT g.species_id, COUNT(*) as transcript_count
+            FROM transcript t
+            JOIN gene g ON t.gene_id = g.gene_id
+            GROUP BY g.species_id
+        ) tc ON s.species_id = tc.species_id
+        LEFT JOIN (
+            SELECT g.species_id, COUNT(*) as protein_count
+            FROM protein p
+            JOIN transcript t ON p.transcript_id = t.transcript_id
+            JOIN gene g ON t.gene_id = g.gene_id
+            GROUP BY g.species_id
+        ) pc ON s.species_id = pc.species_id
+        ORDER BY gene_count DESC;
+    """,
+    "chromosome_stats": """
+        SELECT
+            s.species_name,
+            c.chromosome_name,
+            c.sequence_length,
+            COUNT(g.gene_id) as gene_count,
+            ROUND(COUNT(g.gene_id) / (c.sequence_length / 1000000), 2) as genes_per_mb
+        FROM species s
+        JOIN genome_assembly ga ON s.species_id = ga.species_id
+        JOIN chromosome c ON ga.assembly_id = c.assembly_id
+        LEFT JOIN gene g ON c.chromosome_id = g.chromosome_id
+        WHERE c.sequence_length IS NOT NULL
+        GROUP BY s.species_name, c.chromosome_name, c.sequence_length
+        ORDER BY s.species_name, c.chromosome_name;
+    """,
+}
+
+# The three overview queries the dashboard wants together. Joined into
+# one semicolon-separated batch they cost a single network round-trip
+# via BiocatDatabase.execute_multi_df instead of three.
+DASHBOARD_QUERY_NAMES = ("database_overview", "species_summary", "chromosome_stats")
+DASHBOARD_BATCH = "\n".join(
+    BASIC_STATS_QUERIES[name].strip() for name in DASHBOARD_QUERY_NAMES
+)
+
+# Gene and Transcript Analysis Queries
+GENE_QUERIES = {
+    "genes_by_biotype": """
+        SELECT
+            s.species_name,
+            g.gene_biotype,
+            COUNT(*) as gene_count,
+            ROUND(AVG(g.gene_length), 0) as avg_length
+        FROM gene g
+        JOIN species s ON g.species_id = s.species_id
+        WHERE g.gene_biotype IS NOT NULL
+        GROUP BY s.species_name, g.gene_biotype
+        ORDER BY s.species_name, gene_count DESC;
+    """,
+    # *_full variants compute lengths from the baseline columns for
+    # installs that have not run sql/generated_columns.sql
+    "genes_by_biotype_full": """
+        SELECT
+            s.species_name,
+            g.gene_biotype,
+            COUNT(*) as gene_count,
+            ROUND(AVG(g.end_position - g.start_position + 1), 0) as avg_length
+        FROM gene g
+        JOIN species s ON g.species_id = s.species_id
+        WHERE g.gene_biotype IS NOT NULL
+        GROUP BY s.species_name, g.gene_biotype
+        ORDER BY s.species_name, gene_count DESC;
+    """,
+    "longest_genes": """
+        SELECT
+            s.species_name,
+            g.gene_symbol,
+            g.gene_name,
+            g.gene_biotype,
+            c.chromosome_name,
+            g.gene_length,
+            g.start_position,
+            g.end_position
+        FROM gene g
+        JOIN species s ON g.species_id = s.species_id
+        LEFT JOIN chromosome c ON g.chromosome_id = c.chromosome_id
+        WHERE g.gene_length IS NOT NULL
+        ORDER BY g.gene_length DESC
+        LIMIT 50;
+    """,
+    "longest_genes_full": """
+        SELECT
+            s.species_name,
+            g.gene_symbol,
+            g.gene_name,
+            g.gene_biotype,
+            c.chromosome_name,
+            (g.end_position - g.start_position + 1) as gene_length,
+            g.start_position,
+            g.end_position
+        FROM gene g
+        JOIN species s ON g.species_id = s.species_id
+        LEFT JOIN chromosome c ON g.chromosome_id = c.chromosome_id
+        WHERE g.start_position IS NOT NULL AND g.end_position IS NOT NULL
+        ORDER BY gene_length DESC
+        LIMIT 50;
+    """,
+    "genes_with_multiple_transcripts": """
+        SELECT
+            s.species_name,
+            g.gene_symbol,
+            g.gene_name,
+            tc.transcript_count,
+            tc.transcript_types
+        FROM (
+            SELECT
+                gene_id,
+                COUNT(*) as transcript_count,
+                GROUP_CONCAT(transcript_biotype) as transcript_types
+            FROM transcript
+            GROUP BY gene_id
+            HAVING COUNT(*) > 1
+        ) tc
+        JOIN gene g ON tc.gene_id = g.gene_id
+        JOIN species s ON g.species_id = s.species_id
+        ORDER BY tc.transcript_count DESC;
+    """,
+    "gene_search": """
+        SELECT
+            s.species_name,
+            g.gene_symbol,
+            g.gene_name,
+            g.gene_description,
+            g.gene_biotype,
+            c.chromosome_name,
+            g.start_position,
+            g.end_position,
+            g.gene_length
+        FROM gene g
+        JOIN species s ON g.species_id = s.species_id
+        LEFT JOIN chromosome c ON g.chromosome_id = c.chromosome_id
+        WHERE (g.gene_symbol LIKE %s OR g.gene_name LIKE %s OR g.gene_description LIKE %s)
+        ORDER BY s.species_name, g.gene_symbol;
+    """,
+}
+
+# Protein Analysis Queries
+PROTEIN_QUERIES = {
+    "protein_length_distribution": """
+        SELECT
+            s.species_name,
+            lb.label as length_category,
+            COUNT(*) as protein_count,
+            ROUND(AVG(p.protein_length), 0) as avg_length
+        FROM protein p
+        JOIN length_buckets lb
+            ON p.protein_length >= lb.lo AND p.protein_length < lb.hi
+        JOIN transcript t ON p.transcript_id = t.transcript_id
+        JOIN gene g ON t.gene_id = g.gene_id
+        JOIN species s ON g.species_id = s.species_id
+        WHERE p.protein_length IS NOT NULL
+        GROUP BY s.species_name, lb.sort_order, lb.label
+        ORDER BY s.species_name, lb.sort_order;
+    """,
+    # Baseline CASE-ladder variant for installs without the
+    # length_buckets table from sql/length_buckets.sql
+    "protein_length_distribution_full": """
+        SELECT
+            s.species_name,
+            CASE
+                WHEN p.protein_length < 100 THEN 'Very Short (<100 AA)'
+                WHEN p.protein_length < 300 THEN 'Short (100-299 AA)'
+                WHEN p.protein_length < 600 THEN 'Medium (300-599 AA)'
+                WHEN p.protein_length < 1000 THEN 'Long (600-999 AA)'
+                ELSE 'Very Long (≥1000 AA)'
+            END as length_category,
+            COUNT(*) as protein_count,
+            ROUND(AVG(p.protein_length), 0) as avg_length
+        FROM protein p
+        JOIN transcript t ON p.transcript_id = t.transcript_id
+        JOIN gene g ON t.gene_id = g.gene_id
+        JOIN species s ON g.species_id = s.species_id
+        WHERE p.protein_length IS NOT NULL
+        GROUP BY s.species_name, length_category
+        ORDER BY s.species_name, avg_length;
+    """,
+    "largest_proteins": """
+        SELECT
+            s.species_name,
+            g.gene_symbol,
+            g.gene_name,
+            p.protein_stable_id,
+            p.protein_length,
+            p.molecular_weight,
+            p.isoelectric_point
+        FROM protein p
+        JOIN transcript t ON p.transcript_id = t.transcript_id
+        JOIN gene g ON t.gene_id = g.gene_id
+        JOIN species s ON g.species_id = s.species_id
+        WHERE p.protein_length IS NOT NULL
+        ORDER BY p.protein_length DESC
+        LIMIT 30;
+    """,
+    "protein_properties": """
+        SELECT
+            s.species_name,
+            COUNT(*) as total_proteins,
+            ROUND(AVG(p.protein_length), 0) as avg_length,
+            ROUND(AVG(p.molecular_weight), 2) as avg_molecular_weight,
+            ROUND(AVG(p.isoelectric_point), 2) as avg_isoelectric_point,
+            MIN(p.protein_length) as min_length,
+            MAX(p.protein_length) as max_length
+        FROM protein p
+        JOIN transcript t ON p.transcript_id = t.transcript_id
+        JOIN gene g ON t.gene_id = g.gene_id
+        JOIN species s ON g.species_id = s.species_id
+        WHERE p.protein_length IS NOT NULL
+        GROUP BY s.species_name
+        ORDER BY total_proteins DESC;
+    """,
+}
+
+# Sequence Analysis Queries
+SEQUENCE_QUERIES = {
+    "analyze_sequences": """
+        SELECT
+            g.gene_symbol,
+            g.gene_name,
+            LEFT(p.protein_sequence, 50) as sequence_start,
+            p.protein_length,
+            classify_sequence(p.protein_sequence) as classification
+        FROM protein p
+        JOIN transcript t ON p.transcript_id = t.transcript_id
+        JOIN gene g ON t.gene_id = g.gene_id
+        WHERE p.protein_sequence IS NOT NULL
+        LIMIT 20;
+    """,
+    "nucleotide_composition": """
+        SELECT
+            g.gene_symbol,
+            g.gene_name,
+            LEFT(p.protein_sequence, 100) as sequence_sample,
+            count_nucleotides(p.protein_sequence) as nucleotide_counts
+        FROM protein p
+        JOIN transcript t ON p.transcript_id = t.transcript_id
+        JOIN gene g ON t.gene_id = g.gene_id
+        WHERE p.protein_sequence IS NOT NULL
+        LIMIT 10;
+    """,
+    "dna_sequence_analysis": """
+        SELECT
+            g.gene_symbol,
+            g.gene_name,
+            s.species_name,
+            LEFT(g.dna_sequence, 60) as sequence_preview,
+            g.dna_len as sequence_length,
+            classify_sequence(g.dna_sequence) as sequence_type,
+            count_nucleotides(g.dna_sequence) as nucleotide_composition
+        FROM gene g
+        JOIN species s ON g.species_id = s.species_id
+        WHERE g.dna_sequence IS NOT NULL
+        AND g.dna_len > 30
+        ORDER BY sequence_length DESC
+        LIMIT 15;
+    """,
+    # Baseline variant: LENGTH() over the LONGTEXT blob instead of the
+    # stored dna_len column from sql/generated_columns.sql
+    "dna_sequence_analysis_full": """
+        SELECT
+            g.gene_symbol,
+            g.gene_name,
+            s.species_name,
+            LEFT(g.dna_sequence, 60) as sequence_preview,
+            LENGTH(g.dna_sequence) as sequence_length,
+            classify_sequence(g.dna_sequence) as sequence_type,
+            count_nucleotides(g.dna_sequence) as nucleotide_composition
+        FROM gene g
+        JOIN species s ON g.species_id = s.species_id
+        WHERE g.dna_sequence IS NOT NULL
+        AND LENGTH(g.dna_sequence) > 30
+        ORDER BY sequence_length DESC
+        LIMIT 15;
+    """,
+    "compare_transcript_sequences": """
+        WITH ranked AS (
+            SELECT
+                gene_id,
+                transcript_id,
+                cdna_sequence,
+                ROW_NUMBER() OVER (
+                    PARTITION BY gene_id ORDER BY transcript_id
+                ) as rn
+            FROM transcript
+            WHERE cdna_sequence IS NOT NULL
+            AND LENGTH(cdna_sequence) > 50
+        )
+        SELECT
+            g.gene_symbol,
+            t1.transcript_id as transcript1_id,
+            t2.transcript_id as transcript2_id,
+            LEFT(t1.cdna_sequence, 50) as seq1_preview,
+            LEFT(t2.cdna_sequence, 50) as seq2_preview,
+            LENGTH(t1.cdna_sequence) as seq1_length,
+            LENGTH(t2.cdna_sequence) as seq2_length,
+            detect_mutations(t1.cdna_sequence, t2.cdna_sequence) as sequence_differences
+        FROM ranked t1
+        JOIN ranked t2 ON t1.gene_id = t2.gene_id AND t2.rn = t1.rn + 1
+        JOIN gene g ON t1.gene_id = g.gene_id
+        LIMIT 10;
+    """,
+    "gene_classification_summary": """
+        SELECT
+            s.species_name,
+            g.seq_class as sequence_classification,
+            COUNT(*) as gene_count,
+            AVG(g.dna_len) as avg_sequence_length,
+            MIN(g.dna_len) as min_length,
+            MAX(g.dna_len) as max_length
+        FROM gene g
+        JOIN species s ON g.species_id = s.species_id
+        WHERE g.dna_sequence IS NOT NULL
+        GROUP BY s.species_name, g.seq_class
+        ORDER BY s.species_name, gene_count DESC;
+    """,
+    # Baseline variant: classify_sequence() per row instead of the
+    # stored seq_class column from sql/generated_columns.sql
+    "gene_classification_summary_full": """
+        SELECT
+            s.species_name,
+            classify_sequence(g.dna_sequence) as sequence_classification,
+            COUNT(*) as gene_count,
+            AVG(LENGTH(g.dna_sequence)) as avg_sequence_length,
+            MIN(LENGTH(g.dna_sequence)) as min_length,
+            MAX(LENGTH(g.dna_sequence)) as max_length
+        FROM gene g
+        JOIN species s ON g.species_id = s.species_id
+        WHERE g.dna_sequence IS NOT NULL
+        GROUP BY s.species_name, classify_sequence(g.dna_sequence)
+        ORDER BY s.species_name, gene_count DESC;
+    """,
+    "dna_sequence_detection": """
+        SELECT
+            TABLE_NAME,
+            COLUMN_NAME,
+            DATA_TYPE,
+            CHARACTER_MAXIMUM_LENGTH
+        FROM INFORMATION_SCHEMA.COLUMNS
+        WHERE TABLE_SCHEMA = DATABASE()
+        AND (COLUMN_NAME LIKE '%seq%' OR COLUMN_NAME LIKE '%dna%' OR COLUMN_NAME LIKE '%rna%')
+        AND DATA_TYPE IN ('text', 'longtext', 'mediumtext', 'varchar')
+        ORDER BY TABLE_NAME, COLUMN_NAME;
+    """,
+    "check_sequence_content": """
+        SELECT
+            table_name,
+            CASE table_name
+                WHEN 'chromosome' THEN 'sequence'
+                WHEN 'gene' THEN 'dna_sequence'
+                ELSE 'cdna_sequence'
+            END as column_name,
+            total_rows,
+            non_null_rows,
+            ROUND(sum_len / NULLIF(non_null_rows, 0), 0) as avg_length,
+            max_len as max_length,
+            min_len as min_length
+        FROM seq_stats
+        ORDER BY table_name;
+    """,
+    "check_sequence_content_full": """
+        SELECT
+            'chromosome' as table_name,
+            'sequence' as column_name,
+            COUNT(*) as total_rows,
+            COUNT(sequence) as non_null_rows,
+            AVG(LENGTH(sequence)) as avg_length,
+            MAX(LENGTH(sequence)) as max_length,
+            MIN(LENGTH(sequence)) as min_length
+        FROM chromosome
+        WHERE sequence IS NOT NULL AND sequence != ''
+        UNION ALL
+        SELECT
+            'gene' as table_name,
+            'dna_sequence' as column_name,
+            COUNT(*) as total_rows,
+            COUNT(dna_sequence) as non_null_rows,
+            AVG(LENGTH(dna_sequence)) as avg_length,
+            MAX(LENGTH(dna_sequence)) as max_length,
+            MIN(LENGTH(dna_sequence)) as min_length
+        FROM gene
+        WHERE dna_sequence IS NOT NULL AND dna_sequence != ''
+        UNION ALL
+        SELECT
+            'transcript' as table_name,
+            'cdna_sequence' as column_name,
+            COUNT(*) as total_rows,
+            COUNT(cdna_sequence) as non_null_rows,
+            AVG(LENGTH(cdna_sequence)) as avg_length,
+            MAX(LENGTH(cdna_sequence)) as max_length,
+            MIN(LENGTH(cdna_sequence)) as min_length
+        FROM transcript
+        WHERE cdna_sequence IS NOT NULL AND cdna_sequence != '';
+    """,
+    "sample_dna_sequences": """
+        WITH probes AS (
+            SELECT FLOOR(RAND() * (SELECT MAX(gene_id) FROM gene)) + 1 AS rid
+            FROM (
+                SELECT 1 UNION ALL SELECT 2 UNION ALL SELECT 3 UNION ALL SELECT 4
+                UNION ALL SELECT 5 UNION ALL SELECT 6 UNION ALL SELECT 7 UNION ALL SELECT 8
+                UNION ALL SELECT 9 UNION ALL SELECT 10 UNION ALL SELECT 11 UNION ALL SELECT 12
+                UNION ALL SELECT 13 UNION ALL SELECT 14 UNION ALL SELECT 15 UNION ALL SELECT 16
+                UNION ALL SELECT 17 UNION ALL SELECT 18 UNION ALL SELECT 19 UNION ALL SELECT 20
+                UNION ALL SELECT 21 UNION ALL SELECT 22 UNION ALL SELECT 23 UNION ALL SELECT 24
+                UNION ALL SELECT 25 UNION ALL SELECT 26 UNION ALL SELECT 27 UNION ALL SELECT 28
+                UNION ALL SELECT 29 UNION ALL SELECT 30 UNION ALL SELECT 31 UNION ALL SELECT 32
+                UNION ALL SELECT 33 UNION ALL SELECT 34 UNION ALL SELECT 35 UNION ALL SELECT 36
+                UNION ALL SELECT 37 UNION ALL SELECT 38 UNION ALL SELECT 39 UNION ALL SELECT 40
+            ) x
+        ),
+        hits AS (
+            SELECT DISTINCT (
+                SELECT MIN(g2.gene_id) FROM gene g2 WHERE g2.gene_id >= p.rid
+            ) AS gene_id
+            FROM probes p
+        )
+        SELECT
+            g.gene_symbol,
+            g.gene_name,
+            s.species_name,
+            LEFT(g.dna_sequence, 100) as sequence_preview,
+            g.dna_len as sequence_length
+        FROM hits h
+        JOIN gene g ON g.gene_id = h.gene_id
+        JOIN species s ON g.species_id = s.species_id
+        WHERE g.dna_sequence IS NOT NULL
+        AND g.dna_len > 50
+        LIMIT 10;
+    """,
+    # Baseline variant: the original ORDER BY RAND() sample, for
+    # installs without the dna_len column from sql/generated_columns.sql
+    "sample_dna_sequences_full": """
+        SELECT
+            g.gene_symbol,
+            g.gene_name,
+            s.species_name,
+            LEFT(g.dna_sequence, 100) as sequence_preview,
+            LENGTH(g.dna_sequence) as sequence_length
+        FROM gene g
+        JOIN species s ON g.species_id = s.species_id
+        WHERE g.dna_sequence IS NOT NULL
+        AND LENGTH(g.dna_sequence) > 50
+        ORDER BY RAND()
+        LIMIT 10;
+    """,
+    "validate_dna_bases": """
+        WITH counted AS (
+            SELECT
+                g.gene_symbol,
+                g.dna_len as length,
+                LENGTH(g.dna_sequence)
+                    - CHAR_LENGTH(REGEXP_REPLACE(UPPER(g.dna_sequence), '[ATCG]+', '')) as valid_bases
+            FROM gene g
+            WHERE g.dna_sequence IS NOT NULL
+            AND g.dna_len > 20
+        )
+        SELECT
+            gene_symbol,
+            length,
+            valid_bases,
+            ROUND(valid_bases / length * 100, 2) as percent_valid
+        FROM counted
+        HAVING percent_valid > 80
+        ORDER BY percent_valid DESC
+        LIMIT 20;
+    """,
+    # Baseline variant: LENGTH() instead of the stored dna_len column
+    "validate_dna_bases_full": """
+        WITH counted AS (
+            SELECT
+                g.gene_symbol,
+                LENGTH(g.dna_sequence) as length,
+                LENGTH(g.dna_sequence)
+                    - CHAR_LENGTH(REGEXP_REPLACE(UPPER(g.dna_sequence), '[ATCG]+', '')) as valid_bases
+            FROM gene g
+            WHERE g.dna_sequence IS NOT NULL
+            AND LENGTH(g.dna_sequence) > 20
+        )
+        SELECT
+            gene_symbol,
+            length,
+            valid_bases,
+            ROUND(valid_bases / length * 100, 2) as percent_valid
+        FROM counted
+        HAVING percent_valid > 80
+        ORDER BY percent_valid DESC
+        LIMIT 20;
+    """,
+}
+
+# Comparative Analysis Queries
+COMPARATIVE_QUERIES = {
+    "species_comparison": """
+        SELECT
+            s1.species_name as species_1,
+            s2.species_name as species_2,
+            o.orthology_type,
+            COUNT(*) as ortholog_count,
+            ROUND(AVG(o.percentage_identity), 2) as avg_identity,
+            ROUND(AVG(o.dn_ds_ratio), 4) as avg_dn_ds
+        FROM ortholog o
+        JOIN gene g1 ON o.gene_a_id = g1.gene_id
+        JOIN gene g2 ON o.gene_b_id = g2.gene_id
+        JOIN species s1 ON g1.species_id = s1.species_id
+        JOIN species s2 ON g2.species_id = s2.species_id
+        WHERE s1.species_id != s2.species_id
+        GROUP BY s1.species_name, s2.species_name, o.orthology_type
+        ORDER BY ortholog_count DESC;
+    """,
+    "cross_species_genes": """
+        SELECT
+            g1.gene_symbol,
+            s1.species_name as species_1,
+            s2.species_name as species_2,
+            o.orthology_type,
+            o.percentage_identity,
+            o.dn_ds_ratio
+        FROM ortholog o
+        JOIN gene g1 ON o.gene_a_id = g1.gene_id
+        JOIN gene g2 ON o.gene_b_id = g2.gene_id
+        JOIN species s1 ON g1.species_id = s1.species_id
+        JOIN species s2 ON g2.species_id = s2.species_id
+        WHERE g1.gene_symbol IS NOT NULL
+        AND o.percentage_identity IS NOT NULL
+        ORDER BY o.percentage_identity DESC
+        LIMIT 30;
+    """,
+}
+
+# Functional Annotation Queries
+ANNOTATION_QUERIES = {
+    "go_term_distribution": """
+        SELECT
+            go.go_namespace,
+            COUNT(DISTINCT gga.gene_id) as annotated_genes,
+            COUNT(*) as total_annotations
+        FROM gene_go_annotation gga
+        JOIN gene_ontology go ON gga.go_num = go.go_num
+        GROUP BY go.go_namespace
+        ORDER BY annotated_genes DESC;
+    """,
+    "top_go_terms": """
+        SELECT
+            go.go_id,
+            go.go_name,
+            go.go_namespace,
+            COUNT(gga.gene_id) as gene_count
+        FROM gene_go_annotation gga
+        JOIN gene_ontology go ON gga.go_num = go.go_num
+        GROUP BY go.go_id, go.go_name, go.go_namespace
+        ORDER BY gene_count DESC
+        LIMIT 20;
+    """,
+    "genes_by_go_term": """
+        SELECT
+            s.species_name,
+            g.gene_symbol,
+            g.gene_name,
+            go.go_name,
+            go.go_namespace,
+            gga.evidence_code
+        FROM gene_go_annotation gga
+        JOIN gene g ON gga.gene_id = g.gene_id
+        JOIN species s ON g.species_id = s.species_id
+        JOIN gene_ontology go ON gga.go_num = go.go_num
+        WHERE go.go_id = %s OR go.go_name LIKE %s
+        ORDER BY s.species_name, g.gene_symbol;
+    """,
+    # *_full variants join on the baseline go_id VARCHAR key for
+    # installs that have not run sql/surrogate_keys.sql
+    "go_term_distribution_full": """
+        SELECT
+            go.go_namespace,
+            COUNT(DISTINCT gga.gene_id) as annotated_genes,
+            COUNT(*) as total_annotations
+        FROM gene_go_annotation gga
+        JOIN gene_ontology go ON gga.go_id = go.go_id
+        GROUP BY go.go_namespace
+        ORDER BY annotated_genes DESC;
+    """,
+    "top_go_terms_full": """
+        SELECT
+            go.go_id,
+            go.go_name,
+            go.go_namespace,
+            COUNT(gga.gene_id) as gene_count
+        FROM gene_go_annotation gga
+        JOIN gene_ontology go ON gga.go_id = go.go_id
+        GROUP BY go.go_id, go.go_name, go.go_namespace
+        ORDER BY gene_count DESC
+        LIMIT 20;
+    """,
+    "genes_by_go_term_full": """
+        SELECT
+            s.species_name,
+            g.gene_symbol,
+            g.gene_name,
+            go.go_name,
+            go.go_namespace,
+            gga.evidence_code
+        FROM gene_go_annotation gga
+        JOIN gene g ON gga.gene_id = g.gene_id
+        JOIN species s ON g.species_id = s.species_id
+        JOIN gene_ontology go ON gga.go_id = go.go_id
+        WHERE go.go_id = %s OR go.go_name LIKE %s
+        ORDER BY s.species_name, g.gene_symbol;
+    """,
+}
+
+# Genomic Variation Queries
+VARIATION_QUERIES = {
+    "variant_types": """
+        SELECT
+            s.species_name,
+            gv.variant_type,
+            COUNT(*) as variant_count,
+            ROUND(AVG(gv.minor_allele_frequency), 4) as avg_maf
+        FROM genetic_variant gv
+        JOIN chromosome c ON gv.chromosome_id = c.chromosome_id
+        JOIN genome_assembly ga ON c.assembly_id = ga.assembly_id
+        JOIN species s ON ga.species_id = s.species_id
+        GROUP BY s.species_name, gv.variant_type
+        ORDER BY s.species_name, variant_count DESC;
+    """,
+    "clinical_variants": """
+        SELECT
+            s.species_name,
+            c.chromosome_name,
+            gv.variant_name,
+            gv.variant_type,
+            gv.clinical_significance,
+            gv.start_position,
+            gv.minor_allele_frequency
+        FROM genetic_variant gv
+        JOIN chromosome c ON gv.chromosome_id = c.chromosome_id
+        JOIN genome_assembly ga ON c.assembly_id = ga.assembly_id
+        JOIN species s ON ga.species_id = s.species_id
+        WHERE gv.clinical_significance IS NOT NULL
+        AND gv.clinical_significance != ''
+        ORDER BY s.species_name, c.chromosome_name, gv.start_position;
+    """,
+}
+
+# Custom Query Templates
+QUERY_TEMPLATES = {
+    "gene_region_search": """
+        SELECT
+            s.species_name,
+            g.gene_symbol,
+            g.gene_name,
+            c.chromosome_name,
+            g.start_position,
+            g.end_position,
+            (g.end_position - g.start_position + 1) as gene_length
+        FROM gene g
+        JOIN species s ON g.species_id = s.species_id
+        LEFT JOIN chromosome c ON g.chromosome_id = c.chromosome_id
+        WHERE c.chromosome_name = %s
+        AND g.start_position >= %s
+        AND g.end_position <= %s
+        ORDER BY g.start_position;
+    """,
+    "protein_length_range": """
+        SELECT
+            s.species_name,
+            g.gene_symbol,
+            g.gene_name,
+            p.protein_stable_id,
+            p.protein_length,
+            p.molecular_weight
+        FROM protein p
+        JOIN transcript t ON p.transcript_id = t.transcript_id
+        JOIN gene g ON t.gene_id = g.gene_id
+        JOIN species s ON g.species_id = s.species_id
+        WHERE p.protein_length BETWEEN %s AND %s
+        ORDER BY p.protein_length DESC;
+    """,
+}
+
+# All query categories grouped together
+ALL_QUERIES = {
+    "Basic Statistics": BASIC_STATS_QUERIES,
+    "Gene Analysis": GENE_QUERIES,
+    "Protein Analysis": PROTEIN_QUERIES,
+    "Sequence Analysis": SEQUENCE_QUERIES,
+    "Comparative Analysis": COMPARATIVE_QUERIES,
+    "Functional Annotation": ANNOTATION_QUERIES,
+    "Genomic Variation": VARIATION_QUERIES,
+    "Custom Templates": QUERY_TEMPLATES,
+}
+
+
+def get_query_categories():
+    """Return list of available query categories"""
+    return list(ALL_QUERIES.keys())
+
+
+def get_queries_in_category(category):
+    """Return all queries in a specific category"""
+    return ALL_QUERIES.get(category, {})
+
+
+def get_query(category, query_name):
+    """Get a specific query by category and name"""
+    category_queries = ALL_QUERIES.get(category, {})
+    return category_queries.get(query_name, "")
+
+
+def get_all_query_names():
+    """Return all query names across all categories"""
+    all_names = []
+    for category, queries in ALL_QUERIES.items():
+        for query_name in queries.keys():
+            all_names.append(f"{category}: {query_name}")
+    return all_names
+
+
+# Reverse index from catalog SQL text to its (category, query_name) key,
+# built lazily on first lookup. The query editor is populated verbatim
+# from get_query, so unedited predefined queries map straight back to
+# their cache key.
+_CATALOG_BY_SQL = None
+
+
+def lookup_catalog_query(sql):
+    """Return (category, query_name) for a catalog SQL text, or None
+
+    Matches on whitespace-stripped text, so queries the user has edited
+    no longer match and take the normal execution path.
+    """
+    global _CATALOG_BY_SQL
+    if _CATALOG_BY_SQL is None:
+        _CATALOG_BY_SQL = {
+            sql_text.strip(): (category, name)
+            for category, queries in ALL_QUERIES.items()
+            for name, sql_text in queries.items()
+        }
+    return _CATALOG_BY_SQL.get((sql or "").strip())
+
+
+# Result cache for catalog queries. The interface is read-mostly, so the
+# same predefined query with the same parameters keeps returning the same
+# DataFrame; a short TTL bounds staleness while an LRU bound caps memory.
+_RESULT_CACHE = OrderedDict()
+_RESULT_CACHE_SIZE = 256
+_RESULT_CACHE_TTL = 60.0  # seconds
+
+
+def _execute_catalog_sql(db, query, params):
+    """Run one catalog SQL text, prepared when it has bind parameters"""
+    if params:
+        return db.execute_prepared_df(query.rstrip().rstrip(";"), tuple(params))
+    return db.execute_query_df(query)
+
+
+def run_cached_query(db, category, query_name, params=()):
+    """Execute a catalog query through the cache, keyed on (category, name, params)
+
+    Returns the cached DataFrame when a fresh entry exists, otherwise runs
+    the query against the given database connection and caches the result.
+    When the primary query fails and a baseline *_full/*_live sibling
+    exists in the catalog, that sibling is run (and cached) in its place.
+    Returns None when the query is unknown or execution fails.
+    """
+    key = (category, query_name, tuple(params))
+    now = time.monotonic()
+    hit = _RESULT_CACHE.get(key)
+    if hit is not None:
+        if now - hit[0] < _RESULT_CACHE_TTL:
+            _RESULT_CACHE.move_to_end(key)
+            return hit[1]
+        del _RESULT_CACHE[key]
+
+    query = get_query(category, query_name)
+    if not query:
+        return None
+
+    result_df = _execute_catalog_sql(db, query, params)
+    if result_df is None and not (
+        query_name.endswith("_full") or query_name.endswith("_live")
+    ):
+        # Rewritten catalog queries lean on the opt-in migrations under
+        # sql/; on an install that has not run them the primary fails
+        # (unknown column or table), so retry the baseline *_full/*_live
+        # sibling before giving up
+        for suffix in ("_full", "_live"):
+            fallback = get_query(category, query_name + suffix)
+            if fallback:
+                result_df = _execute_catalog_sql(db, fallback, params)
+                if result_df is not None:
+                    break
+
+    if result_df is not None:
+        _RESULT_CACHE[key] = (now, result_df)
+        if len(_RESULT_CACHE) > _RESULT_CACHE_SIZE:
+            _RESULT_CACHE.popitem(last=False)
+    return result_df
+
+
+def cache_query_result(category, query_name, result_df, params=()):
+    """Seed the result cache with an externally computed DataFrame
+
+    Lets batched executions (one round-trip for several statements) file
+    each result under the key run_cached_query would use, so later
+    single-query calls hit the cache.
+    """
+    key = (category, query_name, tuple(params))
+    _RESULT_CACHE[key] = (time.monotonic(), result_df)
+    _RESULT_CACHE.move_to_end(key)
+    if len(_RESULT_CACHE) > _RESULT_CACHE_SIZE:
+        _RESULT_CACHE.popitem(last=False)
+
+
+def clear_query_cache():
+    """Drop all cached catalog results (call after writes or a reconnect)"""
+    _RESULT_CACHE.clear()
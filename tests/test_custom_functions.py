@@ -38,13 +38,16 @@ def test_custom_functions():
                 "TTTTCCCCAAAA",  # No ATG
             ]
 
-            for seq in test_sequences:
-                cursor.execute("SELECT classify_sequence(%s) as result", (seq,))
-                result = cursor.fetchone()
-                if result:
-                    print(f"  {seq:15} -> {result['result']}")
-                else:
-                    print(f"  {seq:15} -> No result")
+            # One UNION ALL statement evaluates every test sequence in a
+            # single round-trip instead of one query per sequence
+            classify_query = " UNION ALL ".join(
+                "SELECT %s as seq, classify_sequence(%s) as result"
+                for _ in test_sequences
+            )
+            classify_params = tuple(v for seq in test_sequences for v in (seq, seq))
+            cursor.execute(classify_query, classify_params)
+            for row in cursor.fetchall():
+                print(f"  {row['seq']:15} -> {row['result']}")
 
             # Test 2: count_nucleotides function
             print("\n2. Testing count_nucleotides() function:")
@@ -52,13 +55,16 @@ def test_custom_functions():
 
             test_sequences_count = ["ATCGATCG", "AAATTTCCCGGG", "ATGCGCGCATGC"]
 
-            for seq in test_sequences_count:
-                cursor.execute("SELECT count_nucleotides(%s) as result", (seq,))
-                result = cursor.fetchone()
-                if result:
-                    print(f"  {seq:15} -> {result['result']}")
-                else:
-                    print(f"  {seq:15} -> No result")
+            count_query = " UNION ALL ".join(
+                "SELECT %s as seq, count_nucleotides(%s) as result"
+                for _ in test_sequences_count
+            )
+            count_params = tuple(
+                v for seq in test_sequences_count for v in (seq, seq)
+            )
+            cursor.execute(count_query, count_params)
+            for row in cursor.fetchall():
+                print(f"  {row['seq']:15} -> {row['result']}")
 
             # Test 3: detect_mutations function
             print("\n3. Testing detect_mutations() function:")
@@ -71,24 +77,31 @@ def test_custom_functions():
                 ("AAATTT", "CCCTTT"),  # Multiple mutations at start
             ]
 
-            for seq1, seq2 in test_pairs:
-                cursor.execute(
-                    "SELECT detect_mutations(%s, %s) as result", (seq1, seq2)
-                )
-                result = cursor.fetchone()
-                if result:
-                    print(f"  {seq1} vs {seq2}")
-                    print(f"    -> {result['result']}")
-                else:
-                    print(f"  {seq1} vs {seq2} -> No result")
+            mutation_query = " UNION ALL ".join(
+                "SELECT %s as seq1, %s as seq2, detect_mutations(%s, %s) as result"
+                for _ in test_pairs
+            )
+            mutation_params = tuple(
+                v for seq1, seq2 in test_pairs for v in (seq1, seq2, seq1, seq2)
+            )
+            cursor.execute(mutation_query, mutation_params)
+            for row in cursor.fetchall():
+                print(f"  {row['seq1']} vs {row['seq2']}")
+                print(f"    -> {row['result']}")
 
             # Test 4: Real biocat data examples
             print("\n4. Testing with real biocat data:")
             print("-" * 40)
 
-            # Get some actual DNA sequences from the database
+            # Evaluate the functions in the same SELECT that fetches the
+            # sample rows: one round-trip instead of one query plus two
+            # follow-ups per gene
             cursor.execute("""
-                SELECT gene_symbol, dna_sequence
+                SELECT
+                    gene_symbol,
+                    LEFT(dna_sequence, 30) as seq,
+                    classify_sequence(LEFT(dna_sequence, 30)) as classification,
+                    count_nucleotides(LEFT(dna_sequence, 30)) as nucleotide_counts
                 FROM gene
                 WHERE dna_sequence IS NOT NULL
                 AND LENGTH(dna_sequence) > 20
@@ -99,23 +112,10 @@ def test_custom_functions():
 
             if gene_results:
                 for gene in gene_results:
-                    seq = gene["dna_sequence"][:30]  # Take first 30 characters
-                    symbol = gene["gene_symbol"]
-
-                    # Test classification
-                    cursor.execute("SELECT classify_sequence(%s) as result", (seq,))
-                    class_result = cursor.fetchone()
-
-                    # Test nucleotide count
-                    cursor.execute("SELECT count_nucleotides(%s) as result", (seq,))
-                    count_result = cursor.fetchone()
-
-                    print(f"  Gene: {symbol}")
-                    print(f"    Sequence: {seq}")
-                    if class_result:
-                        print(f"    Classification: {class_result['result']}")
-                    if count_result:
-                        print(f"    Nucleotide counts: {count_result['result']}")
+                    print(f"  Gene: {gene['gene_symbol']}")
+                    print(f"    Sequence: {gene['seq']}")
+                    print(f"    Classification: {gene['classification']}")
+                    print(f"    Nucleotide counts: {gene['nucleotide_counts']}")
                     print()
             else:
                 print("  No DNA sequences found in gene table")